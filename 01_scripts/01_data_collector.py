@@ -27,12 +27,14 @@ Updated: 2025-12-03
 
 import os
 import re
+import sys
 import time
-import requests
+import asyncio
+import threading
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timezone, timedelta
-import pytz
+from concurrent.futures import ThreadPoolExecutor
 
 # 설정 모듈에서 로드
 from config import config
@@ -43,10 +45,48 @@ from collection_logger import log_collection_result
 # Telegram 알림 모듈
 from notifier import send_collection_result as notify_telegram
 
+# 공유 HTTP 세션 (커넥션 풀/keep-alive/재시도 정책)
+from http_session import get_session, get_yfinance_session
+
+# 호스트별 토큰 버킷 / 재시도 백오프
+from rate_limit import get_limiter, backoff_delay, is_rate_limit_error
+
+# 단계별 실행 시간 span (collector_spans)
+from tracing import span, flush_spans
+
+# 호스트별 HTTP 응답 시간/전송량 (http_metrics)
+from http_metrics import timed, flush_http_metrics, print_summary as print_http_summary
+
+# 응답 캐시 (TTL 이내 재조회 생략)
+from response_cache import get_cache
+
+# 소스별 서킷 브레이커 (장애 소스 빠른 실패)
+from circuit_breaker import get_breaker, CIRCUIT_OPEN, summarize as summarize_breakers
+
+# stock.csv append/upsert 저장소
+from stock_store import get_stock_store
+
+# 종목별 최신 일봉 캐시 (5d 재요청 생략)
+from bar_cache import get_bar_cache
+
+# 뉴스 중복 인덱스 (실행 간 기사 중복 저장 방지)
+from news_index import get_news_index
+
+# ECOS 통계표 단위 조회 클라이언트
+from ecos_client import EcosClient
+
+# 거래소 캘린더 (KRX/NYSE 휴장일, 조기 폐장)
+import trading_calendar
+
+# InfluxDB 공용 Writer (커넥션/배치 공유)
+from influx_writer import get_writer, close_writer
+
+# DataFrame → line protocol 일괄 직렬화
+from line_protocol import serialize
+
 # InfluxDB 클라이언트 (선택적 import)
 try:
-    from influxdb_client import InfluxDBClient, Point, WritePrecision
-    from influxdb_client.client.write_api import SYNCHRONOUS
+    import influxdb_client  # noqa: F401
     INFLUXDB_AVAILABLE = True
 except ImportError:
     INFLUXDB_AVAILABLE = False
@@ -74,46 +114,62 @@ def is_kr_ticker(ticker: str) -> bool:
     return ticker.endswith('.KS') or ticker.endswith('.KQ') or ticker.startswith('^K')
 
 
+def get_market(is_kr: bool) -> str:
+    """거래소 코드 (trading_calendar용)"""
+    return "KRX" if is_kr else "NYSE"
+
+
 def get_target_trade_date(is_kr: bool, now_utc: datetime) -> datetime.date:
-    """장 마감 여부에 따라 목표 거래일을 결정 (주말 보정 포함)"""
-    kst = now_utc.astimezone(pytz.timezone('Asia/Seoul'))
-    est = now_utc.astimezone(pytz.timezone('America/New_York'))
-
-    if is_kr:
-        # 한국 장 마감 15:30, 버퍼 10분
-        if kst.time() < datetime.strptime("15:40", "%H:%M").time():
-            target = kst.date() - timedelta(days=1)
-        else:
-            target = kst.date()
-    else:
-        # 미국 장 마감 16:00 ET, 버퍼 10분
-        if est.time() < datetime.strptime("16:10", "%H:%M").time():
-            target = est.date() - timedelta(days=1)
-        else:
-            target = est.date()
+    """장 마감 여부에 따라 목표 거래일을 결정 (휴장일/조기 폐장 포함)"""
+    return trading_calendar.target_session(get_market(is_kr), now_utc)
 
-    # 주말 보정 (휴일 캘린더 없으므로 토/일 → 최근 금요일)
-    while target.weekday() >= 5:  # 5=토,6=일
-        target -= timedelta(days=1)
-    return target
 
+def fetch_history_with_retry(ticker: str, period: str = "5d", max_retries: int = 3, delay: float = None):
+    """
+    일반 용도 히스토리 조회 (경제지표 등에서 사용, delay: 백오프 기본 대기)
 
-def fetch_history_with_retry(ticker: str, period: str = "5d", max_retries: int = 3, delay: float = 2.0):
-    """일반 용도 히스토리 조회 (경제지표 등에서 사용)"""
-    for attempt in range(max_retries):
-        try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period)
-            if not hist.empty:
-                return hist, None
-            if attempt < max_retries - 1:
-                time.sleep(delay)
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(delay)
-            else:
-                return None, str(e)[:80]
-    return None, "no_data_after_retry"
+    CACHE_TTL_DAILY 이내에 받은 같은 (종목, 기간) 히스토리는 응답 캐시에서 반환
+    yahoo 서킷이 open이면 요청 없이 (None, 'circuit_open') 반환
+    """
+    cache = get_cache()
+    cache_key = f"yahoo:history:{ticker}:{period}"
+    hist = cache.get_frame(cache_key, config.CACHE_TTL_DAILY)
+    if hist is not None:
+        return hist, None
+
+    breaker = get_breaker("yahoo")
+    if not breaker.allow():
+        return None, CIRCUIT_OPEN
+
+    limiter = get_limiter("yahoo")
+    error = "no_data_after_retry"
+    # 서킷에는 Yahoo 장애(예외: 타임아웃/429/5xx 등)만 실패로 기록
+    # 빈 응답은 Yahoo가 응답한 것 (상장폐지/티커 변경 등) → 성공으로 기록
+    responded = False
+    try:
+        for attempt in range(max_retries):
+            last_error = None
+            try:
+                limiter.acquire()
+                stock = yf.Ticker(ticker, session=get_yfinance_session())
+                with timed("yahoo") as call:
+                    hist = stock.history(period=period)
+                    call["status"] = 204 if hist.empty else 200
+                responded = True
+                if not hist.empty:
+                    cache.put_frame(cache_key, hist)
+                    error = None
+                    return hist, None
+                error = "no_data_after_retry"
+            except Exception as e:
+                responded = False
+                last_error, error = e, str(e)[:80]
+            if attempt == max_retries - 1 or breaker.is_open:
+                break
+            wait_before_retry("yahoo", attempt, delay, error=last_error)
+        return None, error
+    finally:
+        breaker.record(responded)
 
 
 def clean_html(text):
@@ -123,46 +179,67 @@ def clean_html(text):
     return re.sub(r'<[^>]+>', '', str(text))
 
 
+def wait_before_retry(host: str, attempt: int, base: float = None, error: Exception = None):
+    """
+    재시도 전 대기 (지수 백오프 + jitter)
+
+    요청 제한 오류면 호스트 토큰 버킷 전체를 정지해 다른 스레드도 함께 쉬게 하고,
+    빈 응답/일시 오류면 현재 스레드만 대기한다.
+    """
+    if error is not None and is_rate_limit_error(error):
+        base = config.RETRY_BACKOFF_BASE if base is None else base
+        get_limiter(host).pause(min(config.RETRY_BACKOFF_CAP, base * 2 ** (attempt + 1)))
+    else:
+        time.sleep(backoff_delay(attempt, base))
+
+
+# 호스트별 동시 요청 제한 (워커 수와 무관하게 업스트림 부하 상한 유지)
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def get_host_semaphore(host: str, limit: int) -> threading.BoundedSemaphore:
+    """호스트별 세마포어 반환 (최초 요청 시 limit으로 생성)"""
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(limit)
+        return _host_semaphores[host]
+
+
 # =============================================================================
 # InfluxDB 클라이언트
 # =============================================================================
-def get_influx_client():
-    """InfluxDB 클라이언트 반환"""
-    if not INFLUXDB_AVAILABLE:
-        return None
-    if not config.INFLUXDB_TOKEN:
-        print("경고: INFLUXDB_TOKEN이 설정되지 않았습니다.")
-        return None
-    return InfluxDBClient(
-        url=config.INFLUXDB_URL,
-        token=config.INFLUXDB_TOKEN,
-        org=config.INFLUXDB_ORG
-    )
-
-
 def write_to_influx(points, data_type="data"):
     """
     InfluxDB에 데이터 저장 (공통 함수)
 
+    공유 Writer의 배치 큐에 적재하고, 실제 전송은 배치 단위로 묶어서
+    수행한다 (collect_all 종료 시 flush).
+
     Args:
-        points: Point 객체 리스트
+        points: line protocol 문자열 리스트 (line_protocol.serialize, 시각 정밀도 초)
         data_type: 로그 출력용 데이터 타입명
     """
     if not INFLUXDB_AVAILABLE or not points:
         return
 
-    client = get_influx_client()
-    if not client:
-        return
-
+    task = getattr(_task_context, 'task', None)
     try:
-        write_api = client.write_api(write_options=SYNCHRONOUS)
-        write_api.write(bucket=config.INFLUXDB_BUCKET, record=points)
-        print(f"  InfluxDB {data_type} 저장: {len(points)}건")
+        with span("influx_write"):
+            # 폐기 확인과 큐 적재를 같은 락 안에서 수행
+            # (확인 직후 제한 시간 초과 처리 → close_writer 이후 적재로 Writer가 다시 생기는 경우 방지)
+            with _collection_results_lock:
+                if task in _cancelled_tasks:
+                    print(f"  ⏱️ {task} 제한 시간 초과 후 종료: InfluxDB {data_type} 적재 생략")
+                    return
+                writer = get_writer()
+                if not writer:
+                    print("경고: INFLUXDB_TOKEN이 설정되지 않았습니다.")
+                    return
+                writer.write(points, write_precision="s")
+        print(f"  InfluxDB {data_type} 적재: {len(points)}건 (배치 전송 대기)")
     except Exception as e:
         print(f"  InfluxDB {data_type} 저장 오류: {e}")
-    finally:
-        client.close()
 
 
 # =============================================================================
@@ -174,6 +251,7 @@ def collect_naver_news():
 
     - 키워드: 경제, 부동산, 반도체, 코스피
     - 키워드당 5건씩 수집
+    - 이미 저장된 기사는 제외 (news_index)
     - CSV 파일에 append
     - InfluxDB에 저장
     """
@@ -190,7 +268,7 @@ def collect_naver_news():
     all_news = []
 
     for keyword in config.NEWS_KEYWORDS:
-        url = "https://openapi.naver.com/v1/search/news.json"
+        url = f"{config.NAVER_API_BASE}/v1/search/news.json"
         headers = {
             "X-Naver-Client-Id": config.NAVER_CLIENT_ID,
             "X-Naver-Client-Secret": config.NAVER_CLIENT_SECRET
@@ -198,7 +276,8 @@ def collect_naver_news():
         params = {"query": keyword, "display": 5, "sort": "sim"}
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            with span("fetch", ticker=keyword):
+                response = get_session("naver").get(url, headers=headers, params=params, timeout=10)
 
             if response.status_code == 200:
                 items = response.json().get("items", [])
@@ -234,31 +313,39 @@ def collect_naver_news():
             fail_count += 1
             print(f"  {keyword}: 오류 - {e}")
 
+    # 이미 저장된 기사 제외 (CSV/InfluxDB 중복 방지)
+    news_index = get_news_index()
+    with span("dedupe"):
+        all_news, skipped = news_index.filter_new(all_news)
+    if skipped:
+        print(f"  중복 기사 {skipped}건 건너뜀")
+
+    if task_cancelled("news"):
+        return
+
     # CSV 저장
     if all_news:
-        df = pd.DataFrame(all_news)
-        filepath = f"{config.NEWS_DIR}/news.csv"
-        header = not os.path.exists(filepath)
-        df.to_csv(filepath, mode='a', header=header, index=False, encoding='utf-8-sig')
+        with span("csv_write"):
+            df = pd.DataFrame(all_news)
+            filepath = f"{config.NEWS_DIR}/news.csv"
+            header = not os.path.exists(filepath)
+            df.to_csv(filepath, mode='a', header=header, index=False, encoding='utf-8-sig')
+            news_index.add(all_news)
         print(f"  CSV 저장: {len(all_news)}건")
 
         # InfluxDB 저장
-        points = []
-        for item in all_news:
-            if item.get('status') != 'success':
-                continue
-            try:
-                p = Point("news") \
-                    .tag("keyword", item['keyword']) \
-                    .field("title", clean_html(item.get('title', ''))[:200]) \
-                    .field("description", clean_html(item.get('description', ''))[:500]) \
-                    .field("link", item.get('link', '')[:500]) \
-                    .field("count", 1) \
-                    .time(datetime.now(timezone.utc), WritePrecision.S)
-                points.append(p)
-            except (ValueError, TypeError):
-                continue
-        write_to_influx(points, "뉴스")
+        with span("parse"):
+            frame = pd.DataFrame(
+                [item for item in all_news if item.get('status') == 'success'],
+                columns=['keyword', 'title', 'description', 'link'],
+            ).fillna('')
+            frame['title'] = frame['title'].map(clean_html).str[:200]
+            frame['description'] = frame['description'].map(clean_html).str[:500]
+            frame['link'] = frame['link'].astype(str).str[:500]
+            frame['count'] = 1
+            frame['time'] = datetime.now(timezone.utc)
+            lines, _ = serialize(frame, "news")
+        write_to_influx(lines, "뉴스")
 
     # 수집 로그 저장
     execution_time_ms = int((time.time() - start_time) * 1000)
@@ -271,68 +358,323 @@ def collect_naver_news():
 # =============================================================================
 # 2. 주가 수집 (yfinance)
 # =============================================================================
-def is_market_open_today():
+def is_market_open_today(now_utc: datetime = None):
     """
-    오늘 시장이 열리는 날인지 확인
-    - 토요일/일요일은 휴장
-    - 공휴일은 별도 체크 필요 (현재는 주말만 체크)
+    오늘 시장이 열리는 날인지 확인 (주말 + 거래소 휴장일)
 
     Returns:
-        tuple: (한국장 오픈 여부, 미국장 오픈 여부)
+        tuple: (한국장 오픈 여부, 미국장 오픈 여부) - 각 거래소 현지 날짜 기준
     """
-    from datetime import datetime
-    today = datetime.now()
-    weekday = today.weekday()  # 0=월, 6=일
+    now_utc = now_utc or datetime.now(timezone.utc)
+    kr_open = trading_calendar.is_trading_day("KRX", trading_calendar.local_date("KRX", now_utc))
+    us_open = trading_calendar.is_trading_day("NYSE", trading_calendar.local_date("NYSE", now_utc))
+    return kr_open, us_open
 
-    # 주말 체크 (토=5, 일=6)
-    is_weekend = weekday >= 5
 
-    # 한국은 현재 시간으로, 미국은 전일 기준
-    kr_open = not is_weekend
-    us_open = not is_weekend
+def get_closed_market_info(now_utc: datetime) -> str:
+    """휴장 시장 안내 문구 (예: '한국 휴장(설날)'), 모두 개장이면 빈 문자열"""
+    closed = []
+    for market, exchange in (("한국", "KRX"), ("미국", "NYSE")):
+        reason = trading_calendar.holiday_name(exchange, trading_calendar.local_date(exchange, now_utc))
+        if reason:
+            closed.append(f"{market} 휴장({reason})")
+    return ", ".join(closed)
 
-    return kr_open, us_open
+
+def split_collected(all_tickers: dict, now_utc: datetime) -> tuple:
+    """
+    목표 거래일 일봉이 이미 success로 저장된 종목 분리
+
+    휴장일/주말 실행 시 목표 거래일은 직전 거래일이므로, 이전 실행에서
+    확정 일봉을 받아 둔 종목은 다시 조회하지 않는다.
+
+    Returns:
+        tuple: (조회할 {종목명: 티커}, 건너뛸 {종목명: 티커})
+    """
+    store = get_stock_store()
+    targets = {is_kr: get_target_trade_date(is_kr, now_utc) for is_kr in (True, False)}
+    pending, collected = {}, {}
+    for name, ticker in all_tickers.items():
+        status = store.get_status(targets[is_kr_ticker(ticker)], ticker)
+        (collected if status == 'success' else pending)[name] = ticker
+    return pending, collected
+
+
+def select_target_bar(hist: pd.DataFrame, target_date):
+    """
+    일봉 히스토리에서 목표 거래일 행 선택
+
+    Returns:
+        tuple: (행 Series, 'success' | 'stale')
+            목표일이 없으면 가장 최신 행을 stale로 반환
+    """
+    df = hist.reset_index()
+    df.rename(columns={'Date': 'date'}, inplace=True)
+    df['bar_date'] = pd.to_datetime(df['date']).dt.tz_localize(None).dt.date
+
+    # 타겟 날짜 일치 여부
+    target_rows = df[df['bar_date'] == target_date]
+    if not target_rows.empty:
+        return target_rows.iloc[-1], 'success'
+
+    # 타겟 없음 → 가장 최신 행 반환 (stale)
+    return df.iloc[-1], 'stale'
 
 
-def fetch_stock_bar_with_retry(ticker: str, target_date, max_retries: int = 3, delay: float = 2.0):
-    """목표 거래일의 일봉을 가져오고, 없으면 상태와 함께 반환"""
+def fetch_stock_bar_with_retry(ticker: str, target_date, max_retries: int = 3, delay: float = None):
+    """
+    목표 거래일의 일봉을 가져오고, 없으면 상태와 함께 반환 (delay: 백오프 기본 대기)
+
+    yahoo 서킷이 open이면 요청 없이 (None, 'error', 'circuit_open') 반환
+    """
+    breaker = get_breaker("yahoo")
+    if not breaker.allow():
+        return None, 'error', CIRCUIT_OPEN
+
+    result = (None, 'error', 'interrupted')
+    try:
+        result = _fetch_stock_bar(ticker, target_date, max_retries, delay, breaker)
+        return result
+    finally:
+        # 서킷에는 Yahoo 장애(예외: 타임아웃/429/5xx 등)만 실패로 기록
+        # no_data(빈 응답, 상장폐지/티커 변경 등)와 빈 응답 뒤 재시도 중 서킷 차단은 Yahoo가 응답한 경우
+        breaker.record(result[1] != 'error' or result[2] == CIRCUIT_OPEN)
+
+
+def _fetch_stock_bar(ticker: str, target_date, max_retries: int, delay: float, breaker):
+    """fetch_stock_bar_with_retry 본체 (재시도 도중 서킷이 열리면 중단)"""
+    yahoo_slot = get_host_semaphore("yahoo", config.YAHOO_MAX_CONCURRENCY)
+    limiter = get_limiter("yahoo")
+
     for attempt in range(max_retries):
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=get_yfinance_session())
 
             start = target_date
             end = target_date + timedelta(days=1)
 
-            hist = stock.history(start=start, end=end, interval="1d", auto_adjust=False)
+            # 재시도 대기(sleep) 중에는 슬롯을 점유하지 않도록 요청 구간만 감싼다
+            with yahoo_slot:
+                limiter.acquire()
+                with timed("yahoo") as call:
+                    hist = stock.history(start=start, end=end, interval="1d", auto_adjust=False)
+                    call["status"] = 204 if hist.empty else 200
 
-            # 백업: 최근 5일 조회 후 타겟 날짜 필터
-            if hist.empty:
-                hist = stock.history(period="5d", interval="1d", auto_adjust=False)
+                # 직전 거래일 일봉이 캐시에 있으면 5d 재요청 없이 stale 처리
+                if hist.empty and config.BAR_CACHE_ENABLED:
+                    cached = get_bar_cache().stale_bar(ticker, target_date, get_market(is_kr_ticker(ticker)))
+                    if cached is not None:
+                        return cached, 'stale', None
 
-            if not hist.empty:
-                df = hist.reset_index()
-                df.rename(columns={'Date': 'date'}, inplace=True)
-                df['bar_date'] = pd.to_datetime(df['date']).dt.tz_localize(None).dt.date
-
-                # 타겟 날짜 일치 여부
-                target_rows = df[df['bar_date'] == target_date]
-                if not target_rows.empty:
-                    return target_rows.iloc[-1], 'success', None
+                # 백업: 최근 5일 조회 후 타겟 날짜 필터
+                if hist.empty:
+                    limiter.acquire()
+                    with timed("yahoo") as call:
+                        hist = stock.history(period="5d", interval="1d", auto_adjust=False)
+                        call["status"] = 204 if hist.empty else 200
 
-                # 타겟 없음 → 가장 최신 행 반환 (stale)
-                latest = df.iloc[-1]
-                return latest, 'stale', None
+            if not hist.empty:
+                bar, status = select_target_bar(hist, target_date)
+                return bar, status, None
 
             if attempt < max_retries - 1:
-                time.sleep(delay)
+                if breaker.is_open:
+                    return None, 'error', CIRCUIT_OPEN
+                wait_before_retry("yahoo", attempt, delay)
 
         except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(delay)
+            if attempt < max_retries - 1 and not breaker.is_open:
+                wait_before_retry("yahoo", attempt, delay, error=e)
             else:
                 return None, 'error', str(e)[:80]
 
     return None, 'no_data', 'no_data_after_retry'
+
+
+def build_stock_row(name: str, ticker: str, target_date, bar, status: str, error) -> dict:
+    """fetch_stock_bar_with_retry 결과를 stock.csv 행 형식으로 변환"""
+    if bar is not None and status in ('success', 'stale'):
+        return {
+            "timestamp": get_timestamp(),
+            "bar_date": target_date if status == 'success' else bar['bar_date'],
+            "name": name,
+            "ticker": ticker,
+            "open": float(bar['Open']),
+            "high": float(bar['High']),
+            "low": float(bar['Low']),
+            "close": float(bar['Close']),
+            "adj_close": float(bar.get('Adj Close', bar['Close'])),
+            "volume": int(bar['Volume']),
+            "status": status
+        }
+
+    return {
+        "timestamp": get_timestamp(),
+        "bar_date": target_date,
+        "name": name,
+        "ticker": ticker,
+        "open": "N/A",
+        "high": "N/A",
+        "low": "N/A",
+        "close": "N/A",
+        "adj_close": "N/A",
+        "volume": "N/A",
+        "status": f"error: {error or 'no_data'}"
+    }
+
+
+def fetch_stock_rows(all_tickers: dict, now_utc: datetime, workers: int = 1) -> list:
+    """
+    종목별 일봉 조회 후 stock.csv 행 리스트 반환
+
+    workers > 1이면 스레드 풀로 병렬 조회한다. 각 워커는 행만 반환하고
+    집계는 호출 스레드에서 수행하므로 별도의 공유 상태가 없다.
+    결과 순서는 all_tickers 순서를 유지한다.
+
+    Args:
+        all_tickers: {종목명: 티커} 딕셔너리
+        now_utc: 기준 시각 (UTC)
+        workers: 동시 조회 워커 수 (1이면 순차)
+    """
+    def fetch_one(item):
+        name, ticker = item
+        target_date = get_target_trade_date(is_kr_ticker(ticker), now_utc)
+        with span("fetch", source="stock", ticker=ticker):
+            bar, status, error = fetch_stock_bar_with_retry(ticker, target_date, max_retries=3)
+        return build_stock_row(name, ticker, target_date, bar, status, error)
+
+    items = list(all_tickers.items())
+    if not items:
+        return []
+    if workers <= 1:
+        return [fetch_one(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items)),
+                            thread_name_prefix="stock") as executor:
+        return list(executor.map(fetch_one, items))
+
+
+# 일괄 다운로드로 받은 원자재 히스토리 (collect_bok_data에서 재사용)
+_bulk_history = {}
+_bulk_history_lock = threading.Lock()
+
+# 일괄 다운로드 진행 중이면 clear 상태 (병렬 수집 시 경제지표 단계가 대기)
+_bulk_history_ready = threading.Event()
+_bulk_history_ready.set()
+
+
+def get_bulk_history(ticker: str):
+    """일괄 다운로드 결과에 포함된 종목 히스토리 반환 (없으면 None)"""
+    with _bulk_history_lock:
+        return _bulk_history.get(ticker)
+
+
+def download_daily_bars(tickers: list, start, end) -> dict:
+    """
+    yf.download 한 번으로 여러 종목의 일봉 조회
+
+    Returns:
+        dict: {티커: 일봉 DataFrame} (데이터가 없는 종목은 제외)
+    """
+    if not tickers:
+        return {}
+
+    with get_host_semaphore("yahoo", config.YAHOO_MAX_CONCURRENCY):
+        # yf.download는 내부에서 종목별 요청을 한꺼번에 보냄 → 버킷에 몫만 차감
+        get_limiter("yahoo").charge(len(tickers))
+        with timed("yahoo"):
+            data = yf.download(
+                tickers, start=start, end=end, interval="1d",
+                group_by="ticker", auto_adjust=False, progress=False, threads=True,
+                session=get_yfinance_session()
+            )
+
+    if data is None or data.empty:
+        return {}
+
+    # 단일 종목이면 컬럼이 MultiIndex가 아닐 수 있음
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({tickers[0]: data}, axis=1)
+
+    available = set(data.columns.get_level_values(0))
+    frames = {}
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        hist = data[ticker].dropna(subset=['Close'])
+        if hist.empty:
+            continue
+        if 'Volume' in hist.columns:
+            hist = hist.assign(Volume=hist['Volume'].fillna(0))
+        frames[ticker] = hist
+    return frames
+
+
+def fetch_stock_rows_bulk(all_tickers: dict, now_utc: datetime) -> dict:
+    """
+    시장별 일괄 다운로드로 stock.csv 행 생성
+
+    한국/미국 종목을 각각 한 번의 다중 종목 요청으로 받고, 시장별 목표
+    거래일(get_target_trade_date)에 맞는 행을 고른다. 원자재 티커는 미국
+    요청에 함께 포함해 _bulk_history에 보관한다.
+
+    Returns:
+        dict: {티커: 행} (일괄 결과에 없는 종목은 제외 → 호출측에서 개별 조회)
+    """
+    markets = {
+        True: ("한국", [(n, t) for n, t in all_tickers.items() if is_kr_ticker(t)]),
+        False: ("미국", [(n, t) for n, t in all_tickers.items() if not is_kr_ticker(t)]),
+    }
+    commodity_tickers = list(config.COMMODITY_TICKERS.values())
+
+    with _bulk_history_lock:
+        _bulk_history.clear()
+
+    rows = {}
+    # 미국 다운로드 실패 시에도 대기 중인 경제지표 단계가 풀리도록 보장
+    try:
+        _fetch_market_bulk(markets, commodity_tickers, now_utc, rows)
+    finally:
+        _bulk_history_ready.set()
+    return rows
+
+
+def _fetch_market_bulk(markets: dict, commodity_tickers: list, now_utc: datetime, rows: dict):
+    """fetch_stock_rows_bulk 본체: 시장별 다운로드 결과를 rows에 채움"""
+    for is_kr, (market, pairs) in markets.items():
+        target_date = get_target_trade_date(is_kr, now_utc)
+        start = target_date - timedelta(days=config.STOCK_BULK_WINDOW_DAYS)
+        end = target_date + timedelta(days=1)
+
+        tickers = [t for _, t in pairs]
+        if not is_kr:
+            tickers += [t for t in commodity_tickers if t not in tickers]
+        if not tickers:
+            continue
+
+        try:
+            with span("bulk_fetch", source="stock", ticker="KR" if is_kr else "US"):
+                frames = download_daily_bars(tickers, start, end)
+        except Exception as e:
+            print(f"  {market} 일괄 다운로드 오류: {str(e)[:80]}")
+            continue
+
+        with _bulk_history_lock:
+            for ticker in commodity_tickers:
+                if ticker in frames:
+                    _bulk_history[ticker] = frames[ticker]
+        if not is_kr:
+            _bulk_history_ready.set()
+
+        with span("parse", source="stock"):
+            for name, ticker in pairs:
+                hist = frames.get(ticker)
+                if hist is None:
+                    continue
+                bar, status = select_target_bar(hist, target_date)
+                rows[ticker] = build_stock_row(name, ticker, target_date, bar, status, None)
+
+        print(f"  {market} 일괄 다운로드: {len(pairs)}종목 중 {sum(t in rows for _, t in pairs)}건")
 
 
 def collect_stock_data():
@@ -341,7 +683,6 @@ def collect_stock_data():
     start_time = time.time()
 
     all_tickers = {**config.KR_TICKERS, **config.US_TICKERS}
-    stock_rows = []
     success_count = 0
     fail_count = 0
     stale_count = 0
@@ -349,98 +690,76 @@ def collect_stock_data():
 
     now_utc = datetime.now(timezone.utc)
 
-    for name, ticker in all_tickers.items():
-        is_kr = is_kr_ticker(ticker)
-        target_date = get_target_trade_date(is_kr, now_utc)
+    market_info = get_closed_market_info(now_utc)
+    if market_info:
+        print(f"  📌 {market_info}")
+
+    # 목표 거래일 일봉이 이미 확정 저장된 종목은 조회 생략 (휴장일/주말 재실행)
+    all_tickers, collected = split_collected(all_tickers, now_utc)
+    if collected:
+        print(f"  목표 거래일 수집 완료 {len(collected)}종목 건너뜀")
+    success_count += len(collected)
+
+    workers = config.STOCK_FETCH_WORKERS
 
-        bar, status, error = fetch_stock_bar_with_retry(
-            ticker, target_date, max_retries=3, delay=2.0
-        )
-
-        if bar is not None and status == 'success':
-            stock_rows.append({
-                "timestamp": get_timestamp(),
-                "bar_date": target_date,
-                "name": name,
-                "ticker": ticker,
-                "open": float(bar['Open']),
-                "high": float(bar['High']),
-                "low": float(bar['Low']),
-                "close": float(bar['Close']),
-                "adj_close": float(bar.get('Adj Close', bar['Close'])),
-                "volume": int(bar['Volume']),
-                "status": "success"
-            })
+    if config.STOCK_BULK_DOWNLOAD:
+        bulk_rows = fetch_stock_rows_bulk(all_tickers, now_utc)
+        pending = {n: t for n, t in all_tickers.items() if t not in bulk_rows}
+        if pending:
+            print(f"  일괄 결과 누락 {len(pending)}종목 → 종목별 조회")
+        fallback_rows = {
+            row['ticker']: row for row in fetch_stock_rows(pending, now_utc, workers=workers)
+        }
+        stock_rows = [bulk_rows.get(t) or fallback_rows[t] for t in all_tickers.values()]
+    else:
+        if workers > 1:
+            print(f"  병렬 조회: 워커 {workers}개 (Yahoo 동시 요청 {config.YAHOO_MAX_CONCURRENCY}개)")
+        stock_rows = fetch_stock_rows(all_tickers, now_utc, workers=workers)
+
+    for row in stock_rows:
+        if row['status'] == 'success':
             success_count += 1
-        elif bar is not None and status == 'stale':
-            stock_rows.append({
-                "timestamp": get_timestamp(),
-                "bar_date": bar['bar_date'],
-                "name": name,
-                "ticker": ticker,
-                "open": float(bar['Open']),
-                "high": float(bar['High']),
-                "low": float(bar['Low']),
-                "close": float(bar['Close']),
-                "adj_close": float(bar.get('Adj Close', bar['Close'])),
-                "volume": int(bar['Volume']),
-                "status": "stale"
-            })
+        elif row['status'] == 'stale':
             stale_count += 1
         else:
             fail_count += 1
-            failed_tickers.append(f"{name}({ticker})")
-            stock_rows.append({
-                "timestamp": get_timestamp(),
-                "bar_date": target_date,
-                "name": name,
-                "ticker": ticker,
-                "open": "N/A",
-                "high": "N/A",
-                "low": "N/A",
-                "close": "N/A",
-                "adj_close": "N/A",
-                "volume": "N/A",
-                "status": f"error: {error or 'no_data'}"
-            })
-
-    total = len(all_tickers)
+            failed_tickers.append(f"{row['name']}({row['ticker']})")
+
+    total = len(all_tickers) + len(collected)
     print(f"  수집 완료: {success_count}/{total} 성공, {stale_count} 지연, {fail_count} 실패")
 
-    # CSV 저장 (bar_date + ticker 키 중복 제거 후 append)
+    if task_cancelled("stock"):
+        return
+
+    # CSV 저장 (bar_date + ticker 키 upsert: append 후 주기적 compaction)
     if stock_rows:
-        df_new = pd.DataFrame(stock_rows)
-        filepath = f"{config.STOCK_DIR}/stock.csv"
-        if os.path.exists(filepath):
-            df_old = pd.read_csv(filepath)
-            df = pd.concat([df_old, df_new], ignore_index=True)
-            df.drop_duplicates(subset=["bar_date", "ticker"], keep="last", inplace=True)
-        else:
-            df = df_new
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
-        print(f"  CSV 저장/갱신: {len(df_new)}건 (중복 제거 후 총 {len(df)}행)")
+        store = get_stock_store()
+        with span("csv_write"):
+            result = store.upsert(stock_rows)
+        print(f"  CSV 저장/갱신: {len(stock_rows)}건 (신규 {result['new']}, 갱신 {result['updated']}, "
+              f"총 {result['keys']}키)")
+        if store.needs_compaction():
+            store.compact_in_background()
+
+        # 종목별 최신 일봉 캐시 갱신 (다음 실행의 5d 재요청 생략 + 당일 일봉 대기 종목 확인)
+        bar_cache = get_bar_cache()
+        bar_cache.update_from_rows(stock_rows)
+        bar_cache.save()
+        waiting = bar_cache.waiting({
+            row['ticker']: get_target_trade_date(is_kr_ticker(row['ticker']), now_utc) for row in stock_rows
+        })
+        if waiting:
+            print(f"  당일 일봉 대기: {len(waiting)}종목 ({', '.join(t for t, _ in waiting[:10])}"
+                  f"{' 외' if len(waiting) > 10 else ''})")
 
         # InfluxDB 저장 (성공+stale 모두 기록, status 필드 포함)
-        points = []
-        for item in stock_rows:
-            if item.get('status') in ('success', 'stale'):
-                try:
-                    dt = datetime.combine(item['bar_date'], datetime.min.time()).replace(tzinfo=timezone.utc)
-                    p = Point("stock_prices") \
-                        .tag("name", item['name']) \
-                        .tag("ticker", item['ticker']) \
-                        .field("open", float(item['open'])) \
-                        .field("high", float(item['high'])) \
-                        .field("low", float(item['low'])) \
-                        .field("close", float(item['close'])) \
-                        .field("adj_close", float(item['adj_close'])) \
-                        .field("volume", int(item['volume'])) \
-                        .field("status_code", 1 if item['status'] == 'success' else 0) \
-                        .time(dt, WritePrecision.S)
-                    points.append(p)
-                except (ValueError, TypeError):
-                    continue
-        write_to_influx(points, "주가")
+        with span("parse"):
+            frame = pd.DataFrame([item for item in stock_rows if item.get('status') in ('success', 'stale')])
+            lines = []
+            if not frame.empty:
+                frame['status_code'] = (frame['status'] == 'success').astype(int)
+                lines, _ = serialize(frame, "stock_prices", time_col="bar_date")
+        write_to_influx(lines, "주가")
 
     # 로그/알림
     execution_time_ms = int((time.time() - start_time) * 1000)
@@ -454,6 +773,8 @@ def collect_stock_data():
 
     if stale_count > 0:
         _collection_results['market_info'] = '일봉 게시 지연 발생'
+    elif market_info:
+        _collection_results['market_info'] = market_info
 
 
 # =============================================================================
@@ -495,103 +816,100 @@ def collect_bok_data():
     this_month = today.strftime('%Y%m')
 
     # 수집할 지표 정의 (기간을 넓혀서 조회)
-    # (API경로, 지표명, 주기)
+    # (지표명, 통계표, 항목코드, 주기, 시작, 종료)
+    # 같은 통계표/주기/기간의 지표는 ECOS 1회 요청으로 묶어서 조회
     indicators = [
-        (f"731Y001/D/{seven_days_ago}/{today_str}/0000001", "원/달러 환율", "D"),
-        (f"731Y001/D/{seven_days_ago}/{today_str}/0000002", "원/엔 환율", "D"),
-        (f"731Y001/D/{seven_days_ago}/{today_str}/0000003", "원/유로 환율", "D"),
-        (f"722Y001/M/{three_months_ago}/{this_month}/0101000", "기준금리", "M"),
-        (f"722Y001/D/{seven_days_ago}/{today_str}/0101000", "콜금리", "D"),
+        ("원/달러 환율", "731Y001", "0000001", "D", seven_days_ago, today_str),
+        ("원/엔 환율", "731Y001", "0000002", "D", seven_days_ago, today_str),
+        ("원/유로 환율", "731Y001", "0000003", "D", seven_days_ago, today_str),
+        ("기준금리", "722Y001", "0101000", "M", three_months_ago, this_month),
+        ("콜금리", "722Y001", "0101000", "D", seven_days_ago, today_str),
     ]
 
-    for api_path, indicator_name, period in indicators:
-        # 최근 10건 조회 (기간 내 가장 최신 데이터 사용)
-        url = f"https://ecos.bok.or.kr/api/StatisticSearch/{config.BOK_API_KEY}/json/kr/1/10/{api_path}"
+    ecos = EcosClient(config.BOK_API_KEY, timeout=10)
+    try:
+        with span("fetch", source="ecos"):
+            ecos_results = ecos.fetch_indicators(indicators)
+        print(f"  ECOS 요청: {ecos.requests_made}회, 캐시 적중 {ecos.cache_hits}회 (지표 {len(indicators)}개)")
+    except Exception as e:
+        ecos_results = {name: ([], f"error: {str(e)[:50]}") for name, *_ in indicators}
 
-        try:
-            response = requests.get(url, timeout=10)
+    for indicator_name, _, _, period, _, _ in indicators:
+        rows, error = ecos_results[indicator_name]
 
-            if response.status_code == 200:
-                data = response.json()
+        if error:
+            bok_data.append({
+                "timestamp": get_timestamp(),
+                "indicator": indicator_name,
+                "value": "N/A", "date": today_str,
+                "status": error
+            })
+            fail_count += 1
+            failed_indicators.append(indicator_name)
+            print(f"  {indicator_name}: API 오류 ({error})")
 
-                if "StatisticSearch" in data and "row" in data["StatisticSearch"]:
-                    rows = data["StatisticSearch"]["row"]
-                    # 가장 최근 데이터 사용 (마지막 row)
-                    row = rows[-1]
-                    data_date = row["TIME"]
+        elif rows:
+            # 가장 최근 데이터 사용 (마지막 row)
+            row = rows[-1]
+            data_date = row["TIME"]
 
-                    # 오늘 날짜와 비교하여 지연 여부 확인
-                    is_delayed = False
-                    if period == "D":
-                        is_delayed = (data_date != today_str)
-                    elif period == "M":
-                        is_delayed = (data_date != this_month)
+            # 오늘 날짜와 비교하여 지연 여부 확인
+            is_delayed = False
+            if period == "D":
+                is_delayed = (data_date != today_str)
+            elif period == "M":
+                is_delayed = (data_date != this_month)
 
-                    status = "success_delayed" if is_delayed else "success"
+            status = "success_delayed" if is_delayed else "success"
 
-                    bok_data.append({
-                        "timestamp": get_timestamp(),
-                        "indicator": indicator_name,
-                        "value": row["DATA_VALUE"],
-                        "date": data_date,
-                        "status": status
-                    })
-                    success_count += 1
-
-                    # 날짜 포맷팅 (출력용)
-                    if len(data_date) == 8:  # YYYYMMDD
-                        display_date = f"{data_date[4:6]}/{data_date[6:8]}"
-                    else:  # YYYYMM
-                        display_date = f"{data_date[4:6]}월"
-
-                    if is_delayed:
-                        delayed_count += 1
-                        delayed_indicators.append(f"{indicator_name}({display_date})")
-                        print(f"  {indicator_name}: {row['DATA_VALUE']} (📅 {display_date} 기준)")
-                    else:
-                        print(f"  {indicator_name}: {row['DATA_VALUE']}")
-                else:
-                    # 기간 내 데이터 없음 = 실패
-                    bok_data.append({
-                        "timestamp": get_timestamp(),
-                        "indicator": indicator_name,
-                        "value": "N/A", "date": today_str,
-                        "status": "no_data"
-                    })
-                    fail_count += 1
-                    failed_indicators.append(indicator_name)
-                    print(f"  {indicator_name}: 데이터 없음")
+            bok_data.append({
+                "timestamp": get_timestamp(),
+                "indicator": indicator_name,
+                "value": row["DATA_VALUE"],
+                "date": data_date,
+                "status": status
+            })
+            success_count += 1
+
+            # 날짜 포맷팅 (출력용)
+            if len(data_date) == 8:  # YYYYMMDD
+                display_date = f"{data_date[4:6]}/{data_date[6:8]}"
+            else:  # YYYYMM
+                display_date = f"{data_date[4:6]}월"
+
+            if is_delayed:
+                delayed_count += 1
+                delayed_indicators.append(f"{indicator_name}({display_date})")
+                print(f"  {indicator_name}: {row['DATA_VALUE']} (📅 {display_date} 기준)")
             else:
-                bok_data.append({
-                    "timestamp": get_timestamp(),
-                    "indicator": indicator_name,
-                    "value": "N/A", "date": today_str,
-                    "status": f"error_code_{response.status_code}"
-                })
-                fail_count += 1
-                failed_indicators.append(indicator_name)
-                print(f"  {indicator_name}: API 오류 ({response.status_code})")
+                print(f"  {indicator_name}: {row['DATA_VALUE']}")
 
-        except Exception as e:
+        else:
+            # 기간 내 데이터 없음 = 실패
             bok_data.append({
                 "timestamp": get_timestamp(),
                 "indicator": indicator_name,
                 "value": "N/A", "date": today_str,
-                "status": f"error: {str(e)[:50]}"
+                "status": "no_data"
             })
             fail_count += 1
             failed_indicators.append(indicator_name)
-            print(f"  {indicator_name}: 오류 - {e}")
+            print(f"  {indicator_name}: 데이터 없음")
 
     # yfinance로 원자재 데이터 수집 (WTI 유가, 금 선물)
-    commodity_tickers = {
-        "WTI 유가": "CL=F",
-        "금 선물": "GC=F"
-    }
+    # 주가 일괄 다운로드에 포함되어 있으면 재사용, 없으면 개별 조회
+    commodity_tickers = config.COMMODITY_TICKERS
+    with span("wait_bulk"):
+        bulk_ready = _bulk_history_ready.wait(timeout=config.COMMODITY_BULK_WAIT_SEC)
+    if not bulk_ready:
+        print("  원자재: 주가 일괄 다운로드 대기 시간 초과 → 개별 조회")
 
     for commodity_name, ticker in commodity_tickers.items():
         try:
-            hist, error = fetch_history_with_retry(ticker, max_retries=2, delay=1.0)
+            hist, error = get_bulk_history(ticker), None
+            if hist is None:
+                with span("fetch", source="yahoo", ticker=ticker):
+                    hist, error = fetch_history_with_retry(ticker, max_retries=2, delay=1.0)
 
             if hist is not None and not hist.empty:
                 # 가장 최근 데이터 사용
@@ -645,40 +963,33 @@ def collect_bok_data():
     # 총 지표 수 업데이트 (ECOS + yfinance)
     total_indicators = len(indicators) + len(commodity_tickers)
 
+    if task_cancelled("economy"):
+        return
+
     # CSV 저장
     if bok_data:
-        df = pd.DataFrame(bok_data)
-        filepath = f"{config.ECONOMY_DIR}/economy.csv"
-        header = not os.path.exists(filepath)
-        df.to_csv(filepath, mode='a', header=header, index=False, encoding='utf-8-sig')
+        with span("csv_write"):
+            df = pd.DataFrame(bok_data)
+            filepath = f"{config.ECONOMY_DIR}/economy.csv"
+            header = not os.path.exists(filepath)
+            df.to_csv(filepath, mode='a', header=header, index=False, encoding='utf-8-sig')
         print(f"  CSV 저장: {len(bok_data)}건")
 
         # InfluxDB 저장
-        points = []
-        for item in bok_data:
+        with span("parse"):
             # success 또는 success_delayed 모두 저장
-            if not item.get('status', '').startswith('success'):
-                continue
-            try:
-                date_str = str(item['date'])
-                if len(date_str) == 8:  # YYYYMMDD
-                    dt = datetime.strptime(date_str, '%Y%m%d').replace(hour=12, tzinfo=timezone.utc)
-                    period_tag = "daily"
-                elif len(date_str) == 6:  # YYYYMM
-                    dt = datetime.strptime(date_str + '01', '%Y%m%d').replace(hour=12, tzinfo=timezone.utc)
-                    period_tag = "monthly"
-                else:
-                    continue
-
-                p = Point("economic_indicators") \
-                    .tag("indicator", item['indicator']) \
-                    .tag("period", period_tag) \
-                    .field("value", float(item['value'])) \
-                    .time(dt, WritePrecision.S)
-                points.append(p)
-            except (ValueError, TypeError):
-                continue
-        write_to_influx(points, "경제지표")
+            frame = pd.DataFrame(
+                [item for item in bok_data if item.get('status', '').startswith('success')],
+                columns=['indicator', 'value', 'date'],
+            )
+            date_str = frame['date'].astype(str)
+            # YYYYMMDD → daily, YYYYMM → monthly (그 외 형식은 제외), 시각은 12:00 UTC
+            frame['period'] = date_str.str.len().map({8: "daily", 6: "monthly"})
+            frame['time'] = pd.to_datetime(
+                date_str.where(date_str.str.len() == 8, date_str + '01'), format='%Y%m%d', errors='coerce'
+            ) + pd.Timedelta(hours=12)
+            lines, _ = serialize(frame[frame['period'].notna()], "economic_indicators")
+        write_to_influx(lines, "경제지표")
 
     # 결과 출력
     print(f"  수집 완료: {success_count}/{total_indicators}개 지표")
@@ -703,7 +1014,8 @@ def collect_bok_data():
 # 메인 실행
 # =============================================================================
 
-# 수집 결과를 저장할 전역 변수 (각 함수에서 업데이트)
+# 수집 결과를 저장할 전역 변수 (각 함수에서 업데이트, 병렬 수집 시 락으로 보호)
+_collection_results_lock = threading.Lock()
 _collection_results = {
     'news': {'success': 0, 'fail': 0, 'no_data': 0, 'time_ms': 0},
     'stock': {'success': 0, 'fail': 0, 'no_data': 0, 'time_ms': 0},
@@ -716,10 +1028,32 @@ _collection_results = {
     'market_info': ''
 }
 
+# 제한 시간을 넘겨 결과를 폐기한 작업 (_collection_results_lock으로 보호)
+_cancelled_tasks = set()
+# 실행기 스레드가 맡은 작업명 (_run_source에서 설정)
+_task_context = threading.local()
+
+
+def task_cancelled(task: str = None) -> bool:
+    """
+    작업이 제한 시간 초과로 폐기되었는지 확인
+
+    Args:
+        task: 작업명 (생략 시 현재 스레드가 실행 중인 작업)
+    """
+    task = task or getattr(_task_context, 'task', None)
+    if task is None:
+        return False
+    with _collection_results_lock:
+        cancelled = task in _cancelled_tasks
+    if cancelled:
+        print(f"  ⏱️ {task} 제한 시간 초과 후 종료: 결과 폐기 (CSV/InfluxDB 저장 생략)")
+    return cancelled
+
 
 def update_collection_result(task: str, success: int, fail: int, time_ms: int,
                              no_data: int = 0, errors: list = None, failed_items: list = None,
-                             delayed_items: list = None):
+                             delayed_items: list = None, cancel: bool = False):
     """
     수집 결과 업데이트 (Telegram 알림용)
 
@@ -732,23 +1066,116 @@ def update_collection_result(task: str, success: int, fail: int, time_ms: int,
         errors: 에러 메시지 리스트
         delayed_items: 과거 데이터 사용 지표 리스트 (날짜 포함)
         failed_items: 실패한 항목 이름 리스트
+        cancel: True면 이 결과를 최종으로 두고 이후 같은 작업의 결과는 무시 (제한 시간 초과)
     """
     global _collection_results
-    _collection_results[task] = {
-        'success': success,
-        'fail': fail,
-        'no_data': no_data,
-        'time_ms': time_ms
-    }
-    # 실제 에러가 있을 때만 has_error 설정 (휴장/과거데이터는 제외)
-    if fail > 0:
-        _collection_results['has_error'] = True
-    if errors:
-        _collection_results['errors'].extend(errors[:3])
-    if failed_items:
-        _collection_results['failed_items'].extend(failed_items[:5])
-    if delayed_items:
-        _collection_results['delayed_items'].extend(delayed_items[:7])
+    with _collection_results_lock:
+        if task in _cancelled_tasks:
+            return
+        if cancel:
+            _cancelled_tasks.add(task)
+        _collection_results[task] = {
+            'success': success,
+            'fail': fail,
+            'no_data': no_data,
+            'time_ms': time_ms
+        }
+        # 실제 에러가 있을 때만 has_error 설정 (휴장/과거데이터는 제외)
+        if fail > 0:
+            _collection_results['has_error'] = True
+        if errors:
+            _collection_results['errors'].extend(errors[:3])
+        if failed_items:
+            _collection_results['failed_items'].extend(failed_items[:5])
+        if delayed_items:
+            _collection_results['delayed_items'].extend(delayed_items[:7])
+
+
+# =============================================================================
+# 병렬 수집 엔진 (asyncio + 스레드 실행기 브리지)
+# =============================================================================
+async def _run_source(executor, task: str, func, timeout: float):
+    """
+    수집 함수 하나를 실행기 스레드에서 실행하고 제한 시간을 적용
+
+    제한 시간을 넘기면 해당 작업을 실패로 기록하고 폐기 표시한다. 스레드는 강제
+    종료할 수 없으므로, 늦게 끝난 작업은 저장 단계 직전(task_cancelled)에 멈추고
+    CSV/InfluxDB 저장과 결과 기록을 하지 않는다 (알림 발송/Writer 종료 후 적재 방지).
+    남은 스레드는 __main__에서 collect_all 종료 후 os._exit로 버린다.
+    """
+    def run():
+        _task_context.task = task
+        try:
+            func()
+        finally:
+            _task_context.task = None
+
+    loop = asyncio.get_running_loop()
+    start = time.time()
+    try:
+        await asyncio.wait_for(loop.run_in_executor(executor, run), timeout=timeout)
+    except asyncio.TimeoutError:
+        elapsed_ms = int((time.time() - start) * 1000)
+        print(f"\n  ⏱️ {task} 제한 시간 초과 ({timeout:g}초)")
+        log_collection_result(task, 0, 1, elapsed_ms)
+        update_collection_result(task, 0, 1, elapsed_ms,
+                                 errors=[f"{task}: timeout {timeout:g}s"],
+                                 failed_items=[f"{task}(timeout)"], cancel=True)
+    except Exception as e:
+        elapsed_ms = int((time.time() - start) * 1000)
+        print(f"\n  ❌ {task} 오류: {e}")
+        log_collection_result(task, 0, 1, elapsed_ms)
+        update_collection_result(task, 0, 1, elapsed_ms, errors=[f"{task}: {str(e)[:50]}"])
+
+
+def traced(task: str, func):
+    """수집 함수를 최상위 span(collect)으로 감싼 함수 반환"""
+    def run():
+        with span("collect", source=task):
+            func()
+    return run
+
+
+async def _run_sources(sources: list):
+    """소스별 작업을 동시에 실행 (소스마다 실행기 스레드 1개)"""
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="collect")
+    try:
+        await asyncio.gather(*(
+            _run_source(executor, task, func, timeout) for task, func, timeout in sources
+        ))
+    finally:
+        # 제한 시간을 넘긴 스레드를 기다리지 않음
+        executor.shutdown(wait=False)
+
+
+def run_collection_engine():
+    """
+    뉴스/주가/경제지표 수집을 병렬 실행
+
+    세 소스는 서로 다른 API(Naver, Yahoo, ECOS)를 사용하므로 동시에 실행하고,
+    각 소스의 내부 동시성 상한(STOCK_FETCH_WORKERS 등)은 그대로 유지한다.
+    전체 소요 시간은 가장 느린 소스에 수렴한다.
+    """
+    def collect_stock_and_release():
+        try:
+            collect_stock_data()
+        finally:
+            _bulk_history_ready.set()
+
+    sources = [
+        ("news", traced("news", collect_naver_news), config.COLLECT_TIMEOUT_NEWS),
+        ("stock", traced("stock", collect_stock_and_release), config.COLLECT_TIMEOUT_STOCK),
+        ("economy", traced("economy", collect_bok_data), config.COLLECT_TIMEOUT_ECONOMY),
+    ]
+
+    # 경제지표 단계가 원자재 시세를 일괄 다운로드 결과에서 가져가도록 대기 상태로 전환
+    if config.STOCK_BULK_DOWNLOAD:
+        _bulk_history_ready.clear()
+
+    try:
+        asyncio.run(_run_sources(sources))
+    finally:
+        _bulk_history_ready.set()
 
 
 def collect_all():
@@ -767,6 +1194,8 @@ def collect_all():
         'failed_items': [],
         'market_info': ''
     }
+    with _collection_results_lock:
+        _cancelled_tasks.clear()
 
     print("=" * 60)
     print(f"데이터 수집 시작: {get_timestamp()}")
@@ -774,9 +1203,12 @@ def collect_all():
 
     total_start = time.time()
 
-    collect_naver_news()
-    collect_stock_data()
-    collect_bok_data()
+    if config.COLLECT_MODE == 'async':
+        run_collection_engine()
+    else:
+        traced("news", collect_naver_news)()
+        traced("stock", collect_stock_data)()
+        traced("economy", collect_bok_data)()
 
     # 전체 수집 로그 저장
     total_execution_ms = int((time.time() - total_start) * 1000)
@@ -793,6 +1225,47 @@ def collect_all():
     print("\n[Telegram 알림]")
     notify_telegram(_collection_results)
 
+    # 모니터링 지표 적재 (Telegram 요청까지 포함되도록 알림 후 수행)
+    # - collector_spans: 단계별 소요 시간 / http_metrics: 호스트별 응답 시간
+    span_summary = flush_spans()
+    http_summary = flush_http_metrics()
+
+    # InfluxDB 배치 flush (이번 실행의 포인트를 한꺼번에 전송, Writer는 실행당 1회만 종료)
+    # - 종료 후 get_writer()를 다시 부르면 Writer가 새로 생기므로 모든 적재가 끝난 뒤 호출
+    # - 전송은 알림 이후에 끝나므로 적재 실패는 Telegram 대신 출력으로만 확인
+    write_stats = close_writer()
+    if write_stats:
+        print(f"\n[InfluxDB] {write_stats['written']}/{write_stats['queued']}건 전송 "
+              f"({write_stats['requests']}회 요청)")
+        if write_stats['raw_bytes']:
+            saved = (1 - write_stats['wire_bytes'] / write_stats['raw_bytes']) * 100
+            print(f"  전송량: {write_stats['raw_bytes'] / 1024:.1f}KB → "
+                  f"{write_stats['wire_bytes'] / 1024:.1f}KB (gzip -{saved:.1f}%)")
+        if write_stats['failed'] > 0:
+            print(f"  ⚠️ InfluxDB 적재 실패 {write_stats['failed']}건: {'; '.join(write_stats['errors'])}")
+
+    if span_summary:
+        print("\n[단계별 소요 시간 (상위 8개)]")
+        for item in span_summary[:8]:
+            print(f"  {item['source']}/{item['stage']}: 합계 {item['total_ms']:.0f}ms "
+                  f"({item['count']}회, 최대 {item['max_ms']:.0f}ms)")
+    print_http_summary(http_summary)
+
+    breakers = summarize_breakers()
+    if breakers:
+        print("\n[서킷 브레이커]")
+        for item in breakers:
+            print(f"  {item['name']}: {item['state']} (빠른 실패 {item['rejected']}건)")
+
 
 if __name__ == "__main__":
     collect_all()
+
+    # 제한 시간을 넘긴 작업 스레드가 남아 있으면 기다리지 않고 종료
+    # - 인터프리터 종료 시 concurrent.futures가 (종목 조회 풀 포함) 워커 스레드를 모두 join하므로
+    #   멈춘 요청이 풀릴 때까지 프로세스가 남아 다음 cron 실행과 겹침
+    # - 결과 알림/InfluxDB 전송은 collect_all에서 이미 끝났고, 폐기된 작업은 저장하지 않음
+    if _cancelled_tasks:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
@@ -14,13 +14,15 @@ from datetime import datetime
 import pandas as pd
 import warnings
 import argparse
-import time
 warnings.filterwarnings('ignore')
 
 # ===========================
 # 설정 (config.py에서 로드)
 # ===========================
 from config import config
+from rate_limit import get_limiter
+from http_metrics import timed, flush_http_metrics, print_summary as print_http_summary
+from http_session import get_yfinance_session
 
 BASE_DIR = config.BASE_DIR
 ARCHIVE_DIR = config.ARCHIVE_DIR
@@ -178,7 +180,10 @@ def collect_us_stock(ticker, name, start_date, end_date):
 
         print(f"  수집 중: {name} ({ticker})", end=" ... ")
 
-        df = yf.download(ticker, start=start_date, end=end_date, progress=False)
+        get_limiter("yahoo").acquire()
+        with timed("yahoo"):
+            df = yf.download(ticker, start=start_date, end=end_date, progress=False,
+                             session=get_yfinance_session())
 
         if df is None or len(df) == 0:
             print(f"❌ 데이터 없음")
@@ -223,6 +228,7 @@ def collect_fred_indicators(start_date, end_date):
 
         print("\n[FRED 경제지표 수집]")
         fred = Fred(api_key=config.FRED_API_KEY)
+        fred.root_url = config.FRED_API_BASE
 
         all_data = []
 
@@ -230,7 +236,9 @@ def collect_fred_indicators(start_date, end_date):
             try:
                 print(f"  수집 중: {name} ({series_id})", end=" ... ")
 
-                series = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
+                get_limiter("fred").acquire()
+                with timed("fred"):
+                    series = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
 
                 if series is None or len(series) == 0:
                     print(f"❌ 데이터 없음")
@@ -246,8 +254,6 @@ def collect_fred_indicators(start_date, end_date):
                 all_data.append(df)
                 print(f"✅ {len(df)}건")
 
-                time.sleep(0.1)  # API 레이트 리밋 방지
-
             except Exception as e:
                 print(f"❌ 오류: {e}")
                 continue
@@ -267,52 +273,47 @@ def collect_fred_indicators(start_date, end_date):
 def collect_ecos_indicators(start_date, end_date):
     """
     한국은행 ECOS API로 한국 경제지표 수집
+
+    같은 통계표/주기의 지표는 EcosClient가 1회 요청(+페이지 순회)으로 묶어서 조회
     """
     try:
-        import requests
+        from ecos_client import EcosClient
 
         print("\n[ECOS 경제지표 수집]")
 
         all_data = []
+        ecos_requests = []
 
         for (stat_code, item_code, cycle), name in ECOS_INDICATORS.items():
+            # 날짜 형식 변환 (cycle에 따라 다름)
+            start_str = start_date.replace('-', '')
+            end_str = end_date.replace('-', '')
+
+            if cycle == 'M':  # 월별: YYYYMM
+                start_str = start_str[:6]  # YYYYMM
+                end_str = end_str[:6]
+            elif cycle == 'Q':  # 분기: YYYYQQ
+                start_str = start_str[:4] + 'Q1'
+                end_str = end_str[:4] + 'Q4'
+            # D(일별)은 YYYYMMDD 그대로 사용
+
+            ecos_requests.append((name, stat_code, item_code, cycle, start_str, end_str))
+
+        client = EcosClient(config.BOK_API_KEY)
+        results = client.fetch_indicators(ecos_requests)
+
+        for name, stat_code, item_code, cycle, _, _ in ecos_requests:
             try:
                 print(f"  수집 중: {name} ({stat_code}/{item_code})", end=" ... ")
 
-                # 날짜 형식 변환 (cycle에 따라 다름)
-                start_str = start_date.replace('-', '')
-                end_str = end_date.replace('-', '')
-
-                if cycle == 'M':  # 월별: YYYYMM
-                    start_str = start_str[:6]  # YYYYMM
-                    end_str = end_str[:6]
-                elif cycle == 'Q':  # 분기: YYYYQQ
-                    start_str = start_str[:4] + 'Q1'
-                    end_str = end_str[:4] + 'Q4'
-                # D(일별)은 YYYYMMDD 그대로 사용
-
-                # ECOS API URL
-                ecos_key = config.BOK_API_KEY
-                if item_code:
-                    url = (
-                        f"https://ecos.bok.or.kr/api/StatisticSearch/{ecos_key}"
-                        f"/json/kr/1/100000/{stat_code}/{cycle}/{start_str}/{end_str}/{item_code}"
-                    )
-                else:
-                    url = (
-                        f"https://ecos.bok.or.kr/api/StatisticSearch/{ecos_key}"
-                        f"/json/kr/1/100000/{stat_code}/{cycle}/{start_str}/{end_str}"
-                    )
-
-                response = requests.get(url, timeout=30)
-                data = response.json()
-
-                if 'StatisticSearch' not in data or 'row' not in data['StatisticSearch']:
+                rows, error = results[name]
+                if error:
+                    print(f"❌ 오류: {error}")
+                    continue
+                if not rows:
                     print(f"❌ 데이터 없음")
                     continue
 
-                rows = data['StatisticSearch']['row']
-
                 # 데이터 프레임 생성
                 dates = []
                 values = []
@@ -343,12 +344,12 @@ def collect_ecos_indicators(start_date, end_date):
                 all_data.append(df)
                 print(f"✅ {len(df)}건")
 
-                time.sleep(0.2)  # API 부하 방지
-
             except Exception as e:
                 print(f"❌ 오류: {e}")
                 continue
 
+        print(f"  ECOS 요청: {client.requests_made}회 (지표 {len(ecos_requests)}개)")
+
         if len(all_data) == 0:
             return None
 
@@ -378,7 +379,6 @@ def main(start_date, end_date, output_suffix):
         df = collect_kr_stock(ticker, name, start_date, end_date)
         if df is not None:
             kr_stocks.append(df)
-        time.sleep(0.2)  # API 부하 방지
 
     if len(kr_stocks) > 0:
         kr_df = pd.concat(kr_stocks, ignore_index=True)
@@ -397,7 +397,6 @@ def main(start_date, end_date, output_suffix):
         df = collect_us_stock(ticker, name, start_date, end_date)
         if df is not None:
             us_stocks.append(df)
-        time.sleep(0.2)  # API 부하 방지
 
     if len(us_stocks) > 0:
         us_df = pd.concat(us_stocks, ignore_index=True)
@@ -452,6 +451,9 @@ def main(start_date, end_date, output_suffix):
 
     print(f"  총 레코드: {total_records:,}건")
     print(f"  저장 위치: {ARCHIVE_DIR}/")
+
+    # 호스트별 응답 시간 (InfluxDB http_metrics 적재 + 출력)
+    print_http_summary(flush_http_metrics())
     print()
 
 # ===========================
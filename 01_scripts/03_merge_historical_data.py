@@ -2,15 +2,22 @@
 # -*- coding: utf-8 -*-
 """
 15년 히스토리 데이터 병합 스크립트
-- 3개 기간(2010-2014, 2015-2019, 2020-2025)을 하나의 파일로 병합
-- 중복 제거 및 정렬
+- 기간별(2010-2014, 2015-2019, 2020-2025 ...) 파일을 하나로 병합
+- 기간마다 archive의 최신 버전(_vN) 파일을 자동 선택
+- 파일을 통째로 올리지 않고 (종목, 날짜) 순 스트리밍 k-way 병합 + 중복 제거(뒤 기간 우선)
+  → 메모리는 종목 1개 × 기간 수 분량, 기간/종목이 늘어도 선형 시간
+- merge_dataset()/main()은 벤치마크(benchmarks/)에서 import해서 재사용
 """
 
-import pandas as pd
+import csv
+import heapq
+import io
 import os
-from datetime import datetime
+import re
 from pathlib import Path
 
+import pandas as pd
+
 # ===========================
 # 설정
 # ===========================
@@ -18,232 +25,279 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 ARCHIVE_DIR = BASE_DIR / "00_data_raw" / "archive"
 OUTPUT_DIR = BASE_DIR / "00_data_raw"
 
-print("=" * 80)
-print("15년 히스토리 데이터 병합")
-print("=" * 80)
-
-# ===========================
-# 1. 한국 주가 병합
-# ===========================
-print("\n[1/3] 한국 주가 병합")
-print("-" * 80)
+# 기간 파일명: {접두사}_{시작연도}_{끝연도}[_v{버전}].csv (버전 없으면 v1)
+PERIOD_FILE = r"^{prefix}_(\d{{4}})_(\d{{4}})(?:_v(\d+))?\.csv$"
 
-kr_files = [
-    ARCHIVE_DIR / "stock_kr_2010_2014_v3.csv",
-    ARCHIVE_DIR / "stock_kr_2015_2019_v3.csv",
-    ARCHIVE_DIR / "stock_kr_2020_2025_v3.csv"
-]
+# 날짜가 이미 YYYY-MM-DD면 변환 생략
+ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-kr_dfs = []
-for file in kr_files:
-    if os.path.exists(file):
-        df = pd.read_csv(file, encoding='utf-8-sig')
-        print(f"  읽기: {file.name} ({len(df):,}건)")
-        kr_dfs.append(df)
-    else:
-        print(f"  ⚠️  파일 없음: {file}")
-
-if len(kr_dfs) > 0:
-    kr_merged = pd.concat(kr_dfs, ignore_index=True)
-
-    # 날짜 변환
-    kr_merged['date'] = pd.to_datetime(kr_merged['date'])
-
-    # 중복 제거 (같은 날짜, 같은 종목)
-    before_count = len(kr_merged)
-    kr_merged = kr_merged.drop_duplicates(subset=['date', 'ticker'], keep='last')
-    after_count = len(kr_merged)
-
-    # 정렬 (날짜, 종목)
-    kr_merged = kr_merged.sort_values(['ticker', 'date']).reset_index(drop=True)
-
-    # 저장
-    kr_output = OUTPUT_DIR / "stock_kr_2010_2025.csv"
-    kr_merged.to_csv(kr_output, index=False, encoding='utf-8-sig')
-
-    print(f"\n✅ 한국 주가 병합 완료")
-    print(f"   - 원본: {before_count:,}건")
-    print(f"   - 중복 제거: {before_count - after_count:,}건")
-    print(f"   - 최종: {after_count:,}건")
-    print(f"   - 저장: {kr_output}")
-    print(f"   - 기간: {kr_merged['date'].min()} ~ {kr_merged['date'].max()}")
-    print(f"   - 종목 수: {kr_merged['ticker'].nunique()}개")
-else:
-    print("❌ 한국 주가 파일을 찾을 수 없습니다")
+# 빈 정렬 키 값 대신 쓰는 값 (어떤 문자열보다 뒤 → pandas sort_values의 NaN 위치와 같음)
+MISSING_LAST = "\U0010ffff"
 
-# ===========================
-# 2. 미국 주가 병합
-# ===========================
-print("\n[2/3] 미국 주가 병합")
-print("-" * 80)
+# 병합 결과를 파일에 쓰는 단위 (행)
+WRITE_ROWS = 10000
 
-us_files = [
-    ARCHIVE_DIR / "stock_us_2010_2014_v3.csv",
-    ARCHIVE_DIR / "stock_us_2015_2019_v3.csv",
-    ARCHIVE_DIR / "stock_us_2020_2025_v3.csv"
+# 병합 대상: (라벨, 파일 접두사, 중복 키, 정렬 키, 개수 컬럼, 개수 단위)
+# - 정렬 키의 첫 컬럼(종목/지표) 단위로 파일을 읽으므로 중복 키는 같은 종목/지표 안에서 판단
+DATASETS = [
+    ("한국 주가", "stock_kr", ["date", "ticker"], ["ticker", "date"], "ticker", "종목"),
+    ("미국 주가", "stock_us", ["date", "ticker"], ["ticker", "date"], "ticker", "종목"),
+    ("FRED 경제지표", "economy_fred", ["date", "series_id"], ["series_id", "date"], "series_id", "지표"),
+    # ECOS는 같은 통계표 안에서 지표명으로 구분 (날짜 + 지표명으로 중복 판단)
+    ("ECOS 경제지표", "economy_ecos", ["date", "indicator"], ["series_id", "date"], "series_id", "지표"),
 ]
 
-us_dfs = []
-for file in us_files:
-    if os.path.exists(file):
-        df = pd.read_csv(file, encoding='utf-8-sig')
-        print(f"  읽기: {file.name} ({len(df):,}건)")
-        us_dfs.append(df)
-    else:
-        print(f"  ⚠️  파일 없음: {file}")
-
-if len(us_dfs) > 0:
-    us_merged = pd.concat(us_dfs, ignore_index=True)
-
-    # 날짜 변환
-    us_merged['date'] = pd.to_datetime(us_merged['date'])
-
-    # 중복 제거
-    before_count = len(us_merged)
-    us_merged = us_merged.drop_duplicates(subset=['date', 'ticker'], keep='last')
-    after_count = len(us_merged)
-
-    # 정렬
-    us_merged = us_merged.sort_values(['ticker', 'date']).reset_index(drop=True)
-
-    # 저장
-    us_output = OUTPUT_DIR / "stock_us_2010_2025.csv"
-    us_merged.to_csv(us_output, index=False, encoding='utf-8-sig')
-
-    print(f"\n✅ 미국 주가 병합 완료")
-    print(f"   - 원본: {before_count:,}건")
-    print(f"   - 중복 제거: {before_count - after_count:,}건")
-    print(f"   - 최종: {after_count:,}건")
-    print(f"   - 저장: {us_output}")
-    print(f"   - 기간: {us_merged['date'].min()} ~ {us_merged['date'].max()}")
-    print(f"   - 종목 수: {us_merged['ticker'].nunique()}개")
-else:
-    print("❌ 미국 주가 파일을 찾을 수 없습니다")
-
-# ===========================
-# 3. FRED 경제지표 병합
-# ===========================
-print("\n[3/4] FRED 경제지표 병합")
-print("-" * 80)
 
-fred_files = [
-    ARCHIVE_DIR / "economy_fred_2010_2014_v3.csv",
-    ARCHIVE_DIR / "economy_fred_2015_2019_v3.csv",
-    ARCHIVE_DIR / "economy_fred_2020_2025_v3.csv"
-]
-
-fred_dfs = []
-for file in fred_files:
-    if os.path.exists(file):
-        df = pd.read_csv(file, encoding='utf-8-sig')
-        print(f"  읽기: {file.name} ({len(df):,}건)")
-        fred_dfs.append(df)
-    else:
-        print(f"  ⚠️  파일 없음: {file}")
-
-if len(fred_dfs) > 0:
-    fred_merged = pd.concat(fred_dfs, ignore_index=True)
-
-    # 날짜 변환
-    fred_merged['date'] = pd.to_datetime(fred_merged['date'])
-
-    # 중복 제거
-    before_count = len(fred_merged)
-    fred_merged = fred_merged.drop_duplicates(subset=['date', 'series_id'], keep='last')
-    after_count = len(fred_merged)
-
-    # 정렬
-    fred_merged = fred_merged.sort_values(['series_id', 'date']).reset_index(drop=True)
-
-    # 저장
-    fred_output = OUTPUT_DIR / "economy_fred_2010_2025.csv"
-    fred_merged.to_csv(fred_output, index=False, encoding='utf-8-sig')
-
-    print(f"\n✅ FRED 경제지표 병합 완료")
-    print(f"   - 원본: {before_count:,}건")
-    print(f"   - 중복 제거: {before_count - after_count:,}건")
-    print(f"   - 최종: {after_count:,}건")
-    print(f"   - 저장: {fred_output}")
-    print(f"   - 기간: {fred_merged['date'].min()} ~ {fred_merged['date'].max()}")
-    print(f"   - 지표 수: {fred_merged['series_id'].nunique()}개")
-else:
-    print("❌ FRED 경제지표 파일을 찾을 수 없습니다")
-
-# ===========================
-# 4. ECOS 경제지표 병합
-# ===========================
-print("\n[4/4] ECOS 경제지표 병합")
-print("-" * 80)
-
-ecos_files = [
-    ARCHIVE_DIR / "economy_ecos_2010_2014_v3.csv",
-    ARCHIVE_DIR / "economy_ecos_2015_2019_v3.csv",
-    ARCHIVE_DIR / "economy_ecos_2020_2025_v3.csv"
-]
-
-ecos_dfs = []
-for file in ecos_files:
-    if os.path.exists(file):
-        df = pd.read_csv(file, encoding='utf-8-sig')
-        print(f"  읽기: {file.name} ({len(df):,}건)")
-        ecos_dfs.append(df)
-    else:
-        print(f"  ⚠️  파일 없음: {file}")
-
-if len(ecos_dfs) > 0:
-    ecos_merged = pd.concat(ecos_dfs, ignore_index=True)
-
-    # 날짜 변환 (에러 처리)
-    ecos_merged['date'] = pd.to_datetime(ecos_merged['date'], errors='coerce')
-
-    # 중복 제거 (날짜 + 지표명으로 중복 판단)
-    before_count = len(ecos_merged)
-    ecos_merged = ecos_merged.drop_duplicates(subset=['date', 'indicator'], keep='last')
-    after_count = len(ecos_merged)
-
-    # 정렬
-    ecos_merged = ecos_merged.sort_values(['series_id', 'date']).reset_index(drop=True)
-
-    # 저장
-    ecos_output = OUTPUT_DIR / "economy_ecos_2010_2025.csv"
-    ecos_merged.to_csv(ecos_output, index=False, encoding='utf-8-sig')
-
-    print(f"\n✅ ECOS 경제지표 병합 완료")
-    print(f"   - 원본: {before_count:,}건")
-    print(f"   - 중복 제거: {before_count - after_count:,}건")
-    print(f"   - 최종: {after_count:,}건")
-    print(f"   - 저장: {ecos_output}")
-    print(f"   - 기간: {ecos_merged['date'].min()} ~ {ecos_merged['date'].max()}")
-    print(f"   - 지표 수: {ecos_merged['series_id'].nunique()}개")
-else:
-    print("❌ ECOS 경제지표 파일을 찾을 수 없습니다")
-
-# ===========================
-# 최종 요약
-# ===========================
-print("\n" + "=" * 80)
-print("병합 완료!")
-print("=" * 80)
-
-total_records = 0
-if len(kr_dfs) > 0:
-    print(f"  한국 주가: {after_count:,}건 (종목 {kr_merged['ticker'].nunique()}개)")
-    total_records += len(kr_merged)
-
-if len(us_dfs) > 0:
-    print(f"  미국 주가: {len(us_merged):,}건 (종목 {us_merged['ticker'].nunique()}개)")
-    total_records += len(us_merged)
-
-if len(fred_dfs) > 0:
-    print(f"  FRED 경제지표: {len(fred_merged):,}건 (지표 {fred_merged['series_id'].nunique()}개)")
-    total_records += len(fred_merged)
-
-if len(ecos_dfs) > 0:
-    print(f"  ECOS 경제지표: {len(ecos_merged):,}건 (지표 {ecos_merged['series_id'].nunique()}개)")
-    total_records += len(ecos_merged)
-
-print(f"  총 레코드: {total_records:,}건")
-print(f"  저장 위치: {OUTPUT_DIR}/")
-print()
-print("다음 단계: InfluxDB 백필")
-print()
+def discover_period_files(prefix, archive_dir=ARCHIVE_DIR):
+    """
+    기간별 최신 버전 파일 탐색 (test 등 기간 형식이 아닌 파일은 제외)
+
+    Returns:
+        list: [(기간, 버전, Path), ...] (기간 순)
+    """
+    pattern = re.compile(PERIOD_FILE.format(prefix=re.escape(prefix)))
+    latest = {}
+    for path in Path(archive_dir).glob(f"{prefix}_*.csv"):
+        match = pattern.match(path.name)
+        if not match:
+            continue
+        period = f"{match[1]}_{match[2]}"
+        version = int(match[3] or 1)
+        if period not in latest or version > latest[period][0]:
+            latest[period] = (version, path)
+    return [(period, version, path) for period, (version, path) in sorted(latest.items())]
+
+
+def _parse_line(line: bytes) -> list:
+    """CSV 한 줄 파싱 (따옴표가 없으면 split으로 빠르게)"""
+    text = line.decode("utf-8")
+    if '"' not in text:
+        return text.rstrip("\r\n").split(",")
+    return next(csv.reader([text]), [])
+
+
+def _index_blocks(path, group_col):
+    """
+    파일을 한 번 훑어 종목/지표별 연속 행 블록의 위치 수집
+
+    기간 파일은 종목(지표)별로 행이 모여 있고 종목 순서는 수집 순서 그대로라,
+    블록 위치만 기억해 두면 종목 순으로 다시 읽을 수 있음 (메모리는 블록 수만큼)
+
+    Returns:
+        tuple: (헤더 컬럼 리스트, {종목: [[시작 offset, 끝 offset, 첫 행 번호], ...]}, 데이터 행 수)
+    """
+    blocks = {}
+    rows = 0
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]))
+        column = header.index(group_col)
+        offset = f.tell()
+        current = None
+        for line in iter(f.readline, b""):
+            values = _parse_line(line) if line.strip() else []
+            if values:
+                value = values[column] if column < len(values) else ""
+                if value != current:
+                    blocks.setdefault(value, []).append([offset, offset, rows])
+                    current = value
+                blocks[value][-1][1] = offset + len(line)
+                rows += 1
+            offset += len(line)
+    return header, blocks, rows
+
+
+def _normalize_dates(values: list) -> list:
+    """날짜를 YYYY-MM-DD로 통일 (변환 실패는 '')"""
+    if all(ISO_DATE.match(v) for v in values):
+        return values
+    dates = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce")
+    return dates.dt.strftime("%Y-%m-%d").fillna("").tolist()
+
+
+def _sort_key(values: list, positions: list) -> tuple:
+    """정렬 키 (빈 값은 뒤로 - pandas sort_values의 NaN 위치와 같음)"""
+    return tuple(values[p] or MISSING_LAST for p in positions)
+
+
+def _sorted_rows(path, file_index, columns, sort_keys):
+    """
+    기간 파일 1개를 정렬 키 순서로 스트리밍
+
+    - 종목(지표) 블록을 종목 순으로 읽어 블록 안에서만 정렬 (이미 날짜순이면 선형)
+    - 메모리는 종목 1개 × 기간 1개 분량
+
+    Yields:
+        tuple: (정렬 키, 파일 번호, 행 번호, columns 순서 값 리스트)
+    """
+    header, blocks, _ = _index_blocks(path, sort_keys[0])
+    source = None if header == columns else [header.index(c) if c in header else None for c in columns]
+    date_pos = columns.index("date")
+    key_positions = [columns.index(c) for c in sort_keys]
+
+    with open(path, "rb") as f:
+        for group in sorted(blocks, key=lambda value: value or MISSING_LAST):
+            rows = []
+            for start, end, first_row in blocks[group]:
+                f.seek(start)
+                text = f.read(end - start).decode("utf-8")
+                records = (values for values in csv.reader(io.StringIO(text)) if values)
+                for row_no, values in enumerate(records, first_row):
+                    if source is not None:
+                        values = [values[p] if p is not None and p < len(values) else "" for p in source]
+                    elif len(values) < len(columns):
+                        values += [""] * (len(columns) - len(values))
+                    rows.append((row_no, values))
+
+            dates = _normalize_dates([values[date_pos] for _, values in rows])
+            for (_, values), date in zip(rows, dates):
+                values[date_pos] = date
+
+            keyed = [(_sort_key(values, key_positions), file_index, row_no, values) for row_no, values in rows]
+            keyed.sort(key=lambda item: item[0])  # 안정 정렬 → 같은 키는 원래 행 순서 유지
+            yield from keyed
+
+
+def _keep_last(group: list, positions: list) -> list:
+    """같은 중복 키 중 마지막 행만 남김 (나머지 행 순서 유지)"""
+    last = {tuple(values[p] for p in positions): i for i, values in enumerate(group)}
+    keep = set(last.values())
+    return [values for i, values in enumerate(group) if i in keep]
+
+
+def merge_dataset(label, prefix, dedupe_keys, sort_keys, count_col, count_unit,
+                  archive_dir=ARCHIVE_DIR, output_dir=OUTPUT_DIR):
+    """
+    기간별 최신 버전 파일을 k-way 병합해 하나로 저장
+
+    - 각 파일을 정렬 키 순으로 스트리밍 → heapq.merge로 병합 (전체 O(N log k))
+    - 같은 정렬 키 묶음 안에서 중복 키는 마지막 행(뒤 기간 파일, 파일 안에서는 뒤 행)만 유지
+    - 결과는 기존(pd.concat → drop_duplicates(keep='last') → sort_values)과 같은 행/순서
+    - 값은 원본 문자열 그대로 기록 (date만 YYYY-MM-DD로 통일)
+
+    Returns:
+        dict: 병합 요약 (rows, source_rows, duplicates, count, start, end, output)
+            파일이 하나도 없으면 None
+    """
+    files = discover_period_files(prefix, archive_dir)
+    if not files:
+        print(f"❌ {label} 파일을 찾을 수 없습니다")
+        return None
+
+    # 출력 컬럼: 파일 순서대로 처음 나온 컬럼 순 (pd.concat과 같음)
+    columns = []
+    for _, version, path in files:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            header = next(csv.reader([f.readline()]))
+        columns += [c for c in header if c not in columns]
+        print(f"  읽기: {path.name} (v{version})")
+
+    dedupe_positions = [columns.index(c) for c in dedupe_keys]
+    date_pos = columns.index("date")
+    count_pos = columns.index(count_col)
+    # 개수 컬럼이 정렬 키면 같은 키 묶음의 첫 행만 보면 됨
+    count_in_key = count_col in sort_keys
+
+    streams = [_sorted_rows(path, i, columns, sort_keys) for i, (_, _, path) in enumerate(files)]
+
+    output = Path(output_dir) / f"{prefix}_2010_2025.csv"
+    tmp_output = output.with_name(output.name + ".tmp")
+    source_rows = merged_rows = 0
+    first_date = last_date = None
+    names = set()
+
+    def flush_group(group):
+        nonlocal merged_rows, first_date, last_date
+        rows = _keep_last(group, dedupe_positions) if len(group) > 1 else group
+        merged_rows += len(rows)
+        pending.extend(rows)
+
+        date = rows[0][date_pos]
+        if date:
+            first_date = date if first_date is None else min(first_date, date)
+            last_date = date if last_date is None else max(last_date, date)
+        if count_in_key:
+            names.add(rows[0][count_pos])
+        else:
+            names.update(values[count_pos] for values in rows)
+
+    with open(tmp_output, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(columns)
+        pending = []
+        group, group_key = [], None
+        for key, _, _, values in heapq.merge(*streams):
+            source_rows += 1
+            if key != group_key and group:
+                flush_group(group)
+                group = []
+                if len(pending) >= WRITE_ROWS:
+                    writer.writerows(pending)
+                    pending.clear()
+            group_key = key
+            group.append(values)
+        if group:
+            flush_group(group)
+        writer.writerows(pending)
+    os.replace(tmp_output, output)
+    names.discard("")
+
+    print(f"\n✅ {label} 병합 완료")
+    print(f"   - 원본: {source_rows:,}건")
+    print(f"   - 중복 제거: {source_rows - merged_rows:,}건")
+    print(f"   - 최종: {merged_rows:,}건")
+    print(f"   - 저장: {output}")
+    print(f"   - 기간: {first_date} ~ {last_date}")
+    print(f"   - {count_unit} 수: {len(names)}개")
+    return {
+        "rows": merged_rows,
+        "source_rows": source_rows,
+        "duplicates": source_rows - merged_rows,
+        "count": len(names),
+        "start": first_date,
+        "end": last_date,
+        "output": str(output),
+    }
+
+
+def main(archive_dir=ARCHIVE_DIR, output_dir=OUTPUT_DIR):
+    """
+    4개 데이터셋 병합
+
+    Returns:
+        dict: {라벨: merge_dataset 요약 또는 None}
+    """
+    print("=" * 80)
+    print("15년 히스토리 데이터 병합")
+    print("=" * 80)
+
+    results = {}
+    for i, (label, prefix, dedupe_keys, sort_keys, count_col, count_unit) in enumerate(DATASETS, 1):
+        print(f"\n[{i}/{len(DATASETS)}] {label} 병합")
+        print("-" * 80)
+        results[label] = merge_dataset(label, prefix, dedupe_keys, sort_keys, count_col, count_unit,
+                                       archive_dir=archive_dir, output_dir=output_dir)
+
+    # ===========================
+    # 최종 요약
+    # ===========================
+    print("\n" + "=" * 80)
+    print("병합 완료!")
+    print("=" * 80)
+
+    total_records = 0
+    for label, _, _, _, _, count_unit in DATASETS:
+        summary = results[label]
+        if summary is not None:
+            print(f"  {label}: {summary['rows']:,}건 ({count_unit} {summary['count']}개)")
+            total_records += summary["rows"]
+
+    print(f"  총 레코드: {total_records:,}건")
+    print(f"  저장 위치: {output_dir}/")
+    print()
+    print("다음 단계: InfluxDB 백필")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,26 @@
 """
 15년 히스토리 데이터 InfluxDB 백필 스크립트
 - 병합된 CSV 파일을 InfluxDB에 적재
+- CSV를 청크 단위로 스트리밍 (읽기 → 변환 → line_protocol 직렬화 → 전송)
+  → 메모리는 파일 크기와 무관하게 청크 + 전송 대기 큐만큼, 첫 청크부터 바로 전송 시작
+- 배치 N개를 동시에 전송 (BackfillWriter: 워커 스레드 + bounded queue로 backpressure)
+- 데이터셋별 적재 완료 행을 체크포인트로 저장 → --resume으로 이어서 적재
+- 배치 크기는 쓰기 지연에 맞춰 자동 조절 (adaptive_batch.AdaptiveBatchSizer, AIMD)
+- 쓰기 요청은 크기 기준으로 gzip 압축 (influx_gzip.enable_gzip, 전송량 절감률 출력)
+- --missing-only: InfluxDB 키 스캔(09 load_influx_values) 후 없거나 값이 다른 행만 적재
+- 변환 함수(stock_lines/economy_lines)와 main()은
+  벤치마크(benchmarks/)에서 import해서 재사용
 """
 
+import argparse
+import importlib
+import queue
+import threading
+import time
+
+import numpy as np
 import pandas as pd
-from datetime import datetime, timezone
-from influxdb_client import InfluxDBClient, Point, WritePrecision
+from influxdb_client import InfluxDBClient, WritePrecision
 from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import os
@@ -16,6 +31,10 @@ import os
 # 설정 (config.py에서 로드)
 # ===========================
 from config import config
+from line_protocol import serialize_rows
+from backfill_checkpoint import BackfillCheckpoint
+from adaptive_batch import AdaptiveBatchSizer
+from influx_gzip import enable_gzip, format_savings
 
 BASE_DIR = config.BASE_DIR
 DATA_DIR = config.DATA_DIR
@@ -26,32 +45,45 @@ INFLUXDB_TOKEN = config.INFLUXDB_TOKEN
 INFLUXDB_ORG = config.INFLUXDB_ORG
 INFLUXDB_BUCKET = config.INFLUXDB_BUCKET
 
-# 배치 크기 (백필은 일반 수집보다 더 작은 배치가 안정적)
+# 시작 배치 크기 (학습된 크기가 없을 때, 이후 ADAPTIVE_BATCH_*에 따라 자동 조절)
 BATCH_SIZE = int(os.getenv("INFLUXDB_BACKFILL_BATCH_SIZE", "100"))
 
-print("=" * 80)
-print("15년 히스토리 데이터 InfluxDB 백필")
-print("=" * 80)
+# 동시 전송 배치 수 / 대기 큐 크기 (큐가 차면 변환 쪽이 대기)
+WORKERS = max(1, int(os.getenv("INFLUXDB_BACKFILL_WORKERS", "4")))
+QUEUE_SIZE = int(os.getenv("INFLUXDB_BACKFILL_QUEUE_SIZE", "0"))
 
-# ===========================
-# InfluxDB 클라이언트 생성
-# ===========================
-client = InfluxDBClient(
-    url=INFLUXDB_URL,
-    token=INFLUXDB_TOKEN,
-    org=INFLUXDB_ORG,
-    timeout=60_000  # 타임아웃 60초로 설정
-)
-write_api = client.write_api(write_options=SYNCHRONOUS)
+# CSV 청크 행 수 (한 번에 메모리에 올리는 행 수)
+CHUNK_ROWS = max(1000, int(os.getenv("INFLUXDB_BACKFILL_CHUNK_ROWS", "10000")))
+
+# 태그 컬럼은 청크마다 타입 추론이 달라지지 않도록 문자열로 고정 (없는 컬럼은 무시)
+TAG_DTYPES = {"name": str, "ticker": str, "indicator": str, "series_id": str}
+
+
+def create_write_api(workers=1):
+    """
+    InfluxDB 클라이언트와 동기 write_api 생성 (커넥션 풀은 워커 수 이상)
 
+    Returns:
+        tuple: (client, write_api, GzipStats 또는 None)
+    """
+    client = InfluxDBClient(
+        url=INFLUXDB_URL,
+        token=INFLUXDB_TOKEN,
+        org=INFLUXDB_ORG,
+        timeout=60_000,  # 타임아웃 60초로 설정
+        connection_pool_maxsize=max(workers, 4),
+    )
+    gzip_stats = enable_gzip(client)
+    return client, client.write_api(write_options=SYNCHRONOUS), gzip_stats
 
-def write_points_with_retry(points, depth=0):
+
+def write_points_with_retry(write_api, points, depth=0):
     """타임아웃 시 배치를 절반으로 쪼개 재시도"""
     if not points:
         return 0
 
     try:
-        write_api.write(bucket=INFLUXDB_BUCKET, record=points)
+        write_api.write(bucket=INFLUXDB_BUCKET, record=points, write_precision=WritePrecision.S)
         return len(points)
     except ApiException as e:
         message = str(e).lower()
@@ -62,201 +94,404 @@ def write_points_with_retry(points, depth=0):
             print(f"\n  ⚠️  write timeout 발생, 배치를 더 잘게 나눠 재시도합니다. ({len(points)}건)")
 
         mid = len(points) // 2
-        return write_points_with_retry(points[:mid], depth + 1) + write_points_with_retry(points[mid:], depth + 1)
-
-# ===========================
-# 1. 한국 주가 백필
-# ===========================
-print("\n[1/4] 한국 주가 백필")
-print("-" * 80)
-
-kr_file = f"{DATA_DIR}/stock_kr_2010_2025_with_adj.csv"
-if os.path.exists(kr_file):
-    kr_df = pd.read_csv(kr_file, encoding='utf-8-sig')
-    kr_df['date'] = pd.to_datetime(kr_df['date'])
-
-    print(f"  파일: {os.path.basename(kr_file)}")
-    print(f"  레코드: {len(kr_df):,}건")
-    print(f"  기간: {kr_df['date'].min()} ~ {kr_df['date'].max()}")
-    print(f"  종목: {kr_df['ticker'].nunique()}개")
-
-    total_written = 0
-    for i in range(0, len(kr_df), BATCH_SIZE):
-        batch = kr_df.iloc[i:i+BATCH_SIZE]
-        points = []
-
-        for _, row in batch.iterrows():
-            try:
-                # KST를 UTC로 변환 (9시간 차이)
-                dt = row['date'].to_pydatetime().replace(tzinfo=timezone.utc)
-
-                p = Point("stock_prices") \
-                    .tag("name", row['name']) \
-                    .tag("ticker", row['ticker']) \
-                    .field("open", float(row['open'])) \
-                    .field("high", float(row['high'])) \
-                    .field("low", float(row['low'])) \
-                    .field("close", float(row['close'])) \
-                    .field("adj_close", float(row.get('adj_close', row['close']))) \
-                    .field("volume", int(row['volume'])) \
-                    .field("status_code", int(row.get('status_code', 1))) \
-                    .time(dt, WritePrecision.S)
-                points.append(p)
-            except Exception as e:
-                print(f"  ⚠️  레코드 변환 오류: {e}")
-                continue
-
-        if points:
-            total_written += write_points_with_retry(points)
-            print(f"  진행: {total_written:,}/{len(kr_df):,}건 ({total_written/len(kr_df)*100:.1f}%)", end='\r')
-
-    print(f"\n✅ 한국 주가 백필 완료: {total_written:,}건")
-else:
-    print(f"❌ 파일 없음: {kr_file}")
-
-# ===========================
-# 2. 미국 주가 백필
-# ===========================
-print("\n[2/4] 미국 주가 백필")
-print("-" * 80)
-
-us_file = f"{DATA_DIR}/stock_us_2010_2025_with_adj.csv"
-if os.path.exists(us_file):
-    us_df = pd.read_csv(us_file, encoding='utf-8-sig')
-    us_df['date'] = pd.to_datetime(us_df['date'])
-
-    print(f"  파일: {os.path.basename(us_file)}")
-    print(f"  레코드: {len(us_df):,}건")
-    print(f"  기간: {us_df['date'].min()} ~ {us_df['date'].max()}")
-    print(f"  종목: {us_df['ticker'].nunique()}개")
-
-    total_written = 0
-    for i in range(0, len(us_df), BATCH_SIZE):
-        batch = us_df.iloc[i:i+BATCH_SIZE]
-        points = []
-
-        for _, row in batch.iterrows():
-            try:
-                dt = row['date'].to_pydatetime().replace(tzinfo=timezone.utc)
-
-                p = Point("stock_prices") \
-                    .tag("name", row['name']) \
-                    .tag("ticker", row['ticker']) \
-                    .field("open", float(row['open'])) \
-                    .field("high", float(row['high'])) \
-                    .field("low", float(row['low'])) \
-                    .field("close", float(row['close'])) \
-                    .field("volume", int(row['volume'])) \
-                    .time(dt, WritePrecision.S)
-                points.append(p)
-            except Exception as e:
-                print(f"  ⚠️  레코드 변환 오류: {e}")
-                continue
-
-        if points:
-            total_written += write_points_with_retry(points)
-            print(f"  진행: {total_written:,}/{len(us_df):,}건 ({total_written/len(us_df)*100:.1f}%)", end='\r')
-
-    print(f"\n✅ 미국 주가 백필 완료: {total_written:,}건")
-else:
-    print(f"❌ 파일 없음: {us_file}")
-
-# ===========================
-# 3. FRED 경제지표 백필
-# ===========================
-print("\n[3/4] FRED 경제지표 백필")
-print("-" * 80)
-
-fred_file = f"{DATA_DIR}/economy_fred_2010_2025.csv"
-if os.path.exists(fred_file):
-    fred_df = pd.read_csv(fred_file, encoding='utf-8-sig')
-    fred_df['date'] = pd.to_datetime(fred_df['date'])
-
-    print(f"  파일: {os.path.basename(fred_file)}")
-    print(f"  레코드: {len(fred_df):,}건")
-    print(f"  기간: {fred_df['date'].min()} ~ {fred_df['date'].max()}")
-    print(f"  지표: {fred_df['series_id'].nunique()}개")
-
-    total_written = 0
-    for i in range(0, len(fred_df), BATCH_SIZE):
-        batch = fred_df.iloc[i:i+BATCH_SIZE]
-        points = []
-
-        for _, row in batch.iterrows():
+        return (write_points_with_retry(write_api, points[:mid], depth + 1)
+                + write_points_with_retry(write_api, points[mid:], depth + 1))
+
+
+class BackfillWriter:
+    """
+    배치 N개를 동시에 전송하는 백필 Writer
+
+    - 워커 스레드마다 write_points_with_retry로 동기 전송 (타임아웃 시 배치 분할 재시도 유지)
+    - 대기 큐가 가득 차면 submit()이 대기 → 변환 속도가 전송 속도를 앞서지 않음
+    - 실패한 배치는 중단하지 않고 건수/오류를 집계 (종료 시 요약)
+    - 배치마다 전송 시간/성공 여부를 sizer에 알려 다음 배치 크기를 조절
+    """
+
+    def __init__(self, write_api, workers=WORKERS, queue_size=QUEUE_SIZE, sizer=None):
+        """
+        Args:
+            write_api: SYNCHRONOUS write_api
+            workers: 동시 전송 배치 수
+            queue_size: 대기 큐 크기 (0이면 workers × 2)
+            sizer: AdaptiveBatchSizer (없으면 BATCH_SIZE 고정)
+        """
+        self.write_api = write_api
+        self.workers = workers
+        self.sizer = sizer
+        self._queue = queue.Queue(maxsize=queue_size or workers * 2)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.failed_batches = 0
+        self.errors = []
+        self._threads = [
+            threading.Thread(target=self._run, name=f"backfill-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            ok = False
             try:
-                dt = row['date'].to_pydatetime().replace(tzinfo=timezone.utc)
-
-                p = Point("economic_indicators") \
-                    .tag("indicator", row['indicator']) \
-                    .tag("period", "daily") \
-                    .field("value", float(row['value'])) \
-                    .time(dt, WritePrecision.S)
-                points.append(p)
+                if item is None:
+                    return
+                lines, on_done, generation = item
+                started = time.perf_counter()
+                written = write_points_with_retry(self.write_api, lines)
+                with self._lock:
+                    self.written += written
+                ok = True
             except Exception as e:
-                print(f"  ⚠️  레코드 변환 오류: {e}")
-                continue
+                message = (str(e).strip().splitlines() or [type(e).__name__])[0][:100]
+                with self._lock:
+                    self.failed += len(lines)
+                    self.failed_batches += 1
+                    self.errors.append(message)
+                print(f"\n  ⚠️  배치 전송 실패 ({len(lines)}건): {message}")
+            finally:
+                if item is not None:
+                    if self.sizer is not None:
+                        self.sizer.record(generation, len(lines), time.perf_counter() - started, ok)
+                    if on_done is not None:
+                        on_done(ok)
+                self._queue.task_done()
+
+    def batch_size(self):
+        """
+        다음 배치 크기
+
+        Returns:
+            tuple: (배치 크기, 세대 번호 - submit()에 그대로 전달)
+        """
+        if self.sizer is None:
+            return BATCH_SIZE, None
+        return self.sizer.current()
+
+    def submit(self, lines, on_done=None, generation=None):
+        """
+        배치 전송 예약 (큐가 가득 차면 빈자리가 날 때까지 대기)
+
+        Args:
+            on_done: 전송이 끝나면 성공 여부(bool)로 호출 (체크포인트 갱신용)
+            generation: batch_size()가 돌려준 세대 번호
+        """
+        if lines:
+            self._queue.put((lines, on_done, generation))
+            with self._lock:
+                self.submitted += len(lines)
+
+    def join(self):
+        """예약한 배치가 모두 끝날 때까지 대기"""
+        self._queue.join()
+
+    def close(self) -> dict:
+        """남은 배치 전송 후 워커 종료"""
+        self.join()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        return self.stats()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "failed": self.failed,
+                "failed_batches": self.failed_batches,
+                "errors": self.errors[:5],
+            }
 
-        if points:
-            total_written += write_points_with_retry(points)
-            print(f"  진행: {total_written:,}/{len(fred_df):,}건 ({total_written/len(fred_df)*100:.1f}%)", end='\r')
-
-    print(f"\n✅ FRED 경제지표 백필 완료: {total_written:,}건")
-else:
-    print(f"❌ 파일 없음: {fred_file}")
 
 # ===========================
-# 4. ECOS 경제지표 백필
+# 라인 프로토콜 생성
 # ===========================
-print("\n[4/4] ECOS 경제지표 백필")
-print("-" * 80)
-
-ecos_file = f"{DATA_DIR}/economy_ecos_2010_2025.csv"
-if os.path.exists(ecos_file):
-    ecos_df = pd.read_csv(ecos_file, encoding='utf-8-sig')
-    ecos_df['date'] = pd.to_datetime(ecos_df['date'])
-
-    print(f"  파일: {os.path.basename(ecos_file)}")
-    print(f"  레코드: {len(ecos_df):,}건")
-    print(f"  기간: {ecos_df['date'].min()} ~ {ecos_df['date'].max()}")
-    print(f"  지표: {ecos_df['series_id'].nunique()}개")
-
-    total_written = 0
-    for i in range(0, len(ecos_df), BATCH_SIZE):
-        batch = ecos_df.iloc[i:i+BATCH_SIZE]
-        points = []
-
-        for _, row in batch.iterrows():
-            try:
-                dt = row['date'].to_pydatetime().replace(tzinfo=timezone.utc)
-
-                p = Point("economic_indicators") \
-                    .tag("indicator", row['indicator']) \
-                    .tag("period", "monthly") \
-                    .field("value", float(row['value'])) \
-                    .time(dt, WritePrecision.S)
-                points.append(p)
-            except Exception as e:
-                print(f"  ⚠️  레코드 변환 오류: {e}")
-                continue
-
-        if points:
-            total_written += write_points_with_retry(points)
-            print(f"  진행: {total_written:,}/{len(ecos_df):,}건 ({total_written/len(ecos_df)*100:.1f}%)", end='\r')
-
-    print(f"\n✅ ECOS 경제지표 백필 완료: {total_written:,}건")
-else:
-    print(f"❌ 파일 없음: {ecos_file}")
+def stock_lines(df, with_adj=True):
+    """
+    주가 DataFrame → stock_prices line protocol
+
+    Args:
+        df: date(datetime), name, ticker, open, high, low, close, volume 컬럼 DataFrame
+        with_adj: adj_close/status_code 필드 포함 여부 (한국 주가 파일만 포함)
+
+    Returns:
+        tuple: (line 리스트, line별 행 위치, 변환 오류로 건너뛴 행 수)
+    """
+    columns = ['date', 'name', 'ticker', 'open', 'high', 'low', 'close', 'volume']
+    frame = df[columns].copy()
+    if with_adj:
+        frame['adj_close'] = df['adj_close'] if 'adj_close' in df.columns else df['close']
+        frame['status_code'] = df['status_code'] if 'status_code' in df.columns else 1
+    return serialize_rows(frame, "stock_prices", time_col="date")
+
+
+def economy_lines(df, period):
+    """
+    경제지표 DataFrame → economic_indicators line protocol
+
+    Args:
+        df: date(datetime), indicator, value 컬럼 DataFrame
+        period: period 태그 (FRED: daily, ECOS: monthly)
+
+    Returns:
+        tuple: (line 리스트, line별 행 위치, 변환 오류로 건너뛴 행 수)
+    """
+    frame = df[['date', 'indicator', 'value']].assign(period=period)
+    return serialize_rows(frame, "economic_indicators", time_col="date")
+
+
+# 백필 대상: (체크포인트 키, 라벨, 파일명, 개수 컬럼, 개수 단위, line protocol 생성 함수)
+BACKFILL_FILES = [
+    ("kr", "한국 주가", "stock_kr_2010_2025_with_adj.csv", "ticker", "종목",
+     lambda df: stock_lines(df, with_adj=True)),
+    ("us", "미국 주가", "stock_us_2010_2025_with_adj.csv", "ticker", "종목",
+     lambda df: stock_lines(df, with_adj=False)),
+    ("fred", "FRED 경제지표", "economy_fred_2010_2025.csv", "series_id", "지표",
+     lambda df: economy_lines(df, "daily")),
+    ("ecos", "ECOS 경제지표", "economy_ecos_2010_2025.csv", "series_id", "지표",
+     lambda df: economy_lines(df, "monthly")),
+]
+
+
+# --missing-only 비교 기준: 데이터셋 → (load_influx_values 결과 키, 키 컬럼, 값 컬럼, period 태그)
+DIFF_KEYS = {
+    "kr": ("stock", "ticker", "close", None),
+    "us": ("stock", "ticker", "close", None),
+    "fred": ("econ", "indicator", "value", "daily"),
+    "ecos": ("econ", "indicator", "value", "monthly"),
+}
+
+
+def scan_influx_values(start="1970-01-01T00:00:00Z", stop="now()"):
+    """대상 bucket의 키별 close/value 스캔 (09_validate_influx_integrity.load_influx_values 재사용)"""
+    validate = importlib.import_module("09_validate_influx_integrity")
+    return validate.load_influx_values(INFLUXDB_BUCKET, start, stop)
+
+
+def missing_rows(df, key, influx_values):
+    """
+    InfluxDB에 없거나 저장 값이 다른 행 마스크
+
+    - 주가: (date, ticker)의 close, 경제지표: (date, indicator, period)의 value 비교
+    - CSV 값이 비어 있는 행은 키가 없을 때만 포함
+      (경제지표는 value가 유일한 필드라 비어 있으면 적재되지 않으므로 제외)
+
+    Returns:
+        np.ndarray: bool 마스크 (df 행 순서)
+    """
+    scope, key_col, value_col, period = DIFF_KEYS[key]
+    stored_values = influx_values[scope]
+
+    dates = df["date"].dt.strftime("%Y-%m-%d")
+    names = df[key_col].astype(str)
+    if period is None:
+        keys = zip(dates, names)
+    else:
+        keys = zip(dates, names, [period] * len(df))
+    stored = np.array([stored_values.get(k, np.nan) for k in keys], dtype="float64")
+
+    values = pd.to_numeric(df[value_col], errors="coerce").to_numpy(dtype="float64")
+    absent = np.isnan(stored)
+    if period is not None:
+        absent &= ~np.isnan(values)
+    differ = ~np.isnan(values) & ~np.isclose(values, stored, rtol=1e-9, atol=0)
+    return absent | differ
+
+
+def read_chunks(path, offset=0, chunk_rows=None):
+    """
+    CSV를 chunk_rows행씩 읽어 순서대로 반환 (date는 datetime, 태그 컬럼은 문자열로 고정)
+
+    Args:
+        offset: 건너뛸 데이터 행 수 (체크포인트 offset, 헤더는 유지)
+        chunk_rows: 청크 행 수 (기본 CHUNK_ROWS)
+    """
+    reader = pd.read_csv(
+        path,
+        encoding='utf-8-sig',
+        dtype=TAG_DTYPES,
+        skiprows=range(1, offset + 1) if offset else None,
+        chunksize=chunk_rows or CHUNK_ROWS,
+    )
+    with reader:
+        for chunk in reader:
+            chunk['date'] = pd.to_datetime(chunk['date'])
+            yield chunk
+
+
+def backfill_file(writer, checkpoint, key, label, path, count_col, count_unit, build_lines,
+                  resume=False, influx_values=None):
+    """
+    CSV 1개를 청크 단위로 읽기 → 변환 → line protocol → 전송 (메모리는 청크 + 전송 대기 큐만큼)
+
+    Args:
+        writer: BackfillWriter (파일 사이에 공유)
+        checkpoint: BackfillCheckpoint (배치 완료마다 적재 완료 행 저장, None이면 기록 안 함)
+        key: 데이터셋 키 (kr, us, fred, ecos)
+        resume: True면 체크포인트 다음 행부터 적재
+        influx_values: scan_influx_values() 결과 (주면 없거나 값이 다른 행만 적재)
+
+    Returns:
+        int: 적재한 포인트 수 (파일이 없으면 0)
+    """
+    if not os.path.exists(path):
+        print(f"❌ 파일 없음: {path}")
+        return 0
 
-# ===========================
-# 완료
-# ===========================
-client.close()
-
-print("\n" + "=" * 80)
-print("백필 완료!")
-print("=" * 80)
-print(f"  InfluxDB: {INFLUXDB_URL}")
-print(f"  Bucket: {INFLUXDB_BUCKET}")
-print()
-print("다음 단계: Grafana 대시보드 확인")
-print()
+    print(f"  파일: {os.path.basename(path)}")
+
+    offset = 0
+    if checkpoint is not None:
+        offset = checkpoint.begin(key, path, INFLUXDB_BUCKET, resume)
+        if offset is None:
+            print(f"✅ {label} 이미 적재 완료 (체크포인트) → 건너뜀")
+            return 0
+        if offset:
+            print(f"  ▶ 체크포인트에서 이어서 적재: {offset:,}행 이후")
+
+    start = writer.stats()
+    total_rows = offset
+    selected = 0
+    skipped = 0
+    first_date = last_date = None
+    names = set()
+
+    for chunk in read_chunks(path, offset):
+        chunk_start = total_rows
+        total_rows += len(chunk)
+        names.update(chunk[count_col].dropna().unique())
+        dates = chunk['date'].dropna()
+        if not dates.empty:
+            first_date = dates.min() if first_date is None else min(first_date, dates.min())
+            last_date = dates.max() if last_date is None else max(last_date, dates.max())
+
+        if influx_values is not None:
+            chunk = chunk[missing_rows(chunk, key, influx_values)]
+        selected += len(chunk)
+
+        lines, rows, chunk_skipped = build_lines(chunk)
+        skipped += chunk_skipped
+        rows = rows + chunk_start
+
+        i = 0
+        while i < len(lines):
+            size, generation = writer.batch_size()
+            batch = lines[i:i+size]
+            # 배치가 끝나면 이 배치의 마지막 행 다음 위치까지 적재 완료로 기록
+            on_done = None
+            if checkpoint is not None:
+                on_done = checkpoint.track(key, int(rows[i + len(batch) - 1]) + 1)
+            writer.submit(batch, on_done=on_done, generation=generation)
+            i += len(batch)
+
+        done = writer.stats()["written"] - start["written"]
+        print(f"  진행: 읽음 {total_rows:,}행, 적재 {done:,}건 (배치 {writer.batch_size()[0]:,}건)", end='\r')
+    writer.join()
+
+    print(f"\n  레코드: {total_rows:,}건" + (f" (이번 실행 {total_rows - offset:,}건)" if offset else ""))
+    if first_date is not None:
+        print(f"  기간: {first_date} ~ {last_date}")
+    print(f"  {count_unit}: {len(names)}개")
+    if influx_values is not None:
+        print(f"  없거나 값이 다른 행: {selected:,}건")
+    if skipped:
+        print(f"  ⚠️  레코드 변환 오류: {skipped:,}건 건너뜀")
+
+    end = writer.stats()
+    total_written = end["written"] - start["written"]
+    failed = end["failed"] - start["failed"]
+    print(f"✅ {label} 백필 완료: {total_written:,}건" + (f" (전송 실패 {failed:,}건)" if failed else ""))
+    if checkpoint is not None and not checkpoint.finish(key, total_rows):
+        print(f"  ⚠️  실패 배치 이후는 미완료로 기록 (적재 완료 {checkpoint.get(key)['rows']:,}행) → --resume으로 재시도")
+    return total_written
+
+
+def main(data_dir=DATA_DIR, workers=WORKERS, resume=False, missing_only=False):
+    """
+    4개 파일 백필
+
+    Args:
+        resume: True면 데이터셋별 체크포인트에서 이어서 적재
+        missing_only: True면 InfluxDB에 없거나 값이 다른 행만 적재 (체크포인트 미사용)
+
+    Returns:
+        dict: BackfillWriter 전송 통계
+    """
+    print("=" * 80)
+    print("15년 히스토리 데이터 InfluxDB 백필")
+    print("=" * 80)
+    sizer = AdaptiveBatchSizer.from_config(INFLUXDB_URL, initial=BATCH_SIZE)
+    print(f"  CSV 청크: {CHUNK_ROWS:,}행")
+    if sizer.enabled:
+        print(f"  배치 {sizer.initial:,}건부터 자동 조절 ({sizer.min_size:,}~{sizer.max_size:,}, "
+              f"목표 {sizer.target_sec * 1000:.0f}ms) × 동시 전송 {workers}개")
+    else:
+        print(f"  배치 {sizer.initial:,}건 × 동시 전송 {workers}개")
+
+    influx_values = None
+    checkpoint = BackfillCheckpoint(config.BACKFILL_CHECKPOINT_FILE)
+    if missing_only:
+        started = time.perf_counter()
+        print(f"  InfluxDB 키 스캔: {INFLUXDB_BUCKET}")
+        influx_values = scan_influx_values()
+        print(f"  스캔 완료: 주가 {len(influx_values['stock']):,}건, "
+              f"경제지표 {len(influx_values['econ']):,}건 ({time.perf_counter() - started:.1f}초)")
+        checkpoint = None
+    elif resume:
+        print(f"  체크포인트에서 이어서 적재: {config.BACKFILL_CHECKPOINT_FILE}")
+
+    client, write_api, gzip_stats = create_write_api(workers)
+    writer = BackfillWriter(write_api, workers=workers, sizer=sizer)
+
+    for i, (key, label, filename, count_col, count_unit, build_lines) in enumerate(BACKFILL_FILES, 1):
+        print(f"\n[{i}/{len(BACKFILL_FILES)}] {label} 백필")
+        print("-" * 80)
+        backfill_file(writer, checkpoint, key, label, f"{data_dir}/{filename}",
+                      count_col, count_unit, build_lines, resume=resume, influx_values=influx_values)
+        sizer.save()
+
+    # ===========================
+    # 완료
+    # ===========================
+    stats = writer.close()
+    client.close()
+
+    print("\n" + "=" * 80)
+    print("백필 완료!")
+    print("=" * 80)
+    print(f"  InfluxDB: {INFLUXDB_URL}")
+    print(f"  Bucket: {INFLUXDB_BUCKET}")
+    print(f"  적재: {stats['written']:,}건")
+    if gzip_stats is not None:
+        print(f"  전송량: {format_savings(gzip_stats.snapshot())}")
+    if sizer.enabled:
+        print(f"  배치 크기: {sizer.initial:,} → {sizer.size:,}건 "
+              f"(증가 {sizer.increases}회, 감소 {sizer.decreases}회, {config.ADAPTIVE_BATCH_STATE_FILE}에 저장)")
+    if stats["failed"]:
+        print(f"  ⚠️  전송 실패: {stats['failed']:,}건 ({stats['failed_batches']}배치)")
+        for error in stats["errors"]:
+            print(f"    - {error}")
+    print()
+    print("다음 단계: Grafana 대시보드 확인")
+    print()
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="15년 히스토리 데이터 InfluxDB 백필")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help=f"동시 전송 배치 수 (기본 {WORKERS}, 1이면 순차)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--resume", action="store_true",
+                      help="데이터셋별 체크포인트에서 이어서 적재 (완료된 데이터셋은 건너뜀)")
+    mode.add_argument("--missing-only", action="store_true",
+                      help="InfluxDB에 없거나 값이 다른 행만 적재 (부분 적재된 bucket 복구용)")
+    args = parser.parse_args()
+
+    main(workers=max(1, args.workers), resume=args.resume, missing_only=args.missing_only)
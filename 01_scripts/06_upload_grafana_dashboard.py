@@ -10,6 +10,10 @@ import os
 
 # 설정 (config.py에서 로드)
 from config import config
+from http_session import get_session
+
+# 덮어쓰기 업로드라 POST 재전송이 안전 → 5xx/429 재시도 허용
+session = get_session("grafana", retry_post=True)
 
 # Grafana 설정 (환경변수에서 로드)
 GRAFANA_URL = config.GRAFANA_URL
@@ -46,7 +50,7 @@ payload = {
 }
 
 try:
-    response = requests.post(
+    response = session.post(
         url,
         json=payload,
         auth=(GRAFANA_USER, GRAFANA_PASSWORD),
@@ -67,7 +71,7 @@ try:
         print("\n[3/3] 데이터소스 확인")
 
         ds_url = f"{GRAFANA_URL}/api/datasources"
-        ds_response = requests.get(
+        ds_response = session.get(
             ds_url,
             auth=(GRAFANA_USER, GRAFANA_PASSWORD),
             timeout=10
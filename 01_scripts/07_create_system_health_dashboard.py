@@ -11,11 +11,12 @@ Telegraf에서 수집한 라즈베리파이 리소스 모니터링
 """
 
 import json
-import requests
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from http_session import get_session
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
 
@@ -503,7 +504,9 @@ def upload_dashboard(dashboard_json):
     auth = (GRAFANA_USER, GRAFANA_PASSWORD)
 
     try:
-        response = requests.post(url, json=dashboard_json, headers=headers, auth=auth, timeout=30)
+        response = get_session("grafana", retry_post=True).post(
+            url, json=dashboard_json, headers=headers, auth=auth, timeout=30
+        )
         if response.status_code == 200:
             result = response.json()
             print(f"대시보드 업로드 성공!")
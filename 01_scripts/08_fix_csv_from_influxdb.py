@@ -16,6 +16,7 @@ import os
 import pandas as pd
 from datetime import datetime, timedelta
 from config import config
+from stock_store import get_stock_store
 
 try:
     from influxdb_client import InfluxDBClient
@@ -49,8 +50,8 @@ def fix_stock_csv():
         print("  ❌ stock.csv 파일이 없습니다.")
         return
 
-    # CSV 읽기
-    df = pd.read_csv(csv_path)
+    # CSV 읽기 (stock.csv는 append 저장소라 같은 키는 최신 행만 사용)
+    df = get_stock_store().read_latest(typed=True)
     no_data_rows = df[df['status'] != 'success']
 
     if len(no_data_rows) == 0:
@@ -210,7 +211,7 @@ def show_csv_status():
     # Stock CSV
     stock_path = f"{config.STOCK_DIR}/stock.csv"
     if os.path.exists(stock_path):
-        df = pd.read_csv(stock_path)
+        df = get_stock_store().read_latest(typed=True)
         print(f"\n📈 Stock CSV: {len(df)}행")
         print(df['status'].value_counts().to_string())
 
@@ -6,6 +6,7 @@ InfluxDB 정합성 점검 스크립트
 검증 대상:
 - stock_prices (KR/US): date+ticker+name, date+ticker
 - economic_indicators (FRED/ECOS): date+indicator+period
+- load_influx_values()는 키별 close/value까지 읽어 04 백필 --missing-only에서 재사용
 
 사용 예:
     source ~/influx_venv/bin/activate
@@ -23,8 +24,8 @@ from influxdb_client import InfluxDBClient
 from config import config
 
 
-def load_csv_sets():
-    data_dir = Path(config.DATA_DIR)
+def load_csv_sets(data_dir=None):
+    data_dir = Path(data_dir or config.DATA_DIR)
 
     kr = pd.read_csv(data_dir / "stock_kr_2010_2025_with_adj.csv", encoding="utf-8-sig")
     us = pd.read_csv(data_dir / "stock_us_2010_2025_with_adj.csv", encoding="utf-8-sig")
@@ -118,6 +119,49 @@ from(bucket: "{bucket}")
     return {"stock_full": stock_keys, "econ_full": econ_keys}
 
 
+def load_influx_values(bucket, start, stop):
+    """
+    키별 저장 값 스캔 (04 백필 --missing-only용)
+
+    Returns:
+        dict: {"stock": {(date, ticker): close}, "econ": {(date, indicator, period): value}}
+    """
+    client = InfluxDBClient(
+        url=config.INFLUXDB_URL,
+        token=config.INFLUXDB_TOKEN,
+        org=config.INFLUXDB_ORG,
+        timeout=120000,
+    )
+    q = client.query_api()
+
+    stock_flux = f"""
+from(bucket: "{bucket}")
+  |> range(start: {start}, stop: {stop})
+  |> filter(fn: (r) => r._measurement == "stock_prices" and r._field == "close")
+  |> keep(columns: ["_time", "_value", "ticker"])
+"""
+    econ_flux = f"""
+from(bucket: "{bucket}")
+  |> range(start: {start}, stop: {stop})
+  |> filter(fn: (r) => r._measurement == "economic_indicators" and r._field == "value")
+  |> keep(columns: ["_time", "_value", "indicator", "period"])
+"""
+
+    stock_values = {}
+    for r in q.query_stream(stock_flux):
+        v = r.values
+        stock_values[(r.get_time().strftime("%Y-%m-%d"), str(v.get("ticker", "")))] = r.get_value()
+
+    econ_values = {}
+    for r in q.query_stream(econ_flux):
+        v = r.values
+        key = (r.get_time().strftime("%Y-%m-%d"), str(v.get("indicator", "")), str(v.get("period", "")))
+        econ_values[key] = r.get_value()
+
+    client.close()
+    return {"stock": stock_values, "econ": econ_values}
+
+
 def summarize(csv_data, influx_data):
     kr_tickers = set(csv_data["kr"]["ticker"].astype(str).unique())
     us_tickers = set(csv_data["us"]["ticker"].astype(str).unique())
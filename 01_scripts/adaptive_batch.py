@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+적응형 배치 크기 (Adaptive Batch Size, AIMD)
+============================================
+InfluxDB 쓰기 지연에 맞춰 배치 크기를 자동 조절
+
+기존 방식:
+    고정 배치 크기(INFLUXDB_BACKFILL_BATCH_SIZE=100)로 전송하고, 타임아웃이 나면 그 배치만 절반씩 쪼개 재시도
+    → 다음 배치도 같은 크기로 보내고, 서버가 여유 있어도 배치가 커지지 않음
+변경 방식 (AIMD):
+    - 쓰기 지연 ≤ 목표 지연: 배치 크기 + STEP (additive increase)
+    - 쓰기 지연 > 목표 지연, 타임아웃, 전송 실패: 배치 크기 × DECREASE (multiplicative decrease)
+    - 크기를 바꾼 뒤에는 바뀐 크기로 보낸 배치의 결과만 반영
+      (동시 전송 중인 이전 크기 배치 때문에 연달아 줄이거나 늘리지 않음)
+    - 학습한 크기를 InfluxDB 주소별로 파일에 저장 → 다음 실행은 그 크기부터 시작
+
+파일: data/batch_size.json
+    {"http://localhost:8086": {"size": 1800, "updated_at": "..."}}
+
+설정 (.env):
+    ADAPTIVE_BATCH_ENABLED: 사용 여부 (기본 1, 0이면 시작 크기 고정)
+    ADAPTIVE_BATCH_MIN / ADAPTIVE_BATCH_MAX: 배치 크기 하한 / 상한 (기본 50 / 5000)
+    ADAPTIVE_BATCH_STEP: 증가 폭 (기본 100)
+    ADAPTIVE_BATCH_DECREASE: 감소 배율 (기본 0.5)
+    ADAPTIVE_BATCH_TARGET_MS: 목표 쓰기 지연 (ms, 기본 1000)
+
+사용법:
+    python 01_scripts/adaptive_batch.py      # 저장된 학습 크기 출력
+
+    from adaptive_batch import AdaptiveBatchSizer
+    sizer = AdaptiveBatchSizer.from_config(config.INFLUXDB_URL, initial=100)
+    size, generation = sizer.current()
+    ...  # size건 전송
+    sizer.record(generation, len(batch), elapsed_sec, ok)
+    sizer.save()
+
+Created: 2026-10-18
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+from config import config
+
+
+class AdaptiveBatchSizer:
+    """AIMD 배치 크기 조절기 (스레드 안전)"""
+
+    def __init__(self, path: str, key: str, initial: int, min_size: int, max_size: int,
+                 step: int, decrease: float, target_sec: float, enabled: bool = True):
+        """
+        Args:
+            path: 학습 크기 저장 파일
+            key: 저장 키 (InfluxDB 주소)
+            initial: 저장된 크기가 없을 때 시작 크기
+        """
+        self.path = path
+        self.key = key
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.step = max(1, step)
+        self.decrease = min(max(decrease, 0.1), 0.9)
+        self.target_sec = target_sec
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+        learned = self._load().get(key, {}).get("size") if enabled else None
+        self.initial = self._clamp(learned or initial) if enabled else max(1, int(initial))
+        self._size = self.initial
+        self._generation = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @classmethod
+    def from_config(cls, key: str, initial: int):
+        """config의 ADAPTIVE_BATCH_* 설정으로 생성"""
+        return cls(
+            config.ADAPTIVE_BATCH_STATE_FILE, key, initial,
+            min_size=config.ADAPTIVE_BATCH_MIN,
+            max_size=config.ADAPTIVE_BATCH_MAX,
+            step=config.ADAPTIVE_BATCH_STEP,
+            decrease=config.ADAPTIVE_BATCH_DECREASE,
+            target_sec=config.ADAPTIVE_BATCH_TARGET_MS / 1000,
+            enabled=config.ADAPTIVE_BATCH_ENABLED,
+        )
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _clamp(self, size) -> int:
+        return min(self.max_size, max(self.min_size, int(size)))
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def current(self):
+        """
+        다음 배치 크기
+
+        Returns:
+            tuple: (배치 크기, 세대 번호 - record()에 그대로 전달)
+        """
+        with self._lock:
+            return self._size, self._generation
+
+    def record(self, generation: int, batch_len: int, elapsed: float, ok: bool):
+        """
+        배치 전송 결과 반영
+
+        Args:
+            generation: current()가 돌려준 세대 번호 (크기가 바뀐 뒤의 이전 세대 결과는 무시)
+            batch_len: 전송한 포인트 수
+            elapsed: 전송 소요 시간 (초, 타임아웃 분할 재시도 포함)
+            ok: 전송 성공 여부
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            if not ok or elapsed > self.target_sec:
+                size = self._clamp(self._size * self.decrease)
+            elif batch_len >= self._size:
+                # 꽉 찬 배치가 목표 지연 안에 끝났을 때만 증가 (파일 끝 자투리 배치 제외)
+                size = self._clamp(self._size + self.step)
+            else:
+                return
+            if size == self._size:
+                return
+            if size > self._size:
+                self.increases += 1
+            else:
+                self.decreases += 1
+            self._size = size
+            self._generation += 1
+
+    def save(self):
+        """학습한 크기 저장 (원자적 교체, 다른 InfluxDB 주소 항목은 유지)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            size = self._size
+        states = self._load()
+        states[self.key] = {"size": size, "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(states, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"  배치 크기 저장 오류: {e}")
+
+
+if __name__ == "__main__":
+    path = config.ADAPTIVE_BATCH_STATE_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            states = json.load(f)
+    except (OSError, ValueError):
+        states = {}
+
+    print(f"{path}: {len(states)}개")
+    for url, state in states.items():
+        print(f"  {url}: {state['size']:,}건 ({state['updated_at']})")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백필 체크포인트 (Backfill Checkpoint)
+=====================================
+04_influxdb_backfill_15years.py가 데이터셋(kr, us, fred, ecos)별로 어디까지 적재했는지 기록
+
+- 배치 전송이 확인될 때마다 "적재 완료 행 수"(CSV 데이터 행 기준 offset)를 JSON 파일에 저장
+- 배치는 여러 개가 동시에 전송되므로, 앞선 배치가 모두 끝난 구간까지만 offset을 올림
+  (연속 완료 기준 watermark → 중간 배치가 실패하면 그 앞에서 멈춤)
+- --resume 실행 시 저장된 offset 다음 행부터 다시 적재 (이미 끝난 데이터셋은 건너뜀)
+  (offset은 헤더 제외 데이터 행 수 → read_csv(skiprows=range(1, offset + 1))로 바로 건너뜀)
+- 전체 행 수(total)는 CSV를 끝까지 스트리밍한 뒤 finish()에서 기록
+- CSV 크기/수정 시각이나 대상 bucket이 바뀌었으면 체크포인트를 무시하고 처음부터
+
+파일: data/backfill_checkpoint.json
+    {"kr": {"file": "stock_kr_2010_2025_with_adj.csv", "size": ..., "mtime": ..., "bucket": "...",
+            "rows": 12300, "total": 41740, "completed": false, "updated_at": "..."}}
+
+사용법:
+    checkpoint = BackfillCheckpoint(config.BACKFILL_CHECKPOINT_FILE)
+    offset = checkpoint.begin("kr", path, bucket, resume=True)  # 완료된 데이터셋이면 None
+    writer.submit(lines, on_done=checkpoint.track("kr", end_row))
+    checkpoint.finish("kr", total_rows)
+
+Created: 2026-10-18
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime
+
+
+class BackfillCheckpoint:
+    """데이터셋별 적재 완료 offset (스레드 안전, 배치 완료 시마다 저장)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._states = self._load()
+        self._pending = {}  # 데이터셋 → deque([[끝 행, 상태]]) (상태: None 진행 중, True 성공, False 실패)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """전체 상태를 원자적으로 저장 (호출측에서 _lock 보유)"""
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._states, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"  체크포인트 저장 오류: {e}")
+
+    @staticmethod
+    def _fingerprint(path: str, bucket: str) -> dict:
+        stat = os.stat(path)
+        return {"file": os.path.basename(path), "size": stat.st_size,
+                "mtime": int(stat.st_mtime), "bucket": bucket}
+
+    def get(self, dataset: str) -> dict:
+        with self._lock:
+            return dict(self._states.get(dataset, {}))
+
+    def begin(self, dataset: str, path: str, bucket: str, resume: bool):
+        """
+        데이터셋 적재 시작
+
+        Args:
+            resume: True면 같은 파일/bucket의 체크포인트에서 이어서 시작
+
+        Returns:
+            int 또는 None: 시작 행 offset (이미 완료된 데이터셋이면 None)
+        """
+        fingerprint = self._fingerprint(path, bucket)
+        with self._lock:
+            saved = self._states.get(dataset, {})
+            same = all(saved.get(key) == value for key, value in fingerprint.items())
+            if resume and saved and not same:
+                print(f"  ⚠️  {dataset} 체크포인트의 파일/bucket이 달라 처음부터 적재합니다")
+            if resume and same and saved.get("completed"):
+                return None
+            offset = int(saved.get("rows", 0)) if resume and same else 0
+
+            self._states[dataset] = {
+                **fingerprint,
+                "rows": offset,
+                "total": None,
+                "completed": False,
+                "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._pending[dataset] = deque()
+            self._save()
+        return offset
+
+    def track(self, dataset: str, end_row: int):
+        """
+        전송할 배치 등록 (제출 순서대로 호출)
+
+        Args:
+            end_row: 이 배치가 덮는 마지막 행 다음 offset
+
+        Returns:
+            callable: 배치 완료 시 호출할 on_done(ok)
+        """
+        entry = [end_row, None]
+        with self._lock:
+            self._pending[dataset].append(entry)
+
+        def on_done(ok: bool):
+            with self._lock:
+                entry[1] = ok
+                self._advance(dataset)
+
+        return on_done
+
+    def _advance(self, dataset: str):
+        """앞에서부터 연속으로 성공한 배치까지 offset 갱신 (호출측에서 _lock 보유)"""
+        pending = self._pending[dataset]
+        advanced = False
+        while pending and pending[0][1] is True:
+            self._states[dataset]["rows"] = pending.popleft()[0]
+            advanced = True
+        if advanced:
+            self._states[dataset]["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._save()
+
+    def finish(self, dataset: str, total: int) -> bool:
+        """
+        데이터셋 적재 종료 (모든 배치 완료 후 호출)
+
+        Args:
+            total: CSV 전체 데이터 행 수
+
+        Returns:
+            bool: 실패 배치 없이 끝까지 적재했는지 여부
+        """
+        with self._lock:
+            state = self._states[dataset]
+            pending = self._pending.pop(dataset, deque())
+            completed = not pending
+            state["total"] = total
+            if completed:
+                state["rows"] = total
+            state["completed"] = completed
+            state["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._save()
+        return completed
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종목별 최신 확정 일봉 캐시 (Last Bar Cache)
+===========================================
+종목마다 마지막으로 받은 일봉(날짜 + OHLCV)을 JSON 파일에 보관
+
+기존 방식:
+    목표 거래일 조회가 비면 최신 일봉을 찾기 위해 period="5d"로 한 번 더 요청
+    → 일봉 게시가 늦는 날(한국 ETF 등)은 종목마다 요청 2회
+변경 방식:
+    - 캐시의 일봉이 목표 거래일 직전 거래일이면 5d 요청 없이 그 일봉을 stale로 사용
+      (5d 요청이 돌려줄 일봉과 같음)
+    - 캐시가 더 오래됐거나 없으면 기존처럼 5d 요청
+    - 수집이 끝나면 success/stale 행으로 캐시 갱신 (날짜가 같거나 최신일 때만)
+- 캐시 일봉 날짜 < 목표 거래일인 종목 = 아직 당일 일봉을 기다리는 종목 (waiting)
+
+파일: data/stock/last_bars.json
+    {"005930.KS": {"bar_date": "2026-10-16", "open": ..., "high": ..., "low": ...,
+                   "close": ..., "adj_close": ..., "volume": ..., "updated_at": "..."}}
+
+설정 (.env):
+    BAR_CACHE_ENABLED: 캐시 일봉으로 5d 재요청 생략 (기본 1, 캐시 갱신은 항상 수행)
+
+사용법:
+    python 01_scripts/bar_cache.py           # 당일 일봉 대기 종목 출력
+
+    from bar_cache import get_bar_cache
+    bar = get_bar_cache().stale_bar(ticker, target_date, "KRX")
+    if bar is not None:
+        return bar, 'stale', None
+
+Created: 2026-10-18
+"""
+
+import json
+import os
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+
+from config import config
+import trading_calendar
+
+PRICE_FIELDS = ("open", "high", "low", "close", "adj_close", "volume")
+
+# 캐시 필드 → yfinance 히스토리 컬럼 (build_stock_row가 읽는 이름)
+HISTORY_COLUMNS = {
+    "open": "Open", "high": "High", "low": "Low",
+    "close": "Close", "adj_close": "Adj Close", "volume": "Volume",
+}
+
+
+class BarCache:
+    """종목별 최신 일봉 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._bars = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._bars)
+
+    def get(self, ticker: str):
+        """캐시 일봉 (없으면 None, bar_date는 date)"""
+        with self._lock:
+            entry = self._bars.get(ticker)
+        if not entry:
+            return None
+        return {**entry, "bar_date": date.fromisoformat(entry["bar_date"])}
+
+    def stale_bar(self, ticker: str, target_date, exchange: str):
+        """
+        목표 거래일 일봉이 없을 때 5d 요청 대신 쓸 일봉
+
+        Returns:
+            pd.Series 또는 None: 캐시 일봉이 목표일 직전 거래일이면
+                yfinance 히스토리 행과 같은 컬럼(Open..Volume, bar_date)
+        """
+        entry = self.get(ticker)
+        if entry is None:
+            return None
+        if entry["bar_date"] != trading_calendar.previous_trading_day(exchange, target_date):
+            return None
+        bar = {column: entry[field] for field, column in HISTORY_COLUMNS.items()}
+        bar["bar_date"] = entry["bar_date"]
+        return pd.Series(bar)
+
+    def update_from_rows(self, rows: list) -> int:
+        """
+        수집 행(success/stale)으로 캐시 갱신
+
+        Returns:
+            int: 갱신된 종목 수
+        """
+        updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        updated = 0
+        with self._lock:
+            for row in rows:
+                if row.get("status") not in ("success", "stale"):
+                    continue
+                bar_date = str(row["bar_date"])
+                current = self._bars.get(row["ticker"])
+                if current and current["bar_date"] > bar_date:
+                    continue
+                entry = {"bar_date": bar_date}
+                try:
+                    for field in PRICE_FIELDS:
+                        entry[field] = int(row[field]) if field == "volume" else float(row[field])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                entry["updated_at"] = updated_at
+                self._bars[row["ticker"]] = entry
+                updated += 1
+            self._dirty = self._dirty or updated > 0
+        return updated
+
+    def waiting(self, targets: dict) -> list:
+        """
+        당일 일봉을 아직 받지 못한 종목
+
+        Args:
+            targets: {티커: 목표 거래일}
+
+        Returns:
+            list: [(티커, 캐시 일봉 날짜 또는 None), ...]
+        """
+        result = []
+        with self._lock:
+            for ticker, target_date in targets.items():
+                entry = self._bars.get(ticker)
+                last = date.fromisoformat(entry["bar_date"]) if entry else None
+                if last is None or last < target_date:
+                    result.append((ticker, last))
+        return result
+
+    def save(self):
+        """변경분이 있으면 파일 저장 (원자적 교체)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = json.dumps(self._bars, ensure_ascii=False, indent=1, sort_keys=True)
+            self._dirty = False
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"  일봉 캐시 저장 오류: {e}")
+
+
+# 기본 캐시 (data/stock/last_bars.json)
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_bar_cache() -> BarCache:
+    """config.STOCK_DIR의 last_bars.json 캐시 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = BarCache(os.path.join(config.STOCK_DIR, "last_bars.json"))
+        return _cache
+
+
+if __name__ == "__main__":
+    from datetime import timezone
+
+    now_utc = datetime.now(timezone.utc)
+    cache = get_bar_cache()
+    all_tickers = {**config.KR_TICKERS, **config.US_TICKERS}
+    names = {ticker: name for name, ticker in all_tickers.items()}
+
+    targets = {}
+    for ticker in names:
+        exchange = "KRX" if ticker.endswith((".KS", ".KQ")) or ticker.startswith("^K") else "NYSE"
+        targets[ticker] = trading_calendar.target_session(exchange, now_utc)
+
+    waiting = cache.waiting(targets)
+    print(f"last_bars.json: {len(cache)}종목, 당일 일봉 대기 {len(waiting)}종목")
+    for ticker, last in waiting:
+        print(f"  {names[ticker]} ({ticker}): 목표 {targets[ticker]}, 최신 {last or '-'}")
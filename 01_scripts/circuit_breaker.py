@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서킷 브레이커 (Circuit Breaker)
+===============================
+데이터 소스(yahoo, ecos)가 죽어 있을 때 남은 요청이 타임아웃/재시도를 반복하지 않도록 차단
+
+상태:
+    closed: 정상 (모든 요청 허용)
+    open: 차단 (요청 없이 즉시 CIRCUIT_OPEN 오류 반환)
+    half_open: 쿨다운 경과 후 시험 요청 1건만 허용
+        → 성공하면 closed, 실패하면 다시 open
+        → 시험 요청이 끝날 때까지 같은 소스의 다른 요청은 대기
+
+- 한 실행 안에서 연속 실패가 소스별 임계치에 도달하면 open
+- open 상태와 시각은 CIRCUIT_STATE_FILE(JSON)에 저장되어 다음 실행으로 이어짐
+  (cron 간격이 쿨다운보다 길면 다음 실행은 half_open 시험 요청부터 시작)
+- 연속 실패 횟수는 실행마다 새로 셈
+
+설정 (.env):
+    CIRCUIT_BREAKER_ENABLED: 사용 여부 (기본 1)
+    CIRCUIT_THRESHOLD_YAHOO / CIRCUIT_THRESHOLD_ECOS: 연속 실패 임계치
+    CIRCUIT_COOLDOWN_SEC: open → half_open 대기 시간 (초, 기본 1800)
+
+사용법:
+    from circuit_breaker import get_breaker, CIRCUIT_OPEN
+    breaker = get_breaker("yahoo")
+    if not breaker.allow():
+        return None, 'error', CIRCUIT_OPEN
+    ok = ...  # 요청 수행
+    breaker.record(ok)
+
+Created: 2026-10-18
+"""
+
+import json
+import os
+import threading
+import time
+
+from config import config
+
+# 차단으로 건너뛴 항목의 오류 문자열 (status: "error: circuit_open")
+CIRCUIT_OPEN = "circuit_open"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """소스 1개의 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(self, name: str, threshold: int, cooldown: float,
+                 state: str = CLOSED, opened_at: float = 0.0, on_change=None):
+        """
+        Args:
+            name: 소스 이름 (yahoo, ecos)
+            threshold: open으로 전환할 연속 실패 횟수 (0 이하면 차단하지 않음)
+            cooldown: open 후 half_open 전환까지 대기 (초)
+            state, opened_at: 이전 실행에서 이어받은 상태
+            on_change: 상태가 바뀔 때 호출 (저장용, breaker를 인자로 받음)
+        """
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        # 시험 요청 도중 종료된 경우도 open으로 복원
+        self.state = OPEN if state == HALF_OPEN else state
+        self.opened_at = opened_at
+        self.failures = 0
+        self.rejected = 0  # 차단으로 건너뛴 요청 수
+        self._on_change = on_change
+        self._cond = threading.Condition()
+
+    def allow(self) -> bool:
+        """요청 가능 여부 (half_open 시험 요청 중이면 결과가 나올 때까지 대기)"""
+        with self._cond:
+            while True:
+                if self.state == CLOSED:
+                    return True
+                if self.state == OPEN:
+                    if time.time() - self.opened_at < self.cooldown:
+                        self.rejected += 1
+                        return False
+                    self.state = HALF_OPEN  # 이 호출이 시험 요청
+                    return True
+                self._cond.wait()
+
+    def record(self, ok: bool):
+        """요청 결과 기록 (재시도를 모두 거친 최종 결과 기준)"""
+        with self._cond:
+            previous = self.state
+            if ok:
+                self.failures = 0
+                self.state = CLOSED
+            else:
+                self.failures += 1
+                if self.state == HALF_OPEN or (
+                    self.state == CLOSED and 0 < self.threshold <= self.failures
+                ):
+                    self.state = OPEN
+                    self.opened_at = time.time()
+            changed = self.state != previous
+            self._cond.notify_all()
+
+        if changed:
+            if self.state == OPEN:
+                print(f"  ⚡ {self.name} 서킷 open (연속 실패 {self.failures}회) → 남은 요청 건너뜀")
+            elif previous == HALF_OPEN:
+                print(f"  ⚡ {self.name} 서킷 closed (시험 요청 성공)")
+            if self._on_change:
+                self._on_change(self)
+
+    @property
+    def is_open(self) -> bool:
+        """차단 중 여부 (재시도 도중 다른 스레드가 차단했는지 확인용)"""
+        return self.state == OPEN
+
+
+# 소스별 브레이커 (프로세스 공유) + 상태 파일
+_breakers = {}
+_breakers_lock = threading.Lock()
+_state_lock = threading.Lock()
+
+
+def _threshold(name: str) -> int:
+    thresholds = {
+        "yahoo": config.CIRCUIT_THRESHOLD_YAHOO,
+        "ecos": config.CIRCUIT_THRESHOLD_ECOS,
+    }
+    return thresholds.get(name, 0)
+
+
+def _load_state() -> dict:
+    try:
+        with open(config.CIRCUIT_STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(breaker: CircuitBreaker):
+    """상태 파일에서 이 브레이커 항목만 갱신 (원자적 교체)"""
+    with _state_lock:
+        states = _load_state()
+        states[breaker.name] = {
+            "state": OPEN if breaker.state == HALF_OPEN else breaker.state,
+            "opened_at": breaker.opened_at,
+        }
+        tmp_path = f"{config.CIRCUIT_STATE_FILE}.tmp"
+        try:
+            os.makedirs(os.path.dirname(config.CIRCUIT_STATE_FILE), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(states, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, config.CIRCUIT_STATE_FILE)
+        except OSError as e:
+            print(f"  서킷 상태 저장 오류: {e}")
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """소스별 공유 브레이커 반환 (CIRCUIT_BREAKER_ENABLED=0이면 항상 허용)"""
+    with _breakers_lock:
+        if name not in _breakers:
+            if config.CIRCUIT_BREAKER_ENABLED:
+                saved = _load_state().get(name, {})
+                _breakers[name] = CircuitBreaker(
+                    name, _threshold(name), config.CIRCUIT_COOLDOWN_SEC,
+                    state=saved.get("state", CLOSED),
+                    opened_at=float(saved.get("opened_at", 0.0)),
+                    on_change=_save_state,
+                )
+            else:
+                _breakers[name] = CircuitBreaker(name, 0, 0)
+        return _breakers[name]
+
+
+def summarize() -> list:
+    """
+    차단이 발생했거나 closed가 아닌 브레이커 목록 (출력용)
+
+    Returns:
+        list: [{'name', 'state', 'rejected'}, ...]
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return [
+        {"name": b.name, "state": b.state, "rejected": b.rejected}
+        for b in breakers if b.rejected or b.state != CLOSED
+    ]
@@ -4,6 +4,7 @@
 수집 로그 모듈 (Collection Logger)
 ==================================
 데이터 수집 작업의 실행 시간, 성공/실패 건수를 InfluxDB에 저장
+(influx_writer 공유 Writer의 배치 큐에 적재 → 수집 종료 시 한꺼번에 전송)
 
 Measurement: system_logs
 Tags: task_name (news, stock, economy, total)
@@ -17,10 +18,12 @@ import time
 from datetime import datetime, timezone
 from config import config
 
+# InfluxDB 공용 Writer (수집기와 같은 배치 큐 사용)
+from influx_writer import get_writer
+
 # InfluxDB 클라이언트 (선택적 import)
 try:
-    from influxdb_client import InfluxDBClient, Point, WritePrecision
-    from influxdb_client.client.write_api import SYNCHRONOUS
+    from influxdb_client import Point, WritePrecision
     INFLUXDB_AVAILABLE = True
 except ImportError:
     INFLUXDB_AVAILABLE = False
@@ -95,12 +98,6 @@ class CollectionLogger:
             return
 
         try:
-            client = InfluxDBClient(
-                url=config.INFLUXDB_URL,
-                token=config.INFLUXDB_TOKEN,
-                org=config.INFLUXDB_ORG
-            )
-
             point = Point("system_logs") \
                 .tag("task_name", result['task_name']) \
                 .field("execution_time_ms", result['execution_time_ms']) \
@@ -110,10 +107,7 @@ class CollectionLogger:
                 .field("error_rate", result['error_rate']) \
                 .time(datetime.now(timezone.utc), WritePrecision.S)
 
-            write_api = client.write_api(write_options=SYNCHRONOUS)
-            write_api.write(bucket=config.INFLUXDB_BUCKET, record=point)
-
-            client.close()
+            get_writer().write(point)
 
         except Exception as e:
             print(f"  로그 저장 오류: {e}")
@@ -138,12 +132,6 @@ def log_collection_result(task_name: str, success: int, fail: int,
     error_rate = (fail / total * 100) if total > 0 else 0.0
 
     try:
-        client = InfluxDBClient(
-            url=config.INFLUXDB_URL,
-            token=config.INFLUXDB_TOKEN,
-            org=config.INFLUXDB_ORG
-        )
-
         point = Point("system_logs") \
             .tag("task_name", task_name) \
             .field("execution_time_ms", execution_time_ms) \
@@ -153,10 +141,7 @@ def log_collection_result(task_name: str, success: int, fail: int,
             .field("error_rate", round(error_rate, 2)) \
             .time(datetime.now(timezone.utc), WritePrecision.S)
 
-        write_api = client.write_api(write_options=SYNCHRONOUS)
-        write_api.write(bucket=config.INFLUXDB_BUCKET, record=point)
-
-        client.close()
+        get_writer().write(point)
         print(f"  📊 로그 저장: {task_name} ({execution_time_ms}ms, 성공:{success}, 실패:{fail})")
 
     except Exception as e:
@@ -47,6 +47,10 @@ class Config:
     NEWS_DIR = str(Path(BASE_DIR) / "data" / "news")
     STOCK_DIR = str(Path(BASE_DIR) / "data" / "stock")
     ECONOMY_DIR = str(Path(BASE_DIR) / "data" / "economy")
+    CACHE_DIR = str(Path(BASE_DIR) / "data" / ".cache")
+    CIRCUIT_STATE_FILE = str(Path(BASE_DIR) / "data" / "circuit_state.json")
+    BACKFILL_CHECKPOINT_FILE = str(Path(BASE_DIR) / "data" / "backfill_checkpoint.json")
+    ADAPTIVE_BATCH_STATE_FILE = str(Path(BASE_DIR) / "data" / "batch_size.json")
 
     # ========================================
     # API 키 (환경변수에서 로드)
@@ -64,17 +68,60 @@ class Config:
         """한국은행 ECOS API 키"""
         return os.getenv('BOK_API_KEY')
 
+    @property
+    def ECOS_PAGE_SIZE(self):
+        """ECOS StatisticSearch 1회 요청당 최대 행 수 (초과 시 페이지 순회)"""
+        return int(os.getenv('ECOS_PAGE_SIZE', '10000'))
+
     @property
     def FRED_API_KEY(self):
         """FRED API 키"""
         return os.getenv('FRED_API_KEY')
 
+    # ========================================
+    # 외부 API 주소 (FAKE_UPSTREAM_URL 설정 시 로컬 대역 서버로 전환)
+    # ========================================
+    @property
+    def FAKE_UPSTREAM_URL(self):
+        """로컬 대역 서버 주소 (fake_upstreams.py, 설정 시 아래 주소와 InfluxDB/Grafana 주소보다 우선)"""
+        return os.getenv('FAKE_UPSTREAM_URL', '').rstrip('/')
+
+    def _upstream(self, prefix: str, env_name: str, default: str) -> str:
+        if self.FAKE_UPSTREAM_URL:
+            return f"{self.FAKE_UPSTREAM_URL}{prefix}"
+        return os.getenv(env_name, default).rstrip('/')
+
+    @property
+    def NAVER_API_BASE(self):
+        """네이버 검색 API 주소"""
+        return self._upstream('/naver', 'NAVER_API_BASE', 'https://openapi.naver.com')
+
+    @property
+    def ECOS_API_BASE(self):
+        """한국은행 ECOS API 주소"""
+        return self._upstream('/ecos/api', 'ECOS_API_BASE', 'https://ecos.bok.or.kr/api')
+
+    @property
+    def FRED_API_BASE(self):
+        """FRED API 주소 (fredapi root_url)"""
+        return self._upstream('/fred', 'FRED_API_BASE', 'https://api.stlouisfed.org/fred')
+
+    @property
+    def TELEGRAM_API_BASE(self):
+        """Telegram Bot API 주소"""
+        return self._upstream('/telegram', 'TELEGRAM_API_BASE', 'https://api.telegram.org')
+
+    @property
+    def YAHOO_API_BASE(self):
+        """Yahoo Finance 주소 (비어 있으면 yfinance 기본 주소 사용)"""
+        return self._upstream('/yahoo', 'YAHOO_API_BASE', '')
+
     # ========================================
     # InfluxDB 설정
     # ========================================
     @property
     def INFLUXDB_URL(self):
-        return os.getenv('INFLUXDB_URL', 'http://localhost:8086')
+        return self._upstream('/influx', 'INFLUXDB_URL', 'http://localhost:8086')
 
     @property
     def INFLUXDB_TOKEN(self):
@@ -88,12 +135,67 @@ class Config:
     def INFLUXDB_BUCKET(self):
         return os.getenv('INFLUXDB_BUCKET', 'econ_market')
 
+    @property
+    def INFLUXDB_WRITE_BATCH_SIZE(self):
+        """공유 Writer 배치 크기 (한 요청에 묶을 최대 포인트 수)"""
+        return max(1, int(os.getenv('INFLUXDB_WRITE_BATCH_SIZE', '1000')))
+
+    @property
+    def INFLUXDB_FLUSH_INTERVAL_MS(self):
+        """공유 Writer 자동 flush 주기 (ms)"""
+        return max(100, int(os.getenv('INFLUXDB_FLUSH_INTERVAL_MS', '30000')))
+
+    @property
+    def INFLUXDB_GZIP(self):
+        """write 요청 본문 gzip 압축 여부"""
+        return os.getenv('INFLUXDB_GZIP', '1') not in ('0', 'false', 'False')
+
+    @property
+    def INFLUXDB_GZIP_LEVEL(self):
+        """gzip 압축 레벨 (1~9)"""
+        return min(9, max(1, int(os.getenv('INFLUXDB_GZIP_LEVEL', '1'))))
+
+    @property
+    def INFLUXDB_GZIP_MIN_BYTES(self):
+        """이 크기(바이트) 미만 본문은 압축 생략"""
+        return max(0, int(os.getenv('INFLUXDB_GZIP_MIN_BYTES', '1024')))
+
+    @property
+    def ADAPTIVE_BATCH_ENABLED(self):
+        """적응형(AIMD) 배치 크기 사용 여부 (0이면 시작 크기 고정)"""
+        return os.getenv('ADAPTIVE_BATCH_ENABLED', '1') not in ('0', 'false', 'False')
+
+    @property
+    def ADAPTIVE_BATCH_MIN(self):
+        """적응형 배치 크기 하한"""
+        return max(1, int(os.getenv('ADAPTIVE_BATCH_MIN', '50')))
+
+    @property
+    def ADAPTIVE_BATCH_MAX(self):
+        """적응형 배치 크기 상한"""
+        return max(1, int(os.getenv('ADAPTIVE_BATCH_MAX', '5000')))
+
+    @property
+    def ADAPTIVE_BATCH_STEP(self):
+        """목표 지연 안에 끝났을 때 증가 폭"""
+        return max(1, int(os.getenv('ADAPTIVE_BATCH_STEP', '100')))
+
+    @property
+    def ADAPTIVE_BATCH_DECREASE(self):
+        """지연/타임아웃/실패 시 감소 배율"""
+        return float(os.getenv('ADAPTIVE_BATCH_DECREASE', '0.5'))
+
+    @property
+    def ADAPTIVE_BATCH_TARGET_MS(self):
+        """목표 쓰기 지연 (ms)"""
+        return max(1, int(os.getenv('ADAPTIVE_BATCH_TARGET_MS', '1000')))
+
     # ========================================
     # Grafana 설정
     # ========================================
     @property
     def GRAFANA_URL(self):
-        return os.getenv('GRAFANA_URL', 'http://localhost:3000')
+        return self._upstream('/grafana', 'GRAFANA_URL', 'http://localhost:3000')
 
     @property
     def GRAFANA_USER(self):
@@ -122,14 +224,173 @@ class Config:
         return bool(self.TELEGRAM_BOT_TOKEN and self.TELEGRAM_CHAT_ID
                     and self.TELEGRAM_BOT_TOKEN != 'YOUR_BOT_TOKEN_HERE')
 
+    # ========================================
+    # HTTP 세션 설정 (http_session.py)
+    # ========================================
+    @property
+    def HTTP_POOL_CONNECTIONS(self):
+        """세션당 캐시할 호스트별 커넥션 풀 수"""
+        return max(1, int(os.getenv('HTTP_POOL_CONNECTIONS', '8')))
+
+    @property
+    def HTTP_POOL_MAXSIZE(self):
+        """호스트당 최대 커넥션 수"""
+        return max(1, int(os.getenv('HTTP_POOL_MAXSIZE', '8')))
+
+    @property
+    def HTTP_RETRY_TOTAL(self):
+        """429/5xx 최대 재시도 횟수"""
+        return max(0, int(os.getenv('HTTP_RETRY_TOTAL', '3')))
+
+    @property
+    def HTTP_RETRY_BACKOFF(self):
+        """재시도 백오프 계수 (초)"""
+        return float(os.getenv('HTTP_RETRY_BACKOFF', '0.5'))
+
+    # ========================================
+    # 응답 캐시 (data/.cache)
+    # ========================================
+    @property
+    def RESPONSE_CACHE_BYPASS(self):
+        """1이면 응답 캐시 읽기 생략 (새 응답으로 갱신만 수행)"""
+        return os.getenv('RESPONSE_CACHE_BYPASS', '0') in ('1', 'true', 'True')
+
+    @property
+    def RESPONSE_CACHE_MAX_MB(self):
+        """응답 캐시 최대 크기 (MB, 초과 시 LRU 삭제)"""
+        return float(os.getenv('RESPONSE_CACHE_MAX_MB', '50'))
+
+    @property
+    def CACHE_TTL_DAILY(self):
+        """일간 시계열(환율, 콜금리, 원자재 5일 히스토리) 캐시 TTL (초)"""
+        return float(os.getenv('CACHE_TTL_DAILY', '3600'))
+
+    @property
+    def CACHE_TTL_MONTHLY(self):
+        """월간/분기 시계열(기준금리 등) 캐시 TTL (초)"""
+        return float(os.getenv('CACHE_TTL_MONTHLY', '43200'))
+
+    # ========================================
+    # 요청 속도 제한 / 재시도 백오프
+    # ========================================
+    @property
+    def RATE_LIMIT_YAHOO(self):
+        """Yahoo Finance 초당 요청 수 상한 (0이면 제한 없음)"""
+        return float(os.getenv('RATE_LIMIT_YAHOO', '5'))
+
+    @property
+    def RATE_LIMIT_ECOS(self):
+        """ECOS API 초당 요청 수 상한"""
+        return float(os.getenv('RATE_LIMIT_ECOS', '5'))
+
+    @property
+    def RATE_LIMIT_FRED(self):
+        """FRED API 초당 요청 수 상한 (공식 한도 120회/분)"""
+        return float(os.getenv('RATE_LIMIT_FRED', '2'))
+
+    @property
+    def RATE_LIMIT_NAVER(self):
+        """네이버 검색 API 초당 요청 수 상한 (공식 한도 10회/초)"""
+        return float(os.getenv('RATE_LIMIT_NAVER', '10'))
+
+    @property
+    def RETRY_BACKOFF_BASE(self):
+        """재시도 백오프 기본 대기 (초, 회차마다 2배)"""
+        return float(os.getenv('RETRY_BACKOFF_BASE', '1.0'))
+
+    @property
+    def RETRY_BACKOFF_CAP(self):
+        """재시도 백오프 최대 대기 (초)"""
+        return float(os.getenv('RETRY_BACKOFF_CAP', '30'))
+
+    # ========================================
+    # 서킷 브레이커 (소스 장애 시 빠른 실패)
+    # ========================================
+    @property
+    def CIRCUIT_BREAKER_ENABLED(self):
+        """소스별 서킷 브레이커 사용 여부"""
+        return os.getenv('CIRCUIT_BREAKER_ENABLED', '1') not in ('0', 'false', 'False')
+
+    @property
+    def CIRCUIT_THRESHOLD_YAHOO(self):
+        """Yahoo Finance 연속 실패 허용 횟수 (종목 단위, 초과 시 차단)"""
+        return int(os.getenv('CIRCUIT_THRESHOLD_YAHOO', '5'))
+
+    @property
+    def CIRCUIT_THRESHOLD_ECOS(self):
+        """ECOS 연속 실패 허용 횟수 (요청 단위, 실행당 요청이 3회 내외라 낮게 설정)"""
+        return int(os.getenv('CIRCUIT_THRESHOLD_ECOS', '2'))
+
+    @property
+    def CIRCUIT_COOLDOWN_SEC(self):
+        """차단 후 시험 요청(half-open)까지 대기 시간 (초, 실행 간에도 유지)"""
+        return float(os.getenv('CIRCUIT_COOLDOWN_SEC', '1800'))
+
     # ========================================
     # 수집 설정
     # ========================================
     # 뉴스 키워드
     NEWS_KEYWORDS = ["경제", "부동산", "반도체", "코스피"]
 
-    # 배치 크기 (InfluxDB 적재용)
-    BATCH_SIZE = 500
+    @property
+    def COLLECT_MODE(self):
+        """수집 실행 방식: async(뉴스/주가/경제지표 병렬) 또는 sequential"""
+        return os.getenv('COLLECT_MODE', 'async').lower()
+
+    @property
+    def TRACING_ENABLED(self):
+        """단계별 실행 시간(span) 기록 여부 (collector_spans measurement)"""
+        return os.getenv('TRACING_ENABLED', '1') not in ('0', 'false', 'False')
+
+    @property
+    def COLLECT_TIMEOUT_NEWS(self):
+        """병렬 수집 시 뉴스 단계 제한 시간 (초)"""
+        return float(os.getenv('COLLECT_TIMEOUT_NEWS', '60'))
+
+    @property
+    def COLLECT_TIMEOUT_STOCK(self):
+        """병렬 수집 시 주가 단계 제한 시간 (초)"""
+        return float(os.getenv('COLLECT_TIMEOUT_STOCK', '300'))
+
+    @property
+    def COLLECT_TIMEOUT_ECONOMY(self):
+        """병렬 수집 시 경제지표 단계 제한 시간 (초)"""
+        return float(os.getenv('COLLECT_TIMEOUT_ECONOMY', '120'))
+
+    @property
+    def COMMODITY_BULK_WAIT_SEC(self):
+        """원자재 시세를 주가 일괄 다운로드에서 받기 위해 기다리는 최대 시간 (초)"""
+        return float(os.getenv('COMMODITY_BULK_WAIT_SEC', '60'))
+
+    @property
+    def STOCK_FETCH_WORKERS(self):
+        """주가 병렬 수집 워커 수 (1이면 순차 수집)"""
+        return max(1, int(os.getenv('STOCK_FETCH_WORKERS', '8')))
+
+    @property
+    def YAHOO_MAX_CONCURRENCY(self):
+        """Yahoo Finance 호스트 동시 요청 상한 (워커 수와 별개)"""
+        return max(1, int(os.getenv('YAHOO_MAX_CONCURRENCY', '4')))
+
+    @property
+    def STOCK_STORE_COMPACT_RATIO(self):
+        """stock.csv 중복(dead) 행 비율이 이 값을 넘으면 compaction"""
+        return float(os.getenv('STOCK_STORE_COMPACT_RATIO', '0.3'))
+
+    @property
+    def STOCK_BULK_DOWNLOAD(self):
+        """시장별 일괄 다운로드 사용 여부 (0이면 종목별 조회)"""
+        return os.getenv('STOCK_BULK_DOWNLOAD', '1') not in ('0', 'false', 'False')
+
+    @property
+    def STOCK_BULK_WINDOW_DAYS(self):
+        """일괄 다운로드 조회 구간 (목표 거래일 기준 과거 N일)"""
+        return max(1, int(os.getenv('STOCK_BULK_WINDOW_DAYS', '7')))
+
+    @property
+    def BAR_CACHE_ENABLED(self):
+        """목표일 일봉이 없을 때 캐시된 직전 거래일 일봉 사용 (0이면 항상 5d 재요청)"""
+        return os.getenv('BAR_CACHE_ENABLED', '1') not in ('0', 'false', 'False')
 
     # ========================================
     # 종목 리스트
@@ -230,6 +491,12 @@ class Config:
         "GLD": "GLD",
     }
 
+    # 원자재 (yfinance, 미국 종목 일괄 다운로드에 함께 포함)
+    COMMODITY_TICKERS = {
+        "WTI 유가": "CL=F",
+        "금 선물": "GC=F",
+    }
+
     # FRED 경제지표
     FRED_INDICATORS = {
         'GDP': '미국 GDP',
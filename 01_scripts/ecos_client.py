@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한국은행 ECOS 클라이언트 (ECOS Client)
+======================================
+StatisticSearch 호출을 통계표 단위로 묶어서 요청 수(=API 쿼터)를 절감
+
+- 요청 지표를 (통계표, 주기, 시작, 종료) 기준으로 그룹화
+- 지표가 2개 이상인 그룹은 항목코드 없이 통계표 전체를 1회 조회한 뒤
+  ITEM_CODE1 기준으로 지표별 행을 분배 (예: 원/달러·원/엔·원/유로 → 731Y001 1회)
+- list_total_count 기준으로 페이지 단위 조회 (1회 최대 ECOS_PAGE_SIZE행)
+- 통계표 전체 조회가 항목별 조회보다 요청 수가 많아지면(장기간 + 항목 많은 표)
+  항목별 조회로 전환
+- 정상 응답은 응답 캐시(response_cache)에 주기별 TTL로 저장
+  (일간 CACHE_TTL_DAILY, 월간/분기 CACHE_TTL_MONTHLY) → TTL 이내 재조회 생략
+- 서킷 브레이커(ecos)가 open이면 요청 없이 "error: circuit_open" 반환
+
+설정 (.env):
+    ECOS_PAGE_SIZE: 1회 요청당 최대 행 수 (기본 10000)
+
+사용법:
+    from ecos_client import EcosClient
+    client = EcosClient(config.BOK_API_KEY)
+    results = client.fetch_indicators([
+        ("원/달러 환율", "731Y001", "0000001", "D", "20251201", "20251208"),
+        ("원/엔 환율", "731Y001", "0000002", "D", "20251201", "20251208"),
+    ])
+    rows, error = results["원/달러 환율"]
+
+Created: 2026-10-18
+"""
+
+import math
+from collections import OrderedDict
+
+from circuit_breaker import CIRCUIT_OPEN, get_breaker
+from config import config
+from http_session import get_session
+from response_cache import get_cache, normalize_url, ttl_for_cycle
+
+# ECOS 결과 코드: 데이터 없음 (오류 아님)
+NO_DATA_CODE = "INFO-200"
+
+
+class EcosClient:
+    """StatisticSearch 그룹 조회 클라이언트"""
+
+    def __init__(self, api_key: str, page_size: int = None, timeout: int = 30):
+        """
+        Args:
+            api_key: ECOS 인증키
+            page_size: 1회 요청당 최대 행 수 (기본: config.ECOS_PAGE_SIZE)
+            timeout: 요청 타임아웃 (초)
+        """
+        self.api_key = api_key
+        self.page_size = page_size or config.ECOS_PAGE_SIZE
+        self.timeout = timeout
+        self.session = get_session("ecos")
+        self.cache = get_cache()
+        self.breaker = get_breaker("ecos")
+        self.requests_made = 0
+        self.cache_hits = 0
+
+    def _get_page(self, stat_code, cycle, start, end, item_code, first, last) -> tuple:
+        """
+        StatisticSearch 1페이지 조회
+
+        Returns:
+            tuple: (행 리스트, 전체 행 수, 오류) - 데이터 없음은 ([], 0, None)
+        """
+        url = (
+            f"{config.ECOS_API_BASE}/StatisticSearch/{self.api_key}/json/kr/{first}/{last}"
+            f"/{stat_code}/{cycle}/{start}/{end}"
+        )
+        if item_code:
+            url += f"/{item_code}"
+
+        cache_key = normalize_url(url, secrets=(self.api_key,))
+        data = self.cache.get_json(cache_key, ttl_for_cycle(cycle))
+        if data is not None:
+            self.cache_hits += 1
+        else:
+            if not self.breaker.allow():
+                return [], 0, f"error: {CIRCUIT_OPEN}"
+            self.requests_made += 1
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except Exception as e:
+                self.breaker.record(False)
+                return [], 0, f"error: {str(e)[:50]}"
+            # 서버가 응답했으면(4xx 포함) 장애 아님, 5xx/429만 실패로 계산
+            self.breaker.record(response.status_code < 500 and response.status_code != 429)
+            if response.status_code != 200:
+                return [], 0, f"error_code_{response.status_code}"
+            try:
+                data = response.json()
+            except ValueError as e:
+                return [], 0, f"error: {str(e)[:50]}"
+            if "StatisticSearch" in data or data.get("RESULT", {}).get("CODE") == NO_DATA_CODE:
+                self.cache.put_json(cache_key, data)
+
+        if "StatisticSearch" in data:
+            body = data["StatisticSearch"]
+            return body.get("row", []), int(body.get("list_total_count", 0)), None
+
+        result = data.get("RESULT", {})
+        if result.get("CODE") == NO_DATA_CODE:
+            return [], 0, None
+        return [], 0, f"error: {result.get('CODE', 'unknown')} {result.get('MESSAGE', '')}"[:60]
+
+    def fetch_rows(self, stat_code: str, cycle: str, start: str, end: str,
+                   item_code: str = "", max_pages: int = None) -> tuple:
+        """
+        통계표(또는 단일 항목) 전체 행 조회 (페이지 순회)
+
+        Args:
+            stat_code, cycle, start, end: StatisticSearch 조회 조건
+            item_code: 항목코드 (빈 문자열이면 통계표 전체)
+            max_pages: 전체 페이지 수가 이 값을 넘으면 첫 페이지 이후 중단
+
+        Returns:
+            tuple: (행 리스트, 오류 문자열 또는 None, 전체 페이지 수)
+        """
+        rows, total, error = self._get_page(stat_code, cycle, start, end, item_code, 1, self.page_size)
+        if error:
+            return [], error, 0
+
+        pages = max(1, math.ceil(total / self.page_size))
+        if max_pages is not None and pages > max_pages:
+            return rows, None, pages
+
+        while len(rows) < total:
+            first = len(rows) + 1
+            page, _, error = self._get_page(
+                stat_code, cycle, start, end, item_code, first, first + self.page_size - 1
+            )
+            if error:
+                return rows, error, pages
+            if not page:
+                break
+            rows.extend(page)
+
+        return rows, None, pages
+
+    def fetch_indicators(self, indicators: list) -> "OrderedDict":
+        """
+        여러 지표를 통계표 단위로 묶어서 조회
+
+        Args:
+            indicators: (지표명, 통계표코드, 항목코드, 주기, 시작, 종료) 튜플 리스트
+                항목코드가 빈 문자열이면 통계표 전체 행을 해당 지표로 반환
+
+        Returns:
+            OrderedDict: {지표명: (TIME 오름차순 행 리스트, 오류 또는 None)} (입력 순서 유지)
+        """
+        groups = OrderedDict()
+        for name, stat_code, item_code, cycle, start, end in indicators:
+            groups.setdefault((stat_code, cycle, start, end), []).append((name, item_code))
+
+        results = OrderedDict((ind[0], ([], None)) for ind in indicators)
+
+        for (stat_code, cycle, start, end), members in groups.items():
+            if len(members) == 1:
+                name, item_code = members[0]
+                rows, error, _ = self.fetch_rows(stat_code, cycle, start, end, item_code)
+                results[name] = (_sorted_by_time(rows), error)
+                continue
+
+            # 항목코드 없는 지표가 있으면 어차피 통계표 전체가 필요
+            needs_table = any(not item_code for _, item_code in members)
+            max_pages = None if needs_table else len(members) - 1
+
+            rows, error, pages = self.fetch_rows(stat_code, cycle, start, end, "", max_pages=max_pages)
+            if error:
+                for name, _ in members:
+                    results[name] = ([], error)
+                continue
+
+            if max_pages is not None and pages > max_pages:
+                # 통계표 전체가 너무 큼 → 항목별 조회
+                for name, item_code in members:
+                    item_rows, item_error, _ = self.fetch_rows(stat_code, cycle, start, end, item_code)
+                    results[name] = (_sorted_by_time(item_rows), item_error)
+                continue
+
+            by_item = {}
+            for row in rows:
+                by_item.setdefault(row.get("ITEM_CODE1"), []).append(row)
+            for name, item_code in members:
+                item_rows = rows if not item_code else by_item.get(item_code, [])
+                results[name] = (_sorted_by_time(item_rows), None)
+
+        return results
+
+
+def _sorted_by_time(rows: list) -> list:
+    return sorted(rows, key=lambda row: row.get("TIME", ""))
@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 대역 서버 (Fake Upstreams)
+===============================
+외부 API를 흉내 내는 로컬 HTTP 서버 (실 API 없이 수집 성능 측정/회귀 확인용)
+
+- 서버 1개가 경로 접두사로 7개 연동 대상을 모두 처리
+  /yahoo     Yahoo chart(v8) + yfinance 쿠키/crumb
+  /ecos/api  ECOS StatisticSearch (list_total_count, 페이지 범위 처리)
+  /fred      FRED series/observations (fredapi가 읽는 XML)
+  /naver     네이버 뉴스 검색 (v1/search/news.json)
+  /telegram  Telegram Bot API (sendMessage, getUpdates)
+  /influx    InfluxDB v2 (write, query, health, ping) - 적재 라인 수 집계
+  /grafana   Grafana HTTP API (health, dashboards/db, datasources)
+- 합성 응답은 종목/지표/날짜 기준 결정적 값 → 같은 요청은 항상 같은 응답
+- 녹화 응답: fixtures 디렉터리에 <서비스>/<경로> 파일이 있으면 합성 대신 그대로 반환
+  (예: fixtures/yahoo/v8/finance/chart/AAPL.json)
+- 장애 모사 (서비스별 지정 가능): 응답 지연 + 지터, 5xx 비율, 초당 요청 상한(초과 시 429)
+
+설정 (.env):
+    FAKE_UPSTREAM_URL: 설정하면 config의 API 주소와 InfluxDB/Grafana 주소가
+        모두 이 서버로 전환 (예: http://127.0.0.1:8900)
+
+사용법:
+    python 01_scripts/fake_upstreams.py --port 8900 --latency-ms 80 --jitter-ms 40
+    python 01_scripts/fake_upstreams.py --error-rate 0.05 --throttle-rps yahoo=5
+    eval "$(python 01_scripts/fake_upstreams.py --port 8900 --print-env)"
+    python 01_scripts/01_data_collector.py
+
+    # 코드에서 (벤치마크 등)
+    from fake_upstreams import start_server
+    server = start_server(latency_ms={"default": 50, "yahoo": 120})
+    os.environ.update(server.env())
+    ...
+    server.shutdown()
+
+Created: 2026-10-18
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+from zoneinfo import ZoneInfo
+
+SERVICES = ("yahoo", "ecos", "fred", "naver", "telegram", "influx", "grafana")
+
+# 통계표 전체 조회(항목코드 생략) 시 합성하는 항목코드
+ECOS_TABLE_ITEMS = ("0000001", "0000002", "0000003", "0000004")
+
+# Yahoo range 파라미터 → 조회 일수
+YAHOO_RANGE_DAYS = {
+    "1d": 1, "5d": 7, "1mo": 31, "3mo": 92, "6mo": 183,
+    "1y": 366, "2y": 731, "5y": 1827, "10y": 3653, "max": 5479,
+}
+
+# FAKE_UPSTREAM_URL만으로 수집 스크립트가 동작하도록 채우는 더미 인증값
+DUMMY_CREDENTIALS = {
+    "NAVER_CLIENT_ID": "fake-naver-id",
+    "NAVER_CLIENT_SECRET": "fake-naver-secret",
+    "BOK_API_KEY": "FAKEECOSKEY",
+    "FRED_API_KEY": "fakefredkey0000000000000000000000",
+    "INFLUXDB_TOKEN": "fake-influx-token",
+    "TELEGRAM_BOT_TOKEN": "0000000000:fake-telegram-token",
+    "TELEGRAM_CHAT_ID": "1",
+    "GRAFANA_PASSWORD": "fake",
+}
+
+
+# =============================================================================
+# 합성 데이터
+# =============================================================================
+
+def _seed(*parts) -> int:
+    return zlib.crc32("|".join(str(p) for p in parts).encode("utf-8"))
+
+
+def synthetic_price(key: str, day: date) -> float:
+    """키/날짜별 결정적 가격 (기준가 주변 완만한 주기 + 일별 잡음)"""
+    seed = _seed(key)
+    base = 50 + seed % 950
+    phase = (seed % 360) * math.pi / 180
+    wave = 1 + 0.25 * math.sin(day.toordinal() / 60 + phase)
+    noise = 1 + (_seed(key, day.toordinal()) % 2001 - 1000) / 50000  # ±2%
+    return round(base * wave * noise, 2)
+
+
+def _weekdays(start: date, end: date):
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            yield day
+        day += timedelta(days=1)
+
+
+def _exchange_tz(ticker: str) -> str:
+    if ticker.endswith((".KS", ".KQ")) or ticker in ("^KS11", "^KQ11"):
+        return "Asia/Seoul"
+    return "America/New_York"
+
+
+def yahoo_chart(ticker: str, query: dict) -> dict:
+    """v8/finance/chart 응답 (일봉, 평일만)"""
+    tz_name = _exchange_tz(ticker)
+    tz = ZoneInfo(tz_name)
+    now = int(time.time())
+    if "period1" in query:
+        start_ts = int(float(query["period1"]))
+        end_ts = int(float(query.get("period2", now)))
+    else:
+        end_ts = now
+        start_ts = now - YAHOO_RANGE_DAYS.get(query.get("range", "1mo"), 31) * 86400
+    start_day = datetime.fromtimestamp(start_ts, tz).date()
+    end_day = datetime.fromtimestamp(end_ts, tz).date()
+
+    timestamps, opens, highs, lows, closes, volumes = [], [], [], [], [], []
+    for day in _weekdays(start_day, end_day):
+        ts = int(datetime(day.year, day.month, day.day, 9, tzinfo=tz).timestamp())
+        if not start_ts <= ts < max(end_ts, start_ts + 1):
+            continue
+        close = synthetic_price(ticker, day)
+        prev = synthetic_price(ticker, day - timedelta(days=1))
+        timestamps.append(ts)
+        opens.append(prev)
+        highs.append(round(max(prev, close) * 1.01, 2))
+        lows.append(round(min(prev, close) * 0.99, 2))
+        closes.append(close)
+        volumes.append(100000 + _seed(ticker, "v", day.toordinal()) % 900000)
+
+    last_close = closes[-1] if closes else synthetic_price(ticker, end_day)
+    offset = int(datetime.now(tz).utcoffset().total_seconds())
+    meta = {
+        "currency": "KRW" if tz_name == "Asia/Seoul" else "USD",
+        "symbol": ticker,
+        "exchangeName": "KSC" if tz_name == "Asia/Seoul" else "NMS",
+        "fullExchangeName": "FAKE",
+        "instrumentType": "EQUITY",
+        "firstTradeDate": 946684800,
+        "regularMarketTime": now,
+        "hasPrePostMarketData": False,
+        "gmtoffset": offset,
+        "timezone": "KST" if tz_name == "Asia/Seoul" else "EST",
+        "exchangeTimezoneName": tz_name,
+        "regularMarketPrice": last_close,
+        "chartPreviousClose": opens[0] if opens else last_close,
+        "priceHint": 2,
+        "dataGranularity": query.get("interval", "1d"),
+        "range": query.get("range", ""),
+        "validRanges": list(YAHOO_RANGE_DAYS),
+    }
+    result = {"meta": meta, "indicators": {"quote": [{}], "adjclose": [{}]}}
+    if timestamps:
+        result["timestamp"] = timestamps
+        result["indicators"] = {
+            "quote": [{"open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes}],
+            "adjclose": [{"adjclose": closes}],
+        }
+    return {"chart": {"result": [result], "error": None}}
+
+
+def ecos_periods(cycle: str, start: str, end: str) -> list:
+    """ECOS 주기별 TIME 목록 (D: YYYYMMDD 평일, M: YYYYMM, Q: YYYYQn, A: YYYY)"""
+    try:
+        if cycle == "D":
+            first = datetime.strptime(start, "%Y%m%d").date()
+            last = datetime.strptime(end, "%Y%m%d").date()
+            return [d.strftime("%Y%m%d") for d in _weekdays(first, last)]
+        if cycle == "M":
+            y, m = int(start[:4]), int(start[4:6])
+            end_key = (int(end[:4]), int(end[4:6]))
+            periods = []
+            while (y, m) <= end_key:
+                periods.append(f"{y}{m:02d}")
+                y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+            return periods
+        if cycle == "Q":
+            y, q = int(start[:4]), int(start[5] if len(start) > 5 else 1)
+            end_key = (int(end[:4]), int(end[5] if len(end) > 5 else 4))
+            periods = []
+            while (y, q) <= end_key:
+                periods.append(f"{y}Q{q}")
+                y, q = (y + 1, 1) if q == 4 else (y, q + 1)
+            return periods
+        return [str(y) for y in range(int(start[:4]), int(end[:4]) + 1)]
+    except ValueError:
+        return []
+
+
+def ecos_statistic_search(segments: list) -> dict:
+    """StatisticSearch/{키}/json/kr/{시작행}/{끝행}/{통계표}/{주기}/{시작}/{종료}[/{항목}]"""
+    if len(segments) < 9:
+        return {"RESULT": {"CODE": "ERROR-100", "MESSAGE": "필수 값이 누락되어 있습니다."}}
+    first, last, stat_code, cycle, start, end = segments[3:9]
+    item_code = segments[9] if len(segments) > 9 and segments[9] else ""
+    items = (item_code,) if item_code else ECOS_TABLE_ITEMS
+
+    rows = []
+    periods = ecos_periods(cycle, start, end)
+    for item in items:
+        for period in periods:
+            day = date(int(period[:4]), 1, 1) + timedelta(days=_seed(period) % 365)
+            rows.append({
+                "STAT_CODE": stat_code,
+                "STAT_NAME": f"FAKE {stat_code}",
+                "ITEM_CODE1": item,
+                "ITEM_NAME1": f"항목 {item}",
+                "UNIT_NAME": "",
+                "TIME": period,
+                "DATA_VALUE": str(synthetic_price(f"{stat_code}/{item}", day)),
+            })
+    if not rows:
+        return {"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}}
+    first, last = max(1, int(first)), int(last)
+    return {"StatisticSearch": {"list_total_count": len(rows), "row": rows[first - 1:last]}}
+
+
+def fred_observations(query: dict) -> bytes:
+    """series/observations XML (fredapi 형식)"""
+    series_id = query.get("series_id", "")
+    start = query.get("observation_start") or "2010-01-01"
+    end = query.get("observation_end") or date.today().isoformat()
+    try:
+        first = datetime.strptime(start[:10], "%Y-%m-%d").date()
+        last = datetime.strptime(end[:10], "%Y-%m-%d").date()
+    except ValueError:
+        first, last = date(2010, 1, 1), date.today()
+
+    lines = ['<?xml version="1.0" encoding="utf-8" ?>',
+             f'<observations realtime_start="{date.today()}" realtime_end="{date.today()}" '
+             f'observation_start="{first}" observation_end="{last}" units="lin" '
+             f'output_type="1" file_type="xml" order_by="observation_date" sort_order="asc">']
+    day = date(first.year, first.month, 1)
+    while day <= last:
+        if day >= first:
+            lines.append(f'  <observation realtime_start="{date.today()}" realtime_end="{date.today()}" '
+                         f'date="{day}" value="{synthetic_price(series_id, day)}"/>')
+        day = date(day.year + 1, 1, 1) if day.month == 12 else date(day.year, day.month + 1, 1)
+    lines.append("</observations>")
+    return "\n".join(lines).encode("utf-8")
+
+
+def naver_news(query: dict) -> dict:
+    """뉴스 검색 응답 (링크는 검색어/순번/시간대별로 달라짐)"""
+    keyword = query.get("query", "")
+    display = min(100, int(query.get("display", 10)))
+    hour = int(time.time() // 3600)
+    pub_date = datetime.now(timezone(timedelta(hours=9))).strftime("%a, %d %b %Y %H:%M:%S +0900")
+    items = []
+    for i in range(display):
+        article_id = f"{_seed(keyword) % 1000:03d}{hour % 100000:05d}{i:02d}"
+        items.append({
+            "title": f"<b>{keyword}</b> 합성 기사 {i + 1}",
+            "originallink": f"https://fake.news.example/{article_id}",
+            "link": f"https://n.news.naver.com/mnews/article/999/{article_id}?sid=101",
+            "description": f"{keyword} 관련 로컬 대역 서버 합성 기사입니다.",
+            "pubDate": pub_date,
+        })
+    return {"lastBuildDate": pub_date, "total": 1000, "start": 1, "display": display, "items": items}
+
+
+# =============================================================================
+# 서버
+# =============================================================================
+
+class FakeUpstreamServer(ThreadingHTTPServer):
+    """경로 접두사별 대역 응답 + 지연/오류/요청 제한 모사"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, behaviors: dict = None, fixtures_dir: str = None, seed: int = 0):
+        """
+        Args:
+            address: (호스트, 포트) - 포트 0이면 빈 포트 자동 선택
+            behaviors: {'latency_ms'|'jitter_ms'|'error_rate'|'throttle_rps':
+                        {'default': 값, '<서비스>': 값}}
+            fixtures_dir: 녹화 응답 디렉터리 (없으면 합성만)
+            seed: 지연/오류 난수 시드
+        """
+        super().__init__(address, _Handler)
+        self.behaviors = behaviors or {}
+        self.fixtures_dir = fixtures_dir
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._windows = {}  # 서비스별 (초, 요청 수) - 요청 제한용
+        self.stats = {name: {"requests": 0, "errors": 0, "throttled": 0} for name in SERVICES}
+        self.influx_lines = 0
+        self.influx_bytes = 0
+        self.influx_wire_bytes = 0  # 압축 해제 전 (실제 전송) 크기
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict:
+        """이 서버를 가리키는 환경변수 (FAKE_UPSTREAM_URL + 미설정 인증값 더미)"""
+        values = {key: value for key, value in DUMMY_CREDENTIALS.items() if not os.getenv(key)}
+        values["FAKE_UPSTREAM_URL"] = self.base_url
+        return values
+
+    def behavior(self, name: str, service: str) -> float:
+        values = self.behaviors.get(name) or {}
+        return float(values.get(service, values.get("default", 0)))
+
+    def admit(self, service: str):
+        """
+        응답 전 지연 적용 후 모사할 오류 상태 반환 (정상이면 None)
+
+        Returns:
+            tuple 또는 None: (상태 코드, 추가 헤더)
+        """
+        latency = self.behavior("latency_ms", service)
+        jitter = self.behavior("jitter_ms", service)
+        error_rate = self.behavior("error_rate", service)
+        throttle = self.behavior("throttle_rps", service)
+
+        with self._lock:
+            self.stats[service]["requests"] += 1
+            delay = max(0.0, latency + self._rng.uniform(-jitter, jitter)) / 1000
+            failed = error_rate > 0 and self._rng.random() < error_rate
+            throttled = False
+            if throttle > 0:
+                second = int(time.time())
+                window, count = self._windows.get(service, (second, 0))
+                count = count + 1 if window == second else 1
+                self._windows[service] = (second, count)
+                throttled = count > throttle
+            if throttled:
+                self.stats[service]["throttled"] += 1
+            elif failed:
+                self.stats[service]["errors"] += 1
+
+        if delay:
+            time.sleep(delay)
+        if throttled:
+            return 429, {"Retry-After": "1"}
+        if failed:
+            return 503, {}
+        return None
+
+    def count_influx_write(self, body: bytes, wire_bytes: int):
+        lines = sum(1 for line in body.splitlines() if line.strip())
+        with self._lock:
+            self.influx_lines += lines
+            self.influx_bytes += len(body)
+            self.influx_wire_bytes += wire_bytes
+
+    def start(self) -> "FakeUpstreamServer":
+        """백그라운드 스레드에서 서비스 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-upstreams", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        super().shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (실 API와 같은 커넥션 재사용 조건)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self._wire_bytes = len(body)
+        if body and self.headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def _send(self, status: int, content_type: str = "application/json", payload=b"", headers: dict = None):
+        if isinstance(payload, (dict, list)):
+            payload = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        elif isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD" and payload:
+            self.wfile.write(payload)
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        service, _, rest = parts.path.lstrip("/").partition("/")
+        path = "/" + rest
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        body = self._read_body()
+
+        if service not in SERVICES:
+            self._send(404, payload={"error": f"unknown service: {service}"})
+            return
+
+        outcome = self.server.admit(service)
+        if outcome:
+            status, headers = outcome
+            self._send(status, payload={"error": "fake upstream failure"}, headers=headers)
+            return
+
+        if service == "influx" and path.endswith("/api/v2/write"):
+            self.server.count_influx_write(body, self._wire_bytes)
+
+        fixture = self._fixture(service, path)
+        if fixture is not None:
+            content_type = "application/xml" if fixture[:5] == b"<?xml" else "application/json"
+            self._send(200, content_type, fixture)
+            return
+
+        handler = getattr(self, f"_{service}")
+        self._send(*handler(method, path, query, body))
+
+    def _fixture(self, service: str, path: str):
+        if not self.server.fixtures_dir:
+            return None
+        base = os.path.join(self.server.fixtures_dir, service, *unquote(path).strip("/").split("/"))
+        for candidate in (base, f"{base}.json", f"{base}.xml"):
+            if os.path.isfile(candidate):
+                with open(candidate, "rb") as f:
+                    return f.read()
+        return None
+
+    # 서비스별 합성 응답: (상태 코드, Content-Type, 본문)
+    def _yahoo(self, method, path, query, body):
+        match = re.match(r"^/v8/finance/chart/([^/]+)", path)
+        if match:
+            return 200, "application/json", yahoo_chart(unquote(match.group(1)), query)
+        if path.startswith("/v1/test/getcrumb"):
+            return 200, "text/plain", "fakecrumb"
+        return 200, "text/html", ""  # fc.yahoo.com 쿠키 요청 등
+
+    def _ecos(self, method, path, query, body):
+        segments = [unquote(s) for s in path.strip("/").split("/")]
+        if len(segments) > 1 and segments[0] == "api" and segments[1] == "StatisticSearch":
+            return 200, "application/json", ecos_statistic_search(segments[2:])
+        return 200, "application/json", {"RESULT": {"CODE": "ERROR-300", "MESSAGE": "지원하지 않는 서비스"}}
+
+    def _fred(self, method, path, query, body):
+        if path.startswith("/series/observations"):
+            return 200, "application/xml", fred_observations(query)
+        return 404, "application/xml", '<?xml version="1.0"?><error code="404" message="Not Found"/>'
+
+    def _naver(self, method, path, query, body):
+        if path.startswith("/v1/search/news"):
+            return 200, "application/json", naver_news(query)
+        return 404, "application/json", {"errorMessage": "Not Found", "errorCode": "404"}
+
+    def _telegram(self, method, path, query, body):
+        if path.endswith("/sendMessage"):
+            return 200, "application/json", {"ok": True, "result": {"message_id": int(time.time())}}
+        if path.endswith("/getUpdates"):
+            return 200, "application/json", {"ok": True, "result": []}
+        return 404, "application/json", {"ok": False, "error_code": 404, "description": "Not Found"}
+
+    def _influx(self, method, path, query, body):
+        if path.endswith("/api/v2/write"):
+            return 204, "application/json", b""
+        if path.endswith("/api/v2/query"):
+            return 200, "text/csv; charset=utf-8", b""
+        if path.endswith("/health"):
+            return 200, "application/json", {"name": "influxdb", "message": "ready for queries and writes",
+                                             "status": "pass", "version": "v2.7.0-fake"}
+        if path.endswith("/ping"):
+            return 204, "application/json", b""
+        return 404, "application/json", {"code": "not found", "message": "path not found"}
+
+    def _grafana(self, method, path, query, body):
+        if path.endswith("/api/health"):
+            return 200, "application/json", {"database": "ok", "version": "10.0.0-fake"}
+        if path.endswith("/api/dashboards/db") and method == "POST":
+            try:
+                uid = json.loads(body or b"{}").get("dashboard", {}).get("uid") or "fake"
+            except ValueError:
+                uid = "fake"
+            return 200, "application/json", {"id": 1, "uid": uid, "url": f"/d/{uid}/fake",
+                                             "status": "success", "version": 1}
+        if path.endswith("/api/datasources"):
+            if method == "POST":
+                return 200, "application/json", {"id": 1, "message": "Datasource added"}
+            return 200, "application/json", []
+        return 200, "application/json", {}
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, latency_ms=0, jitter_ms=0,
+                 error_rate=0, throttle_rps=0, fixtures_dir: str = None, seed: int = 0) -> FakeUpstreamServer:
+    """
+    대역 서버를 백그라운드로 시작
+
+    latency_ms/jitter_ms/error_rate/throttle_rps는 숫자(전체 공통) 또는
+    {'default': 값, '<서비스>': 값} 딕셔너리로 지정한다.
+    """
+    def as_map(value):
+        return value if isinstance(value, dict) else {"default": value}
+
+    behaviors = {
+        "latency_ms": as_map(latency_ms),
+        "jitter_ms": as_map(jitter_ms),
+        "error_rate": as_map(error_rate),
+        "throttle_rps": as_map(throttle_rps),
+    }
+    return FakeUpstreamServer((host, port), behaviors, fixtures_dir, seed).start()
+
+
+def _parse_behavior(values: list) -> dict:
+    """['80', 'yahoo=200'] → {'default': 80.0, 'yahoo': 200.0}"""
+    result = {}
+    for value in values or []:
+        service, sep, number = value.partition("=")
+        if sep:
+            if service not in SERVICES:
+                raise argparse.ArgumentTypeError(f"알 수 없는 서비스: {service}")
+            result[service] = float(number)
+        else:
+            result["default"] = float(service)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="외부 API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    behavior_help = "값 또는 서비스=값 (반복 지정 가능, 서비스: " + ", ".join(SERVICES) + ")"
+    parser.add_argument("--latency-ms", action="append", help=f"응답 지연 (ms), {behavior_help}")
+    parser.add_argument("--jitter-ms", action="append", help=f"지연 편차 ± (ms), {behavior_help}")
+    parser.add_argument("--error-rate", action="append", help=f"503 응답 비율 (0~1), {behavior_help}")
+    parser.add_argument("--throttle-rps", action="append", help=f"초당 요청 상한 (초과 시 429), {behavior_help}")
+    parser.add_argument("--fixtures", help="녹화 응답 디렉터리 (<서비스>/<경로>[.json|.xml])")
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 시드")
+    parser.add_argument("--print-env", action="store_true", help="이 서버를 가리키는 export 문만 출력하고 종료")
+    args = parser.parse_args()
+
+    if args.print_env:
+        base_url = f"http://{args.host}:{args.port}"
+        values = {key: value for key, value in DUMMY_CREDENTIALS.items() if not os.getenv(key)}
+        values["FAKE_UPSTREAM_URL"] = base_url
+        for key, value in values.items():
+            print(f"export {key}='{value}'")
+        raise SystemExit(0)
+
+    server = FakeUpstreamServer(
+        (args.host, args.port),
+        {
+            "latency_ms": _parse_behavior(args.latency_ms),
+            "jitter_ms": _parse_behavior(args.jitter_ms),
+            "error_rate": _parse_behavior(args.error_rate),
+            "throttle_rps": _parse_behavior(args.throttle_rps),
+        },
+        fixtures_dir=args.fixtures,
+        seed=args.seed,
+    )
+    print(f"로컬 대역 서버 시작: {server.base_url} (서비스: {', '.join(SERVICES)})")
+    print(f"  export FAKE_UPSTREAM_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("\n[요청 통계]")
+        for name, stats in server.stats.items():
+            if stats["requests"]:
+                print(f"  {name}: {stats['requests']}회 (오류 {stats['errors']}, 429 {stats['throttled']})")
+        print(f"  influx 적재: {server.influx_lines}라인, {server.influx_bytes / 1024:.1f}KB "
+              f"(전송 {server.influx_wire_bytes / 1024:.1f}KB)")
@@ -110,9 +110,11 @@ def check_grafana():
 
     try:
         import requests
+        from http_session import get_session
 
+        session = get_session("grafana")
         url = f"{config.GRAFANA_URL}/api/health"
-        response = requests.get(url, timeout=5)
+        response = session.get(url, timeout=5)
 
         if response.status_code == 200:
             print(f"  ✅ Grafana 연결 성공")
@@ -120,7 +122,7 @@ def check_grafana():
 
             # 로그인 테스트
             auth_url = f"{config.GRAFANA_URL}/api/org"
-            auth_response = requests.get(
+            auth_response = session.get(
                 auth_url,
                 auth=(config.GRAFANA_USER, config.GRAFANA_PASSWORD),
                 timeout=5
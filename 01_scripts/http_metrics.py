@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 전송 지표 (HTTP Metrics)
+=============================
+외부 API 호출의 호스트별 응답 시간/전송량/상태 코드 집계
+
+- 공유 세션(http_session)을 거치는 모든 요청은 자동 기록
+  (naver, ecos, telegram, grafana)
+- 자체 HTTP 클라이언트를 쓰는 라이브러리(yfinance, fredapi)는 호출부에서 timed()로 기록
+- 실행 단위로 p50/p95/max 집계 후 InfluxDB 적재 + 요약 출력
+
+지표:
+    ttfb_ms: 요청 전송 ~ 응답 헤더 수신 (연결 수립 포함, requests의 Response.elapsed)
+    total_ms: 요청 전송 ~ 본문 수신 완료 (재시도/리다이렉트 포함)
+    bytes: 수신 본문 크기 (압축 해제 전 전송량, 알 수 없으면 해제 후 크기)
+
+Measurement: http_metrics
+Tags: host
+Fields: count, errors, status_2xx/3xx/4xx/5xx, p50_ms, p95_ms, max_ms,
+        ttfb_p50_ms, ttfb_p95_ms (TTFB 기록이 있는 호스트만), bytes_total
+
+사용법:
+    from http_metrics import timed, flush_http_metrics, print_summary
+    with timed("yahoo") as call:
+        hist = stock.history(...)
+        call["status"] = 200 if not hist.empty else 204  # 빈 응답 구분
+    print_summary(flush_http_metrics())  # 수집 종료 시
+
+Created: 2026-10-18
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from influx_writer import get_writer
+
+# InfluxDB 클라이언트 (선택적 import)
+try:
+    from influxdb_client import Point, WritePrecision
+    INFLUXDB_AVAILABLE = True
+except ImportError:
+    INFLUXDB_AVAILABLE = False
+
+MEASUREMENT = "http_metrics"
+
+_samples = []
+_samples_lock = threading.Lock()
+
+
+def record(host: str, total_ms: float, ttfb_ms: float = None, status=None, nbytes: int = 0):
+    """
+    요청 1건 기록
+
+    Args:
+        host: 호스트 이름 (naver, ecos, fred, yahoo, telegram, grafana)
+        total_ms: 전체 소요 시간 (ms)
+        ttfb_ms: 첫 바이트까지 시간 (ms, 모르면 None)
+        status: HTTP 상태 코드 (예외면 None)
+        nbytes: 수신 바이트 수
+    """
+    with _samples_lock:
+        _samples.append((host, total_ms, ttfb_ms, status, nbytes or 0))
+
+
+@contextmanager
+def timed(host: str):
+    """
+    requests 세션을 거치지 않는 호출 측정 (yfinance, fredapi 등)
+
+    yield된 dict에 status/bytes를 채우면 함께 기록된다 (TTFB는 측정 불가).
+    예외가 나면 status=None(오류)으로 기록한다.
+    """
+    call = {"status": 200, "bytes": 0}
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException:
+        call["status"] = None
+        raise
+    finally:
+        record(host, (time.perf_counter() - started) * 1000,
+               status=call["status"], nbytes=call["bytes"])
+
+
+def record_response(host: str, response, total_ms: float, stream: bool = False):
+    """requests.Response 기록 (http_session에서 호출)"""
+    nbytes = 0
+    if stream:
+        nbytes = int(response.headers.get("Content-Length") or 0)
+    else:
+        try:
+            nbytes = response.raw.tell()  # 압축 해제 전 수신량
+        except Exception:
+            pass
+        nbytes = nbytes or len(response.content or b"")
+    ttfb_ms = response.elapsed.total_seconds() * 1000 if response.elapsed else None
+    record(host, total_ms, ttfb_ms=ttfb_ms, status=response.status_code, nbytes=nbytes)
+
+
+def percentile(values: list, q: float) -> float:
+    """nearest-rank 백분위수 (values 비어 있으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: list = None) -> list:
+    """
+    호스트별 집계 (p95 내림차순)
+
+    Returns:
+        list: [{'host', 'count', 'errors', 'status', 'p50_ms', 'p95_ms', 'max_ms',
+                'ttfb_p50_ms', 'ttfb_p95_ms', 'bytes_total'}, ...]
+        TTFB를 측정할 수 없는 호스트(timed() 기록만 있음)는 ttfb_*가 None
+    """
+    if samples is None:
+        with _samples_lock:
+            samples = list(_samples)
+
+    by_host = {}
+    for host, total_ms, ttfb_ms, status, nbytes in samples:
+        by_host.setdefault(host, []).append((total_ms, ttfb_ms, status, nbytes))
+
+    summary = []
+    for host, rows in by_host.items():
+        totals = [r[0] for r in rows]
+        ttfbs = [r[1] for r in rows if r[1] is not None]
+        status_counts = {}
+        for _, _, status, _ in rows:
+            key = f"{status // 100}xx" if status else "error"
+            status_counts[key] = status_counts.get(key, 0) + 1
+        summary.append({
+            "host": host,
+            "count": len(rows),
+            "errors": sum(1 for r in rows if not r[2] or r[2] >= 400),
+            "status": status_counts,
+            "p50_ms": percentile(totals, 50),
+            "p95_ms": percentile(totals, 95),
+            "max_ms": max(totals),
+            "ttfb_p50_ms": percentile(ttfbs, 50) if ttfbs else None,
+            "ttfb_p95_ms": percentile(ttfbs, 95) if ttfbs else None,
+            "bytes_total": sum(r[3] for r in rows),
+        })
+    return sorted(summary, key=lambda x: x["p95_ms"], reverse=True)
+
+
+def flush_http_metrics() -> list:
+    """
+    이번 실행의 요청 기록을 호스트별로 집계해 InfluxDB 공유 Writer에 적재하고 비움
+
+    Returns:
+        list: summarize() 결과 (출력용)
+    """
+    with _samples_lock:
+        samples = list(_samples)
+        _samples.clear()
+
+    summary = summarize(samples)
+    writer = get_writer() if INFLUXDB_AVAILABLE else None
+    if writer and summary:
+        now = datetime.now(timezone.utc)
+        points = []
+        for item in summary:
+            p = Point(MEASUREMENT) \
+                .tag("host", item["host"]) \
+                .field("count", item["count"]) \
+                .field("errors", item["errors"]) \
+                .field("p50_ms", round(item["p50_ms"], 1)) \
+                .field("p95_ms", round(item["p95_ms"], 1)) \
+                .field("max_ms", round(item["max_ms"], 1)) \
+                .field("bytes_total", item["bytes_total"]) \
+                .time(now, WritePrecision.S)
+            for key, count in item["status"].items():
+                p.field(f"status_{key}", count)
+            for key in ("ttfb_p50_ms", "ttfb_p95_ms"):
+                if item[key] is not None:
+                    p.field(key, round(item[key], 1))
+            points.append(p)
+        try:
+            writer.write(points)
+        except Exception as e:
+            print(f"  HTTP 지표 적재 오류: {e}")
+
+    return summary
+
+
+def print_summary(summary: list):
+    """호스트별 집계 출력"""
+    if not summary:
+        return
+    print("\n[HTTP 호스트별 응답 시간]")
+    for item in summary:
+        status = ", ".join(f"{k} {v}" for k, v in sorted(item["status"].items()))
+        ttfb = f"{item['ttfb_p50_ms']:.0f}ms" if item["ttfb_p50_ms"] is not None else "-"
+        print(f"  {item['host']}: {item['count']}회 | p50 {item['p50_ms']:.0f}ms, "
+              f"p95 {item['p95_ms']:.0f}ms, max {item['max_ms']:.0f}ms | "
+              f"TTFB p50 {ttfb} | {item['bytes_total'] / 1024:.1f}KB | {status}")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 세션 모듈 (HTTP Session)
+=============================
+외부 API 호출용 공유 requests.Session 팩토리
+
+- 용도(naver, ecos, telegram, grafana)별 세션 1개를 프로세스 내에서 재사용
+- 호스트별 커넥션 풀 + keep-alive로 매 요청 TLS 핸드셰이크 제거
+- gzip 응답 압축 요청
+- 429/5xx 재시도 정책(지수 백오프, Retry-After 준수)을 한 곳에서 관리
+- 세션 이름과 같은 호스트 토큰 버킷(rate_limit)으로 요청 속도 제한
+  (최종 응답이 429이면 Retry-After만큼 해당 호스트 전체 일시 정지)
+- 요청마다 응답 시간/TTFB/수신량/상태 코드를 http_metrics에 기록
+- YAHOO_API_BASE(또는 FAKE_UPSTREAM_URL) 설정 시 get_yfinance_session()으로
+  yfinance의 *.yahoo.com 요청을 해당 주소로 전환 (로컬 대역 서버용)
+
+설정 (.env):
+    HTTP_POOL_CONNECTIONS: 세션당 캐시할 호스트 풀 수 (기본 8)
+    HTTP_POOL_MAXSIZE: 호스트당 최대 커넥션 수 (기본 8)
+    HTTP_RETRY_TOTAL: 최대 재시도 횟수 (기본 3)
+    HTTP_RETRY_BACKOFF: 백오프 계수 (초, 기본 0.5 → 0.5, 1, 2초...)
+
+사용법:
+    from http_session import get_session
+    response = get_session("naver").get(url, params=params, timeout=10)
+
+Created: 2026-10-18
+"""
+
+import atexit
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import config
+from http_metrics import record, record_response
+from rate_limit import backoff_delay, get_limiter, parse_retry_after
+
+# 재시도 대상 상태 코드 (요청 제한 + 일시적 서버 오류)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 기본 재시도 메서드 (멱등 요청만; 연결 실패는 메서드와 무관하게 재시도됨)
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def build_retry(retry_post: bool = False) -> Retry:
+    """
+    공통 재시도 정책 생성
+
+    Args:
+        retry_post: POST도 상태 코드 기반 재시도 대상에 포함할지 여부
+            (덮어쓰기 업로드처럼 재전송해도 안전한 경우에만 사용)
+    """
+    methods = (IDEMPOTENT_METHODS | {"POST"}) if retry_post else IDEMPOTENT_METHODS
+    return Retry(
+        total=config.HTTP_RETRY_TOTAL,
+        backoff_factor=config.HTTP_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=methods,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 최종 응답은 그대로 반환 (호출측에서 status_code 확인)
+    )
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """요청 전 호스트 토큰 버킷 대기, 429 응답 시 버킷 일시 정지"""
+
+    def __init__(self, limiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        response = super().send(request, **kwargs)
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.limiter.pause(retry_after if retry_after is not None else backoff_delay(0))
+        return response
+
+
+class RedirectAdapter(HTTPAdapter):
+    """지정 도메인 요청의 스킴/호스트를 base_url로 바꿔 전송 (경로/쿼리는 유지)"""
+
+    def __init__(self, base_url: str, domain: str, **kwargs):
+        self.base_url = base_url.rstrip("/")
+        self.domain = domain
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        if (parts.hostname or "").endswith(self.domain):
+            request.url = f"{self.base_url}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+        return super().send(request, **kwargs)
+
+
+class MeteredSession(requests.Session):
+    """요청별 전송 지표를 http_metrics에 기록하는 세션"""
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.metrics_host = name
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            record(self.metrics_host, (time.perf_counter() - started) * 1000)
+            raise
+        # stream=False면 super().send 안에서 본문까지 수신 완료
+        record_response(self.metrics_host, response, (time.perf_counter() - started) * 1000,
+                        stream=kwargs.get("stream", False))
+        return response
+
+
+def _create_session(name: str, retry_post: bool) -> requests.Session:
+    session = MeteredSession(name)
+    adapter = RateLimitedAdapter(
+        get_limiter(name),
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+        max_retries=build_retry(retry_post),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session(name: str = "default", retry_post: bool = False) -> requests.Session:
+    """
+    용도별 공유 세션 반환 (최초 호출 시 생성)
+
+    Args:
+        name: 세션 이름 (naver, ecos, telegram, grafana 등)
+        retry_post: POST 재시도 허용 여부 (최초 생성 시에만 반영)
+
+    Returns:
+        requests.Session: 커넥션 풀/재시도 정책이 적용된 세션
+    """
+    with _sessions_lock:
+        if name not in _sessions:
+            _sessions[name] = _create_session(name, retry_post)
+        return _sessions[name]
+
+
+def get_yfinance_session():
+    """
+    yfinance에 넘길 세션 반환 (config.YAHOO_API_BASE 미설정 시 None → yfinance 기본 세션)
+
+    설정되어 있으면 *.yahoo.com 요청(chart, 쿠키, crumb)을 해당 주소로 보내는 세션을
+    만들어 반환한다. yf.download(session=None)은 yfinance 공유 세션을 새로 만들어
+    덮어쓰므로 yf.Ticker/yf.download 호출마다 session 인자로 넘긴다.
+    """
+    base_url = config.YAHOO_API_BASE
+    if not base_url:
+        return None
+    with _sessions_lock:
+        session = _sessions.get("yfinance")
+        if session is None:
+            session = requests.Session()
+            adapter = RedirectAdapter(base_url, "yahoo.com", pool_maxsize=config.HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions["yfinance"] = session
+        return session
+
+
+def close_sessions():
+    """모든 공유 세션 종료"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfluxDB 쓰기 요청 gzip 압축 (Influx Gzip)
+=========================================
+/api/v2/write 요청 본문을 크기 기준으로 gzip 압축하고 압축 전/후 바이트를 집계
+
+기존 방식:
+    line protocol을 압축 없이 전송
+    → 주가 포인트마다 긴 태그 값(예: TIGER 코리아배당다우존스)이 UTF-8로 반복
+변경 방식:
+    - 본문이 INFLUXDB_GZIP_MIN_BYTES 이상이면 지정 레벨로 압축 + Content-Encoding: gzip
+    - 작은 요청(수집 로그 1건 등)은 압축하지 않고 그대로 전송
+    - 요청 수 / 압축 요청 수 / 원본 바이트 / 전송 바이트 집계 → 절감률 출력
+- influxdb_client의 enable_gzip은 경로만 보고 모든 write를 압축하고 레벨 지정이 없어서,
+  헤더와 본문을 함께 받는 REST 클라이언트 request()를 감싸서 처리
+
+설정 (.env):
+    INFLUXDB_GZIP: 사용 여부 (기본 1)
+    INFLUXDB_GZIP_LEVEL: 압축 레벨 1~9 (기본 1, 라인 프로토콜은 1에서도 약 75% 절감 - 높이면 CPU만 크게 증가)
+    INFLUXDB_GZIP_MIN_BYTES: 이 크기 미만 본문은 압축 생략 (기본 1024)
+
+사용법:
+    from influx_gzip import enable_gzip, format_savings
+    client = InfluxDBClient(url=..., token=..., org=...)
+    gzip_stats = enable_gzip(client)  # INFLUXDB_GZIP=0이면 None
+    ...
+    print(format_savings(gzip_stats.snapshot()))
+
+Created: 2026-10-18
+"""
+
+import gzip
+import threading
+
+from config import config
+
+WRITE_PATH = "/api/v2/write"
+
+
+class GzipStats:
+    """압축 전/후 바이트 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.compressed = 0
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+
+    def record(self, raw_bytes: int, wire_bytes: int):
+        with self._lock:
+            self.requests += 1
+            self.compressed += wire_bytes != raw_bytes
+            self.raw_bytes += raw_bytes
+            self.wire_bytes += wire_bytes
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "compressed": self.compressed,
+                "raw_bytes": self.raw_bytes,
+                "wire_bytes": self.wire_bytes,
+            }
+
+
+def format_savings(stats: dict) -> str:
+    """'12.3MB → 1.2MB (-90.2%, gzip 120/130회)' 형식 요약"""
+    raw, wire = stats["raw_bytes"], stats["wire_bytes"]
+    saved = (1 - wire / raw) * 100 if raw else 0.0
+    return (f"{raw / 1024 / 1024:.1f}MB → {wire / 1024 / 1024:.1f}MB "
+            f"(-{saved:.1f}%, gzip {stats['compressed']}/{stats['requests']}회)")
+
+
+def enable_gzip(client, level: int = None, min_bytes: int = None):
+    """
+    InfluxDBClient의 write 요청 압축 활성화
+
+    Args:
+        client: InfluxDBClient (enable_gzip=False로 생성)
+        level: 압축 레벨 (기본 INFLUXDB_GZIP_LEVEL)
+        min_bytes: 압축 최소 크기 (기본 INFLUXDB_GZIP_MIN_BYTES)
+
+    Returns:
+        GzipStats 또는 None: INFLUXDB_GZIP=0이면 None (압축 안 함)
+    """
+    if not config.INFLUXDB_GZIP:
+        return None
+    level = config.INFLUXDB_GZIP_LEVEL if level is None else level
+    min_bytes = config.INFLUXDB_GZIP_MIN_BYTES if min_bytes is None else min_bytes
+
+    stats = GzipStats()
+    rest_client = client.api_client.rest_client
+    request = rest_client.request
+
+    def gzip_request(method, url, query_params=None, headers=None, body=None, *args, **kwargs):
+        if method == "POST" and url.split("?")[0].endswith(WRITE_PATH) and isinstance(body, (str, bytes)):
+            data = body.encode("utf-8") if isinstance(body, str) else body
+            if len(data) >= min_bytes:
+                body = gzip.compress(data, compresslevel=level)
+                headers = {**(headers or {}), "Content-Encoding": "gzip"}
+            else:
+                body = data
+            stats.record(len(data), len(body))
+        return request(method, url, query_params, headers, body, *args, **kwargs)
+
+    rest_client.request = gzip_request
+    return stats
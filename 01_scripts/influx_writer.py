@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfluxDB 공용 Writer (Influx Writer)
+====================================
+프로세스 전체에서 InfluxDBClient 하나와 배치 write_api 하나를 공유
+
+- 수집기(01_data_collector.py), 수집 로그(collection_logger.py)가 같은 커넥션 풀 사용
+- 포인트는 큐에 쌓였다가 batch_size/flush_interval 기준으로 묶어서 전송
+- 프로세스 종료 시(atexit) 남은 포인트를 flush 후 연결 종료
+- 쓰기 요청은 크기 기준으로 gzip 압축 (influx_gzip.py, 전송 통계에 압축 전/후 바이트 포함)
+
+설정 (.env):
+    INFLUXDB_WRITE_BATCH_SIZE: 한 요청에 묶을 최대 포인트 수 (기본 1000)
+    INFLUXDB_FLUSH_INTERVAL_MS: 자동 flush 주기 (기본 30000ms)
+    INFLUXDB_GZIP / INFLUXDB_GZIP_LEVEL / INFLUXDB_GZIP_MIN_BYTES: 압축 설정 (influx_gzip.py)
+
+사용법:
+    from influx_writer import get_writer, close_writer
+    writer = get_writer()
+    if writer:
+        writer.write(points)
+    close_writer()  # 수집 종료 시 (생략해도 atexit에서 처리)
+
+Created: 2026-10-18
+"""
+
+import atexit
+import threading
+
+from config import config
+from influx_gzip import enable_gzip
+
+# InfluxDB 클라이언트 (선택적 import)
+try:
+    from influxdb_client import InfluxDBClient, WriteOptions
+    INFLUXDB_AVAILABLE = True
+except ImportError:
+    INFLUXDB_AVAILABLE = False
+
+
+def _count_lines(data) -> int:
+    """line protocol 페이로드의 포인트 수"""
+    if isinstance(data, bytes):
+        return data.count(b"\n") + 1 if data else 0
+    return str(data).count("\n") + 1 if data else 0
+
+
+class InfluxWriter:
+    """배치 전송용 공유 Writer"""
+
+    def __init__(self, url: str, token: str, org: str, bucket: str,
+                 batch_size: int = 1000, flush_interval_ms: int = 30000):
+        """
+        Args:
+            url, token, org: InfluxDB 접속 정보
+            bucket: 기본 버킷
+            batch_size: 한 요청에 묶을 최대 포인트 수
+            flush_interval_ms: 자동 flush 주기 (ms)
+        """
+        self.bucket = bucket
+        self.client = InfluxDBClient(url=url, token=token, org=org)
+        self.gzip_stats = enable_gzip(self.client)
+        self.write_api = self.client.write_api(
+            write_options=WriteOptions(
+                batch_size=batch_size,
+                flush_interval=flush_interval_ms,
+                jitter_interval=0,
+                retry_interval=2000,
+                max_retries=3,
+            ),
+            success_callback=self._on_success,
+            error_callback=self._on_error,
+        )
+
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.written = 0
+        self.failed = 0
+        self.requests = 0
+        self.errors = []
+
+    def _on_success(self, conf, data):
+        with self._lock:
+            self.written += _count_lines(data)
+            self.requests += 1
+
+    def _on_error(self, conf, data, exception):
+        count = _count_lines(data)
+        with self._lock:
+            self.failed += count
+            self.requests += 1
+            self.errors.append(str(exception)[:100])
+        print(f"  InfluxDB 배치 전송 오류 ({count}건): {str(exception)[:100]}")
+
+    def write(self, record, bucket: str = None, write_precision: str = None) -> int:
+        """
+        포인트를 전송 큐에 적재
+
+        Args:
+            record: Point 또는 Point 리스트 (line protocol 문자열도 가능)
+            bucket: 대상 버킷 (기본: 생성 시 지정한 버킷)
+            write_precision: line protocol 문자열의 시각 정밀도 (s, ms, us, ns)
+                - Point는 각자의 precision을 사용하므로 생략
+
+        Returns:
+            int: 큐에 적재한 포인트 수
+        """
+        records = record if isinstance(record, list) else [record]
+        if not records:
+            return 0
+        kwargs = {"write_precision": write_precision} if write_precision else {}
+        self.write_api.write(bucket=bucket or self.bucket, record=records, **kwargs)
+        with self._lock:
+            self.queued += len(records)
+        return len(records)
+
+    def flush(self):
+        """큐에 남은 포인트 즉시 전송"""
+        self.write_api.flush()
+
+    def close(self) -> dict:
+        """
+        남은 포인트를 전송하고 연결 종료
+
+        Returns:
+            dict: 전송 통계 (queued, written, failed, requests, errors, raw_bytes, wire_bytes)
+        """
+        try:
+            self.write_api.close()
+        finally:
+            self.client.close()
+        return self.stats()
+
+    def stats(self) -> dict:
+        """현재까지의 전송 통계 (raw_bytes/wire_bytes: 압축 전/후 본문 크기, 압축 미사용 시 0)"""
+        gzip_stats = self.gzip_stats.snapshot() if self.gzip_stats else {}
+        with self._lock:
+            return {
+                'queued': self.queued,
+                'written': self.written,
+                'failed': self.failed,
+                'requests': self.requests,
+                'errors': self.errors[:5],
+                'raw_bytes': gzip_stats.get('raw_bytes', 0),
+                'wire_bytes': gzip_stats.get('wire_bytes', 0),
+            }
+
+
+# 프로세스 싱글톤
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """
+    공유 InfluxWriter 반환 (최초 호출 시 생성)
+
+    Returns:
+        InfluxWriter | None: influxdb-client 미설치 또는 토큰 미설정이면 None
+    """
+    global _writer
+    if not INFLUXDB_AVAILABLE or not config.INFLUXDB_TOKEN:
+        return None
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = InfluxWriter(
+                url=config.INFLUXDB_URL,
+                token=config.INFLUXDB_TOKEN,
+                org=config.INFLUXDB_ORG,
+                bucket=config.INFLUXDB_BUCKET,
+                batch_size=config.INFLUXDB_WRITE_BATCH_SIZE,
+                flush_interval_ms=config.INFLUXDB_FLUSH_INTERVAL_MS,
+            )
+        return _writer
+
+
+def close_writer():
+    """
+    공유 Writer flush 후 종료 (다음 get_writer 호출 시 새로 생성)
+
+    Returns:
+        dict | None: 전송 통계 (Writer가 없었으면 None)
+    """
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is None:
+        return None
+    return writer.close()
+
+
+atexit.register(close_writer)
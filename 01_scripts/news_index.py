@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 중복 인덱스 (News Index)
+=============================
+이미 저장한 기사를 실행 간에 기억해 CSV/InfluxDB 중복 저장을 방지
+
+- 키: (keyword, 정규화된 link)의 sha1 앞 16자 (64bit)
+  → 같은 기사라도 다른 키워드로 수집되면 키워드별 집계를 위해 별도 저장
+- 링크 정규화: 공백/fragment 제거, 네이버 뉴스 링크는 쿼리(?sid=...) 제거
+- 저장 형식: news_seen.idx (해시 1줄 1개, append 전용)
+- 재생성: 인덱스가 없거나 news.csv 크기가 기록과 다르면(수동 편집 등)
+  news.csv(+ news_historical.csv)에서 다시 생성
+
+사용법:
+    python 01_scripts/news_index.py --dedupe    # 기존 CSV 중복 제거 (1회성) + 인덱스 재생성
+    python 01_scripts/news_index.py --rebuild   # 인덱스만 재생성
+
+Created: 2026-10-18
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+import pandas as pd
+
+from config import config
+
+NEWS_CSV_FILES = ("news.csv", "news_historical.csv")
+
+
+def normalize_link(link: str) -> str:
+    """기사 링크 정규화 (fragment 제거, 네이버 뉴스는 쿼리 제거)"""
+    link = str(link).strip()
+    parts = urlsplit(link)
+    if not parts.netloc:
+        return link
+    host = parts.netloc.lower()
+    query = "" if host.endswith("naver.com") else parts.query
+    return urlunsplit((parts.scheme.lower(), host, parts.path, query, ""))
+
+
+def article_key(keyword: str, link: str) -> str:
+    """(keyword, link) 중복 판정 키"""
+    raw = f"{keyword}\t{normalize_link(link)}".encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()[:16]
+
+
+def is_article(item: dict) -> bool:
+    """중복 판정 대상 여부 (오류 행/링크 없는 행은 제외)"""
+    link = str(item.get("link", ""))
+    return item.get("status") == "success" and link not in ("", "N/A", "nan")
+
+
+class NewsIndex:
+    """저장된 기사 해시 집합 (파일 기반)"""
+
+    def __init__(self, news_dir: str):
+        self.news_dir = news_dir
+        self.idx_path = os.path.join(news_dir, "news_seen.idx")
+        self.meta_path = os.path.join(news_dir, "news_seen.meta.json")
+        self._lock = threading.Lock()
+        self._seen = None
+
+    def _csv_paths(self) -> list:
+        paths = [os.path.join(self.news_dir, name) for name in NEWS_CSV_FILES]
+        return [p for p in paths if os.path.exists(p)]
+
+    def _csv_sizes(self) -> dict:
+        return {os.path.basename(p): os.path.getsize(p) for p in self._csv_paths()}
+
+    def _write_meta(self):
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump({"csv_bytes": self._csv_sizes(), "keys": len(self._seen)}, f)
+
+    def _load(self):
+        if self._seen is not None:
+            return
+
+        meta = {}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+
+        if os.path.exists(self.idx_path) and meta.get("csv_bytes") == self._csv_sizes():
+            with open(self.idx_path, encoding="utf-8") as f:
+                self._seen = {line.strip() for line in f if line.strip()}
+            return
+
+        self._rebuild()
+
+    def _rebuild(self):
+        """CSV 파일에서 인덱스 재생성"""
+        seen = set()
+        for path in self._csv_paths():
+            df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+            for keyword, link, status in zip(df["keyword"], df["link"], df["status"]):
+                if is_article({"link": link, "status": status}):
+                    seen.add(article_key(keyword, link))
+
+        self._seen = seen
+        with open(self.idx_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{key}\n" for key in sorted(seen))
+        self._write_meta()
+
+    def rebuild(self) -> int:
+        """인덱스 강제 재생성, 키 수 반환"""
+        with self._lock:
+            self._rebuild()
+            return len(self._seen)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._seen)
+
+    def filter_new(self, items: list) -> tuple:
+        """
+        이미 저장된 기사 제외 (같은 실행 내 중복도 제외)
+
+        Args:
+            items: 뉴스 행 딕셔너리 리스트 (keyword, link, status)
+
+        Returns:
+            tuple: (저장할 행 리스트, 건너뛴 중복 수) - 오류 행은 그대로 유지
+        """
+        with self._lock:
+            self._load()
+            fresh, pending, skipped = [], set(), 0
+            for item in items:
+                if not is_article(item):
+                    fresh.append(item)
+                    continue
+                key = article_key(item["keyword"], item["link"])
+                if key in self._seen or key in pending:
+                    skipped += 1
+                    continue
+                pending.add(key)
+                fresh.append(item)
+            return fresh, skipped
+
+    def add(self, items: list):
+        """CSV에 저장한 기사를 인덱스에 반영 (CSV 저장 후 호출)"""
+        with self._lock:
+            self._load()
+            keys = [article_key(item["keyword"], item["link"]) for item in items if is_article(item)]
+            new_keys = [key for key in dict.fromkeys(keys) if key not in self._seen]
+            if new_keys:
+                with open(self.idx_path, "a", encoding="utf-8") as f:
+                    f.writelines(f"{key}\n" for key in new_keys)
+                self._seen.update(new_keys)
+            self._write_meta()
+
+    def dedupe_csv_files(self) -> dict:
+        """
+        기존 news CSV 중복 제거 (먼저 저장된 행 유지) 후 인덱스 재생성
+
+        Returns:
+            dict: {파일명: 제거된 행 수}
+        """
+        removed = {}
+        with self._lock:
+            for path in self._csv_paths():
+                df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+                articles = pd.Series(
+                    [is_article({"link": l, "status": s}) for l, s in zip(df["link"], df["status"])],
+                    index=df.index,
+                )
+                keys = pd.Series(
+                    [article_key(k, l) if a else None
+                     for k, l, a in zip(df["keyword"], df["link"], articles)],
+                    index=df.index,
+                )
+                keep = ~(articles & keys.duplicated(keep="first"))
+                removed[os.path.basename(path)] = int((~keep).sum())
+
+                if removed[os.path.basename(path)]:
+                    tmp_path = f"{path}.tmp"
+                    df[keep].to_csv(tmp_path, index=False, encoding="utf-8-sig")
+                    os.replace(tmp_path, path)
+
+            self._rebuild()
+        return removed
+
+
+# 기본 인덱스 (data/news)
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_news_index() -> NewsIndex:
+    """config.NEWS_DIR의 뉴스 인덱스 반환"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = NewsIndex(config.NEWS_DIR)
+        return _index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="뉴스 중복 인덱스 관리")
+    parser.add_argument("--dedupe", action="store_true", help="news.csv/news_historical.csv 중복 제거")
+    parser.add_argument("--rebuild", action="store_true", help="인덱스 재생성")
+    args = parser.parse_args()
+
+    index = get_news_index()
+    if args.dedupe:
+        for name, count in index.dedupe_csv_files().items():
+            print(f"{name}: 중복 {count}행 제거")
+    elif args.rebuild:
+        print(f"인덱스 재생성 완료: {index.rebuild()}건")
+    print(f"인덱스 기사 수: {len(index)}건")
@@ -22,9 +22,9 @@ Author: Claude Code
 Created: 2025-12-07
 """
 
-import requests
 from datetime import datetime
 from config import config
+from http_session import get_session
 
 
 class TelegramNotifier:
@@ -41,7 +41,7 @@ class TelegramNotifier:
         self.bot_token = config.TELEGRAM_BOT_TOKEN
         self.chat_id = config.TELEGRAM_CHAT_ID
         self.enabled = config.TELEGRAM_ENABLED
-        self.api_url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        self.api_url = f"{config.TELEGRAM_API_BASE}/bot{self.bot_token}/sendMessage"
 
     def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
         """
@@ -65,7 +65,7 @@ class TelegramNotifier:
                 "parse_mode": parse_mode
             }
 
-            response = requests.post(self.api_url, json=payload, timeout=10)
+            response = get_session("telegram").post(self.api_url, json=payload, timeout=10)
 
             if response.status_code == 200:
                 print("  📱 Telegram 알림 전송 완료")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한 / 재시도 백오프 (Rate Limit)
+===========================================
+호스트별 토큰 버킷과 지수 백오프(full jitter)를 한 곳에서 관리
+
+- 토큰 버킷: 호스트(yahoo, ecos, fred, naver)별 초당 요청 수 상한
+  → 스레드가 여러 개여도 합산 요청 속도가 상한을 넘지 않음
+  → 대기 시간은 예약 방식으로 계산되어 스레드 간 충돌/동시 폭주 없음
+- 429 / Retry-After 수신 시 해당 호스트 버킷 전체를 일시 정지
+  → 같은 호스트로 가는 모든 스레드가 함께 대기
+- 재시도 대기: min(cap, base * 2^attempt) 범위의 균등 난수 (full jitter)
+
+설정 (.env):
+    RATE_LIMIT_YAHOO / RATE_LIMIT_ECOS / RATE_LIMIT_FRED / RATE_LIMIT_NAVER: 초당 요청 수
+    RETRY_BACKOFF_BASE: 백오프 기본 대기 (초, 기본 1.0)
+    RETRY_BACKOFF_CAP: 백오프 최대 대기 (초, 기본 30)
+
+사용법:
+    from rate_limit import get_limiter, backoff_delay
+    limiter = get_limiter("yahoo")
+    limiter.acquire()                 # 요청 직전
+    limiter.pause(retry_after)        # 429 수신 시
+    time.sleep(backoff_delay(attempt))
+
+Created: 2026-10-18
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from config import config
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (예약 방식)"""
+
+    def __init__(self, rate: float, burst: float = None):
+        """
+        Args:
+            rate: 초당 토큰 보충 수 (= 지속 가능한 초당 요청 수, 0 이하면 제한 없음)
+            burst: 버킷 용량 (기본: max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.waited = 0.0  # 누적 대기 시간 (초)
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 대기해야 할 시간 반환 (락 보유 상태)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        # 토큰을 음수까지 미리 차감 → 뒤에 온 스레드는 그만큼 더 기다림
+        self._tokens -= tokens
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (필요하면 대기)
+
+        Returns:
+            float: 실제 대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            wait = self._reserve(tokens)
+            self.waited += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def charge(self, tokens: float):
+        """
+        대기 없이 토큰만 차감 (라이브러리가 내부에서 한꺼번에 보내는 요청용)
+
+        yf.download처럼 요청 간격을 조절할 수 없는 묶음 요청의 몫을 기록해,
+        뒤따르는 요청이 그만큼 늦게 나가도록 한다.
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            self._reserve(tokens)
+
+    def pause(self, seconds: float):
+        """seconds 동안 이 버킷의 모든 요청 정지 (429/Retry-After 대응)"""
+        if not seconds or seconds <= 0:
+            return
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def backoff_delay(attempt: int, base: float = None, cap: float = None) -> float:
+    """
+    지수 백오프 + full jitter 대기 시간
+
+    Args:
+        attempt: 0부터 시작하는 재시도 회차
+        base: 기본 대기 (초, 기본 config.RETRY_BACKOFF_BASE)
+        cap: 최대 대기 (초, 기본 config.RETRY_BACKOFF_CAP)
+    """
+    base = config.RETRY_BACKOFF_BASE if base is None else base
+    cap = config.RETRY_BACKOFF_CAP if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 초로 변환 (해석 불가 시 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """요청 제한 오류 여부 (yfinance YFRateLimitError, HTTP 429 등)"""
+    text = f"{type(error).__name__} {error}"
+    return "RateLimit" in text or "429" in text or "Too Many Requests" in text
+
+
+# 호스트별 버킷 (프로세스 공유)
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _host_rate(host: str) -> float:
+    rates = {
+        "yahoo": config.RATE_LIMIT_YAHOO,
+        "ecos": config.RATE_LIMIT_ECOS,
+        "fred": config.RATE_LIMIT_FRED,
+        "naver": config.RATE_LIMIT_NAVER,
+    }
+    return rates.get(host, 0)
+
+
+def get_limiter(host: str) -> TokenBucket:
+    """호스트별 공유 토큰 버킷 반환 (설정에 없는 호스트는 제한 없음)"""
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = TokenBucket(_host_rate(host))
+        return _limiters[host]
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답 캐시 (Response Cache)
+==========================
+외부 API 응답을 디스크에 TTL과 함께 저장해 cron 재실행 시 재조회를 생략
+
+- 키: 정규화한 URL(스킴/호스트 소문자, 쿼리 파라미터 정렬, 인증키 제거)의 sha256
+- 신선도: 파일 수정 시각 + 호출부가 지정한 TTL (소스/주기별로 다르게 적용)
+- 크기 제한: 전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+  (적중 시 수정 시각을 갱신하므로 mtime 순서 = 최근 사용 순서)
+- 오류 응답은 저장하지 않음
+- 우회: RESPONSE_CACHE_BYPASS=1이면 캐시를 읽지 않고 새로 받은 응답으로 갱신만 수행
+
+설정 (.env):
+    RESPONSE_CACHE_BYPASS: 1이면 캐시 읽기 생략 (기본 0)
+    RESPONSE_CACHE_MAX_MB: 캐시 디렉터리 최대 크기 (기본 50MB)
+    CACHE_TTL_DAILY: 일간 시계열 TTL (초, 기본 3600)
+    CACHE_TTL_MONTHLY: 월간/분기 시계열 TTL (초, 기본 43200)
+
+사용법:
+    from response_cache import get_cache
+    cache = get_cache()
+    data = cache.get_json(url, ttl=3600)
+    if data is None:
+        data = session.get(url).json()
+        cache.put_json(url, data)
+
+Created: 2026-10-18
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import config
+
+
+def normalize_url(url: str, params: dict = None, secrets: tuple = ()) -> str:
+    """캐시 키용 URL 정규화 (인증키 등 secrets 문자열은 제거)"""
+    for secret in secrets:
+        if secret:
+            url = url.replace(secret, "")
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(k, str(v)) for k, v in params.items()]
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path,
+        urlencode(sorted(query)), "",
+    ))
+
+
+class ResponseCache:
+    """TTL + LRU 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, max_bytes: int, bypass: bool = False):
+        """
+        Args:
+            cache_dir: 캐시 디렉터리
+            max_bytes: 캐시 전체 최대 크기 (바이트)
+            bypass: True면 읽기 생략 (쓰기는 수행)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # 캐시 전체 크기 추정치 (최초 쓰기 시 계산)
+
+    def _path(self, key: str, suffix: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}{suffix}")
+
+    def _read(self, key: str, ttl: float, suffix: str):
+        if self.bypass or ttl <= 0:
+            return None
+        path = self._path(key, suffix)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age > ttl:
+                raise FileNotFoundError
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def _write(self, key: str, data: bytes, suffix: str):
+        path = self._path(key, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size = (self._size if self._size is not None else self._scan()[1]) + len(data)
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    # JSON 응답 (ECOS 등)
+    def get_json(self, key: str, ttl: float):
+        """TTL 이내 JSON 응답 반환 (없거나 만료면 None)"""
+        data = self._read(key, ttl, ".json")
+        return json.loads(data) if data is not None else None
+
+    def put_json(self, key: str, value):
+        self._write(key, json.dumps(value, ensure_ascii=False).encode("utf-8"), ".json")
+
+    # DataFrame (yfinance 히스토리 등, 로컬에서 쓴 파일만 읽음)
+    def get_frame(self, key: str, ttl: float):
+        """TTL 이내 DataFrame 반환 (없거나 만료면 None)"""
+        data = self._read(key, ttl, ".pkl")
+        return pickle.loads(data) if data is not None else None
+
+    def put_frame(self, key: str, frame):
+        self._write(key, pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL), ".pkl")
+
+    def evict(self) -> int:
+        """
+        크기 상한 초과 시 오래 사용되지 않은 항목부터 삭제 (상한의 90%까지)
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        with self._lock:
+            entries, total = self._scan()
+            self._size = total
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._size = total
+            return removed
+
+    def _scan(self) -> tuple:
+        """캐시 파일 목록 [(mtime, size, path)]과 전체 크기"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries, sum(size for _, size, _ in entries)
+
+
+# 기본 캐시 (data/.cache)
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """config.CACHE_DIR 응답 캐시 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                config.CACHE_DIR,
+                max_bytes=int(config.RESPONSE_CACHE_MAX_MB * 1024 * 1024),
+                bypass=config.RESPONSE_CACHE_BYPASS,
+            )
+        return _cache
+
+
+def ttl_for_cycle(cycle: str) -> float:
+    """시계열 주기별 TTL (D: 일간, 그 외 M/Q/A: 월간 이상)"""
+    return config.CACHE_TTL_DAILY if cycle == "D" else config.CACHE_TTL_MONTHLY
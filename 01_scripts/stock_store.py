@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주가 CSV 저장소 (Stock Store)
+=============================
+stock.csv를 append 전용으로 갱신하고 (bar_date, ticker) 키 인덱스를 별도 파일로 유지
+
+기존 방식:
+    매 실행마다 stock.csv 전체 read → concat → drop_duplicates → 전체 rewrite
+변경 방식:
+    - 새 행은 stock.csv 끝에 append (신규 행 수에 비례하는 비용)
+    - 같은 키가 다시 들어오면 뒤에 append된 행이 우선 (last-writer-wins)
+    - 덮어써진 행(dead)이 일정 비율을 넘으면 백그라운드 스레드에서 compaction
+      (중복 제거 후 원자적 교체) → stock.csv는 기존과 같은 형식의 CSV로 유지
+    - 임계값 전까지는 같은 키의 행이 여러 개 남으므로, 중복 없는 데이터가 필요한
+      곳(08 스크립트, 노트북)은 StockStore.read_latest()로 읽음 (파일은 그대로)
+
+파일 구성:
+    stock.csv            데이터 (기존 CSV 그대로, 컬럼 순서는 파일 헤더 기준)
+    stock.csv.idx        키 인덱스 (행마다 "bar_date<TAB>ticker<TAB>status" 1줄)
+    stock.csv.meta.json  인덱스가 반영한 stock.csv 크기 (불일치 시 인덱스 재생성)
+
+사용법:
+    python 01_scripts/stock_store.py --compact         # 즉시 compaction
+    python 01_scripts/stock_store.py --export out.csv  # 중복 제거된 CSV 내보내기
+
+Created: 2026-10-18
+"""
+
+import argparse
+import csv
+import json
+import os
+import threading
+
+import pandas as pd
+
+from config import config
+
+KEY_COLUMNS = ("bar_date", "ticker")
+
+
+class StockStore:
+    """stock.csv append/upsert 저장소"""
+
+    def __init__(self, csv_path: str, compact_ratio: float = 0.3, compact_min_rows: int = 200):
+        """
+        Args:
+            csv_path: stock.csv 경로
+            compact_ratio: 전체 행 대비 dead 행 비율이 이 값을 넘으면 compaction
+            compact_min_rows: dead 행이 이 수 미만이면 compaction 생략
+        """
+        self.csv_path = csv_path
+        self.idx_path = f"{csv_path}.idx"
+        self.meta_path = f"{csv_path}.meta.json"
+        self.compact_ratio = compact_ratio
+        self.compact_min_rows = compact_min_rows
+
+        self._lock = threading.Lock()
+        self._compact_thread = None
+        self._keys = None     # {(bar_date, ticker): status}
+        self._rows = 0        # stock.csv 데이터 행 수 (dead 포함)
+
+    # ------------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------------
+    def _csv_size(self) -> int:
+        return os.path.getsize(self.csv_path) if os.path.exists(self.csv_path) else 0
+
+    def _load_index(self):
+        """키 인덱스 로드 (stock.csv 크기와 맞지 않으면 CSV에서 재생성)"""
+        if self._keys is not None:
+            return
+
+        meta = {}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+
+        if os.path.exists(self.idx_path) and meta.get("csv_bytes") == self._csv_size():
+            keys, rows = {}, 0
+            with open(self.idx_path, encoding="utf-8") as f:
+                for line in f:
+                    bar_date, ticker, status = line.rstrip("\n").split("\t")
+                    keys[(bar_date, ticker)] = status
+                    rows += 1
+            self._keys, self._rows = keys, rows
+            return
+
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """stock.csv 전체를 읽어 인덱스 재작성"""
+        entries = []
+        if os.path.exists(self.csv_path):
+            df = self._read_raw()
+            entries = list(zip(df["bar_date"], df["ticker"], df["status"]))
+
+        self._keys = {(bar_date, ticker): status for bar_date, ticker, status in entries}
+        self._rows = len(entries)
+
+        with open(self.idx_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{d}\t{t}\t{s}\n" for d, t, s in entries)
+        self._write_meta()
+
+    def _write_meta(self):
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump({"csv_bytes": self._csv_size(), "rows": self._rows}, f)
+
+    def _read_raw(self) -> pd.DataFrame:
+        """stock.csv를 문자열 그대로 읽기 (값 포맷 보존)"""
+        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+        for col in ("bar_date", "ticker", "status"):
+            if col not in df.columns:
+                df[col] = ""
+        return df
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.csv_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _read_header(self) -> list:
+        with open(self.csv_path, encoding="utf-8-sig", newline="") as f:
+            return next(csv.reader(f), [])
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @property
+    def dead_rows(self) -> int:
+        """덮어써진(중복) 행 수"""
+        with self._lock:
+            self._load_index()
+            return self._rows - len(self._keys)
+
+    def get_status(self, bar_date, ticker: str):
+        """(bar_date, ticker) 키의 최신 status 반환 (없으면 None)"""
+        with self._lock:
+            self._load_index()
+            return self._keys.get((str(bar_date), ticker))
+
+    def read_latest(self, typed: bool = False) -> pd.DataFrame:
+        """
+        키마다 마지막(최신) 행만 남긴 stock.csv 내용 반환 (파일은 변경하지 않음)
+
+        Args:
+            typed: True면 pd.read_csv 기본 타입 추론, False면 값을 문자열 그대로
+        """
+        self.wait_for_compaction()
+        if typed:
+            df = pd.read_csv(self.csv_path, encoding="utf-8-sig")
+        else:
+            df = self._read_raw()
+        return df.drop_duplicates(subset=list(KEY_COLUMNS), keep="last").reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def upsert(self, rows: list) -> dict:
+        """
+        행 upsert (stock.csv 끝에 append, 같은 키는 뒤의 행이 우선)
+
+        Args:
+            rows: stock.csv 행 딕셔너리 리스트 (bar_date, ticker, status 필수)
+
+        Returns:
+            dict: {'new': 신규 키 수, 'updated': 갱신 키 수, 'keys': 전체 키 수, 'dead': dead 행 수}
+        """
+        if not rows:
+            return {'new': 0, 'updated': 0, 'keys': 0, 'dead': 0}
+
+        self.wait_for_compaction()
+
+        with self._lock:
+            self._load_index()
+
+            exists = os.path.exists(self.csv_path) and self._csv_size() > 0
+            header = self._read_header() if exists else list(rows[0].keys())
+            extra = [c for r in rows for c in r.keys() if c not in header]
+            if extra:
+                # 새 컬럼이 생기면 append 불가 → 전체 rewrite로 스키마 확장
+                return self._rewrite_with(rows)
+
+            new_keys = updated = 0
+            entries = []
+            for row in rows:
+                key = (str(row["bar_date"]), str(row["ticker"]))
+                if key in self._keys:
+                    updated += 1
+                else:
+                    new_keys += 1
+                self._keys[key] = str(row["status"])
+                entries.append((key[0], key[1], str(row["status"])))
+
+            needs_newline = exists and not self._ends_with_newline()
+            with open(self.csv_path, "a" if exists else "w",
+                      encoding="utf-8" if exists else "utf-8-sig", newline="") as f:
+                if needs_newline:
+                    f.write("\n")
+                writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore", lineterminator="\n")
+                if not exists:
+                    writer.writeheader()
+                writer.writerows(rows)
+
+            with open(self.idx_path, "a" if exists else "w", encoding="utf-8") as f:
+                f.writelines(f"{d}\t{t}\t{s}\n" for d, t, s in entries)
+
+            self._rows += len(rows)
+            self._write_meta()
+
+            return {'new': new_keys, 'updated': updated,
+                    'keys': len(self._keys), 'dead': self._rows - len(self._keys)}
+
+    def _rewrite_with(self, rows: list) -> dict:
+        """기존 내용 + 새 행을 합쳐 전체 재작성 (스키마 변경 시에만 사용, 락 보유 상태)"""
+        before = set(self._keys)
+        df_new = pd.DataFrame(rows).astype(str)
+        df = pd.concat([self._read_raw(), df_new], ignore_index=True) if os.path.exists(self.csv_path) else df_new
+        df = df.fillna("").drop_duplicates(subset=list(KEY_COLUMNS), keep="last")
+        self._replace_csv(df)
+
+        new_keys = sum((str(r["bar_date"]), str(r["ticker"])) not in before for r in rows)
+        return {'new': new_keys, 'updated': len(rows) - new_keys, 'keys': len(self._keys), 'dead': 0}
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+    def needs_compaction(self) -> bool:
+        """dead 행 비율이 임계값을 넘었는지"""
+        with self._lock:
+            self._load_index()
+            dead = self._rows - len(self._keys)
+            return dead >= self.compact_min_rows and dead > self._rows * self.compact_ratio
+
+    def compact(self) -> int:
+        """
+        중복 제거 후 stock.csv 원자적 교체
+
+        Returns:
+            int: 제거된 행 수
+        """
+        with self._lock:
+            if not os.path.exists(self.csv_path):
+                return 0
+            df = self._read_raw()
+            before = len(df)
+            df = df.drop_duplicates(subset=list(KEY_COLUMNS), keep="last")
+            self._replace_csv(df)
+            return before - len(df)
+
+    def _replace_csv(self, df: pd.DataFrame):
+        """임시 파일에 쓴 뒤 os.replace로 교체하고 인덱스 재생성 (락 보유 상태)"""
+        tmp_path = f"{self.csv_path}.tmp"
+        df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        os.replace(tmp_path, self.csv_path)
+        self._rebuild_index()
+
+    def compact_in_background(self) -> threading.Thread:
+        """백그라운드 스레드에서 compaction 실행 (프로세스 종료 전 완료됨)"""
+        if self._compact_thread is not None and self._compact_thread.is_alive():
+            return self._compact_thread
+
+        def run():
+            try:
+                removed = self.compact()
+                print(f"  stock.csv compaction 완료: 중복 {removed}행 제거")
+            except Exception as e:
+                print(f"  stock.csv compaction 오류: {e}")
+
+        self._compact_thread = threading.Thread(target=run, name="stock-compact")
+        self._compact_thread.start()
+        return self._compact_thread
+
+    def wait_for_compaction(self):
+        """진행 중인 백그라운드 compaction 완료 대기"""
+        thread = self._compact_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
+# 기본 저장소 (data/stock/stock.csv)
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_stock_store() -> StockStore:
+    """config.STOCK_DIR의 stock.csv 저장소 반환"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = StockStore(
+                os.path.join(config.STOCK_DIR, "stock.csv"),
+                compact_ratio=config.STOCK_STORE_COMPACT_RATIO,
+            )
+        return _store
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="stock.csv 저장소 관리")
+    parser.add_argument("--compact", action="store_true", help="중복 행 제거 (stock.csv 재작성)")
+    parser.add_argument("--export", default="", help="중복 제거된 CSV를 지정 경로로 내보내기")
+    args = parser.parse_args()
+
+    store = get_stock_store()
+    print(f"stock.csv: dead 행 {store.dead_rows}건")
+
+    if args.compact:
+        print(f"compaction 완료: {store.compact()}행 제거")
+    if args.export:
+        store.read_latest().to_csv(args.export, index=False, encoding="utf-8-sig")
+        print(f"내보내기 완료: {args.export}")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 실행 시간 추적 (Tracing)
+===============================
+수집 단계(fetch, parse, csv_write, influx_write 등)별 소요 시간을 span으로 기록
+
+- with span("fetch", source="stock", ticker="AAPL"): ... 형태로 구간 측정
+- 스레드별 span 스택 유지 → 중첩 span은 부모의 source/ticker를 상속하고
+  parent 필드에 부모 단계명을 기록
+- 수집 종료 시 flush_spans()로 InfluxDB 공유 Writer에 일괄 적재
+
+Measurement: collector_spans
+Tags: stage, source, ticker (종목 단위 span만)
+Fields: duration_ms, parent, depth, ok (예외 발생 시 0)
+
+설정 (.env):
+    TRACING_ENABLED: span 기록 여부 (기본 1)
+
+사용법:
+    from tracing import span, flush_spans
+    with span("fetch", source="news"):
+        ...
+    flush_spans()  # 수집 종료 시 (InfluxDB 적재 + 단계별 요약 반환)
+
+Created: 2026-10-18
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from config import config
+from influx_writer import get_writer
+
+# InfluxDB 클라이언트 (선택적 import)
+try:
+    from influxdb_client import Point, WritePrecision
+    INFLUXDB_AVAILABLE = True
+except ImportError:
+    INFLUXDB_AVAILABLE = False
+
+MEASUREMENT = "collector_spans"
+
+_local = threading.local()
+_finished = []
+_finished_lock = threading.Lock()
+
+
+def _stack() -> list:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def span(stage: str, source: str = None, ticker: str = None):
+    """
+    구간 실행 시간 측정
+
+    Args:
+        stage: 단계명 (collect, fetch, parse, csv_write, influx_write 등)
+        source: 데이터 소스 (news, stock, economy, ecos, yahoo 등, 생략 시 부모 상속)
+        ticker: 종목/지표 (생략 시 부모 상속)
+    """
+    if not config.TRACING_ENABLED:
+        yield
+        return
+
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    record = {
+        "stage": stage,
+        "source": source or (parent["source"] if parent else "collector"),
+        "ticker": ticker or (parent["ticker"] if parent else None),
+        "parent": parent["stage"] if parent else "",
+        "depth": len(stack),
+        "start_ns": time.time_ns(),
+        "ok": True,
+    }
+    stack.append(record)
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        record["ok"] = False
+        raise
+    finally:
+        record["duration_ms"] = (time.perf_counter() - started) * 1000
+        stack.pop()
+        with _finished_lock:
+            _finished.append(record)
+
+
+def summarize(records: list = None) -> list:
+    """
+    (source, stage)별 합계/횟수/최대 소요 시간 (합계 내림차순)
+
+    Returns:
+        list: [{'source', 'stage', 'count', 'total_ms', 'max_ms'}, ...]
+    """
+    if records is None:
+        with _finished_lock:
+            records = list(_finished)
+
+    totals = {}
+    for r in records:
+        item = totals.setdefault((r["source"], r["stage"]), {
+            "source": r["source"], "stage": r["stage"], "count": 0, "total_ms": 0.0, "max_ms": 0.0,
+        })
+        item["count"] += 1
+        item["total_ms"] += r["duration_ms"]
+        item["max_ms"] = max(item["max_ms"], r["duration_ms"])
+    return sorted(totals.values(), key=lambda x: x["total_ms"], reverse=True)
+
+
+def flush_spans() -> list:
+    """
+    완료된 span을 InfluxDB 공유 Writer에 적재하고 비움
+
+    Returns:
+        list: summarize() 결과 (출력용)
+    """
+    with _finished_lock:
+        records = list(_finished)
+        _finished.clear()
+
+    writer = get_writer() if INFLUXDB_AVAILABLE else None
+    if writer and records:
+        points = []
+        for r in records:
+            p = Point(MEASUREMENT) \
+                .tag("stage", r["stage"]) \
+                .tag("source", r["source"]) \
+                .field("duration_ms", round(r["duration_ms"], 3)) \
+                .field("parent", r["parent"]) \
+                .field("depth", r["depth"]) \
+                .field("ok", 1 if r["ok"] else 0) \
+                .time(r["start_ns"], WritePrecision.NS)
+            if r["ticker"]:
+                p.tag("ticker", r["ticker"])
+            points.append(p)
+        try:
+            writer.write(points)
+        except Exception as e:
+            print(f"  span 적재 오류: {e}")
+
+    return summarize(records)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+거래소 캘린더 (Trading Calendar)
+================================
+KRX(한국거래소) / NYSE(뉴욕증권거래소) 휴장일·단축 거래일 판정
+
+- 연도별 휴장일/장 마감 시각을 최초 조회 시 계산해 캐시 (lru_cache)
+  → 이후 날짜 조회는 dict 조회 1회 (O(1))
+- NYSE: 규칙 기반 (관측일 보정, 부활절 기준 성금요일, 2022년~ 준틴스)
+  + 임시 휴장(국장 등), 13:00 조기 폐장 (독립기념일 전일, 추수감사절 익일, 성탄 전일)
+- KRX: 양력 공휴일 + 근로자의 날 + 연말 휴장일 규칙
+  + 음력/대체/임시/선거일 휴일 테이블 (KRX_EXTRA_HOLIDAYS)
+  + 수능일 장 마감 1시간 연장 (KRX_LATE_CLOSE_DAYS)
+
+KRX 테이블 갱신:
+    음력 휴일은 규칙으로 계산하지 않으므로 KRX_EXTRA_HOLIDAYS에 매년 다음 연도 항목을 추가해야 함
+    (KRX 휴장일 공지 기준, 수능일도 KRX_LATE_CLOSE_DAYS에 함께 추가)
+    - 테이블에 없는 연도는 양력 공휴일만 휴장으로 판정 → 설날/추석을 거래일로 보고
+      수집기가 해당 세션을 계속 재조회하므로, 처음 조회할 때 경고를 1회 출력
+
+사용법:
+    from trading_calendar import is_trading_day, target_session
+    is_trading_day("KRX", date(2026, 2, 17))        # False (설날)
+    target_session("NYSE", datetime.now(timezone.utc))  # 마감 확정된 최근 거래일
+
+Created: 2026-10-18
+"""
+
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+import pytz
+
+EXCHANGES = {
+    # 거래소: (타임존, 정규장 마감 시각)
+    "KRX": ("Asia/Seoul", time(15, 30)),
+    "NYSE": ("America/New_York", time(16, 0)),
+}
+
+NYSE_EARLY_CLOSE = time(13, 0)
+
+# 장 마감 후 일봉 확정까지 대기 시간 (분)
+CLOSE_BUFFER_MINUTES = 10
+
+# KRX 음력 공휴일(설날/추석/부처님오신날) + 대체공휴일 + 임시공휴일 + 선거일
+KRX_EXTRA_HOLIDAYS = {
+    2010: {"2010-02-15": "설날", "2010-05-21": "부처님오신날", "2010-06-02": "지방선거",
+           "2010-09-21": "추석", "2010-09-22": "추석", "2010-09-23": "추석"},
+    2011: {"2011-02-02": "설날", "2011-02-03": "설날", "2011-02-04": "설날",
+           "2011-05-10": "부처님오신날", "2011-09-12": "추석", "2011-09-13": "추석"},
+    2012: {"2012-01-23": "설날", "2012-01-24": "설날", "2012-04-11": "국회의원선거",
+           "2012-05-28": "부처님오신날", "2012-10-01": "추석", "2012-12-19": "대통령선거"},
+    2013: {"2013-02-11": "설날", "2013-05-17": "부처님오신날",
+           "2013-09-18": "추석", "2013-09-19": "추석", "2013-09-20": "추석"},
+    2014: {"2014-01-30": "설날", "2014-01-31": "설날", "2014-05-06": "부처님오신날",
+           "2014-06-04": "지방선거", "2014-09-08": "추석", "2014-09-09": "추석",
+           "2014-09-10": "대체공휴일"},
+    2015: {"2015-02-18": "설날", "2015-02-19": "설날", "2015-02-20": "설날",
+           "2015-05-25": "부처님오신날", "2015-08-14": "임시공휴일",
+           "2015-09-28": "추석", "2015-09-29": "대체공휴일"},
+    2016: {"2016-02-08": "설날", "2016-02-09": "설날", "2016-02-10": "대체공휴일",
+           "2016-04-13": "국회의원선거", "2016-05-06": "임시공휴일",
+           "2016-09-14": "추석", "2016-09-15": "추석", "2016-09-16": "추석"},
+    2017: {"2017-01-27": "설날", "2017-01-30": "대체공휴일", "2017-05-03": "부처님오신날",
+           "2017-05-09": "대통령선거", "2017-10-02": "임시공휴일", "2017-10-04": "추석",
+           "2017-10-05": "추석", "2017-10-06": "대체공휴일"},
+    2018: {"2018-02-15": "설날", "2018-02-16": "설날", "2018-05-07": "대체공휴일",
+           "2018-05-22": "부처님오신날", "2018-06-13": "지방선거", "2018-09-24": "추석",
+           "2018-09-25": "추석", "2018-09-26": "대체공휴일"},
+    2019: {"2019-02-04": "설날", "2019-02-05": "설날", "2019-02-06": "설날",
+           "2019-05-06": "대체공휴일", "2019-09-12": "추석", "2019-09-13": "추석"},
+    2020: {"2020-01-24": "설날", "2020-01-27": "대체공휴일", "2020-04-15": "국회의원선거",
+           "2020-04-30": "부처님오신날", "2020-08-17": "임시공휴일", "2020-09-30": "추석",
+           "2020-10-01": "추석", "2020-10-02": "추석"},
+    2021: {"2021-02-11": "설날", "2021-02-12": "설날", "2021-05-19": "부처님오신날",
+           "2021-08-16": "대체공휴일", "2021-09-20": "추석", "2021-09-21": "추석",
+           "2021-09-22": "추석", "2021-10-04": "대체공휴일", "2021-10-11": "대체공휴일"},
+    2022: {"2022-01-31": "설날", "2022-02-01": "설날", "2022-02-02": "설날",
+           "2022-03-09": "대통령선거", "2022-06-01": "지방선거", "2022-09-09": "추석",
+           "2022-09-12": "대체공휴일", "2022-10-10": "대체공휴일"},
+    2023: {"2023-01-23": "설날", "2023-01-24": "대체공휴일", "2023-05-29": "대체공휴일",
+           "2023-09-28": "추석", "2023-09-29": "추석", "2023-10-02": "임시공휴일"},
+    2024: {"2024-02-09": "설날", "2024-02-12": "대체공휴일", "2024-04-10": "국회의원선거",
+           "2024-05-06": "대체공휴일", "2024-05-15": "부처님오신날", "2024-09-16": "추석",
+           "2024-09-17": "추석", "2024-09-18": "추석", "2024-10-01": "임시공휴일"},
+    2025: {"2025-01-27": "임시공휴일", "2025-01-28": "설날", "2025-01-29": "설날",
+           "2025-01-30": "설날", "2025-03-03": "대체공휴일", "2025-05-06": "대체공휴일",
+           "2025-06-03": "대통령선거", "2025-10-06": "추석", "2025-10-07": "추석",
+           "2025-10-08": "대체공휴일"},
+    2026: {"2026-02-16": "설날", "2026-02-17": "설날", "2026-02-18": "설날",
+           "2026-03-02": "대체공휴일", "2026-05-25": "대체공휴일", "2026-06-03": "지방선거",
+           "2026-08-17": "대체공휴일", "2026-09-24": "추석", "2026-09-25": "추석",
+           "2026-10-05": "대체공휴일"},
+    2027: {"2027-02-08": "설날", "2027-02-09": "대체공휴일", "2027-05-13": "부처님오신날",
+           "2027-08-16": "대체공휴일", "2027-09-14": "추석", "2027-09-15": "추석",
+           "2027-09-16": "추석", "2027-10-04": "대체공휴일", "2027-10-11": "대체공휴일",
+           "2027-12-27": "대체공휴일"},
+}
+
+# 수능일: KRX 개장/마감 1시간 지연 (마감 16:30)
+KRX_LATE_CLOSE_DAYS = {
+    "2018-11-15", "2019-11-14", "2020-12-03", "2021-11-18", "2022-11-17",
+    "2023-11-16", "2024-11-14", "2025-11-13", "2026-11-19",
+}
+
+# NYSE 임시 휴장 (국장, 허리케인 등)
+NYSE_SPECIAL_CLOSURES = {
+    "2012-10-29": "Hurricane Sandy", "2012-10-30": "Hurricane Sandy",
+    "2018-12-05": "National Day of Mourning (G.H.W. Bush)",
+    "2025-01-09": "National Day of Mourning (Carter)",
+}
+
+
+# =============================================================================
+# 휴장일 계산
+# =============================================================================
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """해당 월의 n번째 요일 (n=-1이면 마지막)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """NYSE 관측일 보정 (토 → 금, 일 → 월)"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nyse_holidays(year: int) -> dict:
+    holidays = {}
+
+    # 신정: 토요일이면 전년도 12/31은 휴장하지 않음 (일요일만 월요일 대체)
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+
+    holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+    holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+
+    for day, name in NYSE_SPECIAL_CLOSURES.items():
+        if day.startswith(str(year)):
+            holidays[date.fromisoformat(day)] = name
+
+    return {day: name for day, name in holidays.items() if day.year == year}
+
+
+def _nyse_early_closes(year: int, holidays: dict) -> dict:
+    candidates = [
+        date(year, 7, 3),                                        # 독립기념일 전일
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),        # 추수감사절 익일
+        date(year, 12, 24),                                      # 성탄 전일
+    ]
+    return {
+        day: NYSE_EARLY_CLOSE for day in candidates
+        if day.weekday() < 4 or (day.month == 11 and day.weekday() == 4)
+        if day not in holidays
+    }
+
+
+def _last_weekday_of_year(year: int) -> date:
+    day = date(year, 12, 31)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def _krx_holidays(year: int) -> dict:
+    holidays = {
+        date(year, 1, 1): "신정",
+        date(year, 3, 1): "삼일절",
+        date(year, 5, 1): "근로자의 날",
+        date(year, 5, 5): "어린이날",
+        date(year, 6, 6): "현충일",
+        date(year, 8, 15): "광복절",
+        date(year, 10, 3): "개천절",
+        date(year, 12, 25): "성탄절",
+    }
+    if year >= 2013:
+        holidays[date(year, 10, 9)] = "한글날"
+
+    if year not in KRX_EXTRA_HOLIDAYS:
+        # _year_table 캐시 덕분에 연도별 1회만 출력
+        print(f"  ⚠️ KRX {year}년은 음력/대체 휴일 테이블 범위({min(KRX_EXTRA_HOLIDAYS)}~"
+              f"{max(KRX_EXTRA_HOLIDAYS)}년) 밖 → 설날/추석 등을 거래일로 판정 (KRX_EXTRA_HOLIDAYS 갱신 필요)")
+    for day, name in KRX_EXTRA_HOLIDAYS.get(year, {}).items():
+        holidays[date.fromisoformat(day)] = name
+
+    # 연말 휴장일 (12/31, 주말이면 직전 평일)
+    holidays.setdefault(_last_weekday_of_year(year), "연말 휴장일")
+    return holidays
+
+
+@lru_cache(maxsize=None)
+def _year_table(exchange: str, year: int) -> tuple:
+    """(휴장일 {date: 이름}, 마감 시각 예외 {date: time}) - 연도별 1회 계산"""
+    if exchange == "NYSE":
+        holidays = _nyse_holidays(year)
+        closes = _nyse_early_closes(year, holidays)
+    elif exchange == "KRX":
+        holidays = _krx_holidays(year)
+        closes = {
+            date.fromisoformat(day): time(16, 30)
+            for day in KRX_LATE_CLOSE_DAYS if day.startswith(str(year))
+        }
+    else:
+        raise ValueError(f"지원하지 않는 거래소: {exchange}")
+    return MappingProxyType(holidays), MappingProxyType(closes)
+
+
+# =============================================================================
+# 조회 API
+# =============================================================================
+def holidays(exchange: str, year: int):
+    """해당 연도 휴장일 {date: 이름} (읽기 전용, 주말 제외)"""
+    return _year_table(exchange, year)[0]
+
+
+def holiday_name(exchange: str, day: date):
+    """휴장 사유 (주말이면 '주말', 거래일이면 None)"""
+    if day.weekday() >= 5:
+        return "주말"
+    return _year_table(exchange, day.year)[0].get(day)
+
+
+def is_trading_day(exchange: str, day: date) -> bool:
+    """거래일 여부"""
+    return day.weekday() < 5 and day not in _year_table(exchange, day.year)[0]
+
+
+def session_close(exchange: str, day: date) -> time:
+    """해당 거래일의 장 마감 시각 (현지 시각, 조기/지연 마감 반영)"""
+    return _year_table(exchange, day.year)[1].get(day, EXCHANGES[exchange][1])
+
+
+def previous_trading_day(exchange: str, day: date) -> date:
+    """day 이전(미포함) 최근 거래일"""
+    day -= timedelta(days=1)
+    while not is_trading_day(exchange, day):
+        day -= timedelta(days=1)
+    return day
+
+
+def local_date(exchange: str, now_utc: datetime) -> date:
+    """거래소 현지 날짜"""
+    return now_utc.astimezone(pytz.timezone(EXCHANGES[exchange][0])).date()
+
+
+def target_session(exchange: str, now_utc: datetime, buffer_minutes: int = CLOSE_BUFFER_MINUTES) -> date:
+    """
+    일봉이 확정된 최근 거래일
+
+    오늘이 거래일이고 마감(+버퍼)이 지났으면 오늘, 아니면 직전 거래일.
+    """
+    local_now = now_utc.astimezone(pytz.timezone(EXCHANGES[exchange][0]))
+    today = local_now.date()
+    if is_trading_day(exchange, today):
+        close_at = datetime.combine(today, session_close(exchange, today)) + timedelta(minutes=buffer_minutes)
+        if local_now.replace(tzinfo=None) >= close_at:
+            return today
+    return previous_trading_day(exchange, today)
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파이프라인 핫패스 벤치마크 (Benchmarks)
+=======================================
+실제 운영에서 도는 구간의 소요 시간 / 최대 메모리(RSS) / 처리량(rows/sec)을 측정하고
+기준선(baseline)과 비교해 성능 회귀를 Pi에 배포하기 전에 확인
+
+측정 구간 (케이스):
+    collector_stock  01 collect_stock_data (로컬 대역 서버, 종목 수 = 현재 × 배율)
+                     측정 후 같은 거래일 재실행 → read_latest()에 갱신이 안 보이면 실패
+    merge            03 기간별 archive CSV 병합
+    backfill_points  04 CSV 읽기 + 라인 프로토콜 변환 (적재 없음)
+    backfill_write   04 백필 전체 (로컬 대역 서버의 /influx로 적재)
+    validate         09 load_csv_sets + summarize (InfluxDB 키 = CSV 키로 가정)
+
+- 케이스마다 별도 프로세스에서 실행 (최대 RSS가 케이스끼리 섞이지 않도록)
+  최대 RSS는 import 포함 프로세스 전체 기준
+- 입력 데이터는 synthetic_data.py가 배율별로 생성 (benchmarks/.data/x<배율>, 재사용)
+- 결과: benchmarks/results/<시각>.json (실행마다 새 파일)
+- 기준선: benchmarks/results/baseline.json
+  --save-baseline 시 기존 기준선은 baseline_<시각>.json으로 보관 후 교체
+- --repeat N이면 소요 시간은 최솟값, RSS는 최댓값 사용
+
+사용법:
+    python benchmarks/run_benchmarks.py                      # x1 전체 케이스
+    python benchmarks/run_benchmarks.py --scales 1 10 --cases merge validate
+    python benchmarks/run_benchmarks.py --save-baseline      # 현재 결과를 기준선으로
+    python benchmarks/run_benchmarks.py --fail-on-regression --threshold 15
+
+Created: 2026-10-18
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+SCRIPTS_DIR = ROOT_DIR / "01_scripts"
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_FILE = RESULTS_DIR / "baseline.json"
+
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from synthetic_data import ensure_dataset  # noqa: E402
+
+CASES = ("collector_stock", "merge", "backfill_points", "backfill_write", "validate")
+
+# 대역 서버 Yahoo 응답 지연 (Pi → Yahoo 왕복과 비슷한 수준)
+DEFAULT_LATENCY_MS = 30
+DEFAULT_JITTER_MS = 10
+
+
+# =============================================================================
+# 케이스 (자식 프로세스에서 실행, 처리 행 수와 부가 정보 반환)
+# =============================================================================
+
+def _start_fake_upstreams(latency_ms: float):
+    """대역 서버 시작 후 환경변수 적용 (config를 import하기 전에 호출)"""
+    from fake_upstreams import start_server
+
+    server = start_server(latency_ms={"default": 0, "yahoo": latency_ms},
+                          jitter_ms={"default": 0, "yahoo": min(latency_ms, DEFAULT_JITTER_MS)})
+    os.environ.update(server.env())
+    return server
+
+
+def _import_script(name: str):
+    import importlib
+    return importlib.import_module(name)
+
+
+def case_collector_stock(manifest: dict, work_dir: Path, latency_ms: float):
+    server = _start_fake_upstreams(latency_ms)
+
+    from config import config
+    # 수집 결과/캐시/서킷 상태는 임시 디렉터리로 (운영 데이터와 분리, 캐시 적중 없이 측정)
+    config.STOCK_DIR = str(work_dir / "stock")
+    config.NEWS_DIR = str(work_dir / "news")
+    config.ECONOMY_DIR = str(work_dir / "economy")
+    config.CACHE_DIR = str(work_dir / ".cache")
+    config.CIRCUIT_STATE_FILE = str(work_dir / "circuit_state.json")
+
+    scale = manifest["scale"]
+    kr, us = dict(config.KR_TICKERS), dict(config.US_TICKERS)
+    for i in range(len(kr) * (scale - 1)):
+        kr[f"합성종목{i:05d}"] = f"{900000 + i:06d}.KS"
+    for i in range(len(us) * (scale - 1)):
+        us[f"Synthetic {i:05d}"] = f"ZZ{i:05d}"
+    config.KR_TICKERS, config.US_TICKERS = kr, us
+
+    collector = _import_script("01_data_collector")
+    from influx_writer import close_writer
+
+    start = time.perf_counter()
+    collector.collect_stock_data()
+    close_writer()
+    elapsed = time.perf_counter() - start
+
+    extra = {
+        "yahoo_requests": server.stats["yahoo"]["requests"],
+        "influx_lines": server.influx_lines,
+        "influx_wire_bytes": server.influx_wire_bytes,
+    }
+    extra["rerun_updated"] = _check_rerun_dedup(collector)
+    server.shutdown()
+    return elapsed, len(kr) + len(us), extra
+
+
+def _check_rerun_dedup(collector) -> int:
+    """
+    같은 거래일 재실행 후 StockStore.read_latest() 결과 확인 (측정 시간 제외)
+
+    첫 실행 때 절반이 일봉 게시 전(stale)이었던 것처럼 되돌린 뒤 다시 수집해서
+    갱신(덮어쓰기)이 생기게 한다. read_latest()에 키 중복이 있거나 stale 행이
+    확정 일봉으로 바뀌지 않았으면 RuntimeError (케이스 실패).
+
+    Returns:
+        int: 재실행에서 stale → 확정 일봉으로 갱신한 행 수
+    """
+    import pandas as pd
+    from influx_writer import close_writer
+    from stock_store import KEY_COLUMNS, get_stock_store
+
+    store = get_stock_store()
+    stale = store.read_latest().iloc[::2].assign(status="stale").to_dict("records")
+    store.upsert(stale)
+
+    collector.collect_stock_data()
+    close_writer()
+
+    latest = store.read_latest()
+    duplicates = int(latest.duplicated(subset=list(KEY_COLUMNS)).sum())
+    if duplicates:
+        raise RuntimeError(f"재실행 후 read_latest() 키 중복 {duplicates}행")
+    refetched = int((latest.merge(pd.DataFrame(stale)[list(KEY_COLUMNS)])["status"] == "success").sum())
+    if refetched != len(stale):
+        raise RuntimeError(f"재실행에서 stale {len(stale)}행 중 {refetched}행만 갱신")
+    return refetched
+
+
+def case_merge(manifest: dict, work_dir: Path, latency_ms: float):
+    merge = _import_script("03_merge_historical_data")
+
+    start = time.perf_counter()
+    results = merge.main(archive_dir=Path(manifest["dir"]) / "archive", output_dir=work_dir)
+    elapsed = time.perf_counter() - start
+
+    merged = sum(summary["rows"] for summary in results.values() if summary is not None)
+    return elapsed, manifest["rows"]["archive"], {"merged_rows": merged}
+
+
+def case_backfill_points(manifest: dict, work_dir: Path, latency_ms: float):
+    import pandas as pd
+
+    backfill = _import_script("04_influxdb_backfill_15years")
+
+    start = time.perf_counter()
+    points = 0
+    line_bytes = 0
+    for _, _, filename, _, _, build_lines in backfill.BACKFILL_FILES:
+        df = pd.read_csv(Path(manifest["dir"]) / filename, encoding="utf-8-sig")
+        df["date"] = pd.to_datetime(df["date"])
+        lines = build_lines(df)[0]
+        points += len(lines)
+        line_bytes += sum(len(line) for line in lines)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, manifest["rows"]["merged_total"], {"points": points, "line_bytes": line_bytes}
+
+
+def case_backfill_write(manifest: dict, work_dir: Path, latency_ms: float):
+    server = _start_fake_upstreams(latency_ms)
+    backfill = _import_script("04_influxdb_backfill_15years")
+    # 체크포인트/학습한 배치 크기는 실행마다 새로 시작 (data/ 파일을 건드리지 않음)
+    backfill.config.BACKFILL_CHECKPOINT_FILE = str(work_dir / "backfill_checkpoint.json")
+    backfill.config.ADAPTIVE_BATCH_STATE_FILE = str(work_dir / "batch_size.json")
+
+    start = time.perf_counter()
+    backfill.main(data_dir=manifest["dir"])
+    elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    return elapsed, manifest["rows"]["merged_total"], {
+        "influx_lines": server.influx_lines,
+        "influx_requests": server.stats["influx"]["requests"],
+        "influx_wire_bytes": server.influx_wire_bytes,
+    }
+
+
+def case_validate(manifest: dict, work_dir: Path, latency_ms: float):
+    validate = _import_script("09_validate_influx_integrity")
+
+    start = time.perf_counter()
+    csv_data = validate.load_csv_sets(manifest["dir"])
+    keys = csv_data["csv_keys"]
+    influx_data = {
+        "stock_full": keys["kr_full"] | keys["us_full"],
+        "econ_full": keys["fred_raw"] | keys["ecos_raw"],
+    }
+    summary = validate.summarize(csv_data, influx_data)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, manifest["rows"]["merged_total"], {
+        "missing": summary["stock"]["kr_full"]["missing"] + summary["stock"]["us_full"]["missing"],
+    }
+
+
+CASE_FUNCS = {
+    "collector_stock": case_collector_stock,
+    "merge": case_merge,
+    "backfill_points": case_backfill_points,
+    "backfill_write": case_backfill_write,
+    "validate": case_validate,
+}
+
+
+def run_child(case: str, scale: int, latency_ms: float, result_file: str):
+    """자식 프로세스: 케이스 1개 실행 후 결과 JSON 기록"""
+    manifest = ensure_dataset(scale)
+    with tempfile.TemporaryDirectory(prefix=f"bench_{case}_") as tmp:
+        elapsed, rows, extra = CASE_FUNCS[case](manifest, Path(tmp), latency_ms)
+
+    # Linux ru_maxrss 단위는 KB
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result = {
+        "case": case,
+        "scale": scale,
+        "rows": rows,
+        "wall_sec": round(elapsed, 3),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else None,
+        "extra": extra,
+    }
+    Path(result_file).write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+
+
+# =============================================================================
+# 실행 / 기준선 비교
+# =============================================================================
+
+def run_case(case: str, scale: int, latency_ms: float, log_dir: Path) -> dict:
+    """케이스를 자식 프로세스로 실행 (출력은 로그 파일로)"""
+    log_path = log_dir / f"{case}_x{scale}.log"
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        result_file = f.name
+    try:
+        with open(log_path, "a", encoding="utf-8") as log:
+            proc = subprocess.run(
+                [sys.executable, str(Path(__file__).resolve()), "--child", case,
+                 "--scales", str(scale), "--latency-ms", str(latency_ms), "--result-file", result_file],
+                stdout=log, stderr=subprocess.STDOUT, cwd=str(SCRIPTS_DIR),
+            )
+        if proc.returncode != 0:
+            return {"case": case, "scale": scale, "error": f"exit {proc.returncode} (로그: {log_path})"}
+        return json.loads(Path(result_file).read_text(encoding="utf-8"))
+    finally:
+        os.unlink(result_file)
+
+
+def _best_of(runs: list) -> dict:
+    """반복 실행 결과 합치기 (소요 시간 최솟값, RSS 최댓값)"""
+    ok = [r for r in runs if "error" not in r]
+    if not ok:
+        return runs[-1]
+    best = dict(min(ok, key=lambda r: r["wall_sec"]))
+    best["peak_rss_mb"] = max(r["peak_rss_mb"] for r in ok)
+    best["repeat"] = len(ok)
+    return best
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(ROOT_DIR),
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _load_baseline() -> dict:
+    """{(case, scale): 결과} (기준선이 없으면 빈 dict)"""
+    try:
+        data = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {(r["case"], r["scale"]): r for r in data.get("results", []) if "error" not in r}
+
+
+def _change(current: float, base: float) -> float:
+    return (current - base) / base * 100 if base else 0.0
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """
+    기준선 대비 회귀 목록
+
+    Returns:
+        list: ["merge x10: wall_sec +23.1%", ...] (소요 시간/RSS가 threshold% 넘게 증가)
+    """
+    regressions = []
+    for r in results:
+        base = baseline.get((r["case"], r["scale"]))
+        if "error" in r or not base:
+            continue
+        for metric in ("wall_sec", "peak_rss_mb"):
+            change = _change(r[metric], base[metric])
+            if change > threshold:
+                regressions.append(f"{r['case']} x{r['scale']}: {metric} {change:+.1f}%")
+    return regressions
+
+
+def print_table(results: list, baseline: dict):
+    print(f"\n{'케이스':<18}{'배율':>6}{'행 수':>12}{'소요(초)':>10}{'기준 대비':>10}"
+          f"{'RSS(MB)':>10}{'기준 대비':>10}{'rows/sec':>12}")
+    print("-" * 88)
+    for r in results:
+        if "error" in r:
+            print(f"{r['case']:<18}{'x' + str(r['scale']):>6}  ❌ {r['error']}")
+            continue
+        base = baseline.get((r["case"], r["scale"]))
+        wall_delta = f"{_change(r['wall_sec'], base['wall_sec']):+.1f}%" if base else "-"
+        rss_delta = f"{_change(r['peak_rss_mb'], base['peak_rss_mb']):+.1f}%" if base else "-"
+        print(f"{r['case']:<18}{'x' + str(r['scale']):>6}{r['rows']:>12,}{r['wall_sec']:>10.2f}{wall_delta:>10}"
+              f"{r['peak_rss_mb']:>10.1f}{rss_delta:>10}{r['rows_per_sec']:>12,.0f}")
+
+
+def save_results(report: dict, save_baseline: bool) -> Path:
+    """결과 JSON 저장 (기준선 교체 시 기존 기준선은 보관)"""
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = report["created"].replace(":", "").replace("-", "")
+    path = RESULTS_DIR / f"{stamp}.json"
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    path.write_text(text, encoding="utf-8")
+
+    if save_baseline:
+        if BASELINE_FILE.exists():
+            previous = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+            old_stamp = previous.get("created", "old").replace(":", "").replace("-", "")
+            BASELINE_FILE.rename(RESULTS_DIR / f"baseline_{old_stamp}.json")
+        BASELINE_FILE.write_text(text, encoding="utf-8")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 핫패스 벤치마크")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1], help="데이터 배율 (예: 1 10 100)")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES), help="실행할 케이스")
+    parser.add_argument("--repeat", type=int, default=1, help="케이스별 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS, help="대역 서버 Yahoo 응답 지연")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀 판정 기준 (%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--child", choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.scales[0], args.latency_ms, args.result_file)
+        return 0
+
+    print("=" * 88)
+    print("파이프라인 벤치마크")
+    print("=" * 88)
+
+    created = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    log_dir = RESULTS_DIR / "logs" / created.replace(":", "").replace("-", "")
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for scale in args.scales:
+        manifest = ensure_dataset(scale)
+        print(f"\n[x{scale}] 입력 {manifest['rows']['merged_total']:,}행 ({manifest['dir']})")
+        for case in args.cases:
+            runs = []
+            for _ in range(args.repeat):
+                runs.append(run_case(case, scale, args.latency_ms, log_dir))
+            result = _best_of(runs)
+            status = f"❌ {result['error']}" if "error" in result else f"{result['wall_sec']:.2f}초"
+            print(f"  {case}: {status}")
+            results.append(result)
+
+    baseline = _load_baseline()
+    print_table(results, baseline)
+
+    report = {
+        "created": created,
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": _git_commit(),
+        "latency_ms": args.latency_ms,
+        "results": results,
+    }
+    path = save_results(report, args.save_baseline)
+    print(f"\n결과 저장: {path.relative_to(ROOT_DIR)}")
+    if args.save_baseline:
+        print(f"기준선 갱신: {BASELINE_FILE.relative_to(ROOT_DIR)}")
+    print(f"실행 로그: {log_dir.relative_to(ROOT_DIR)}/")
+
+    regressions = compare(results, baseline, args.threshold)
+    failed = any("error" in r for r in results)
+    if not baseline:
+        if not args.save_baseline:
+            print("기준선 없음 (--save-baseline으로 저장)")
+    elif regressions:
+        print(f"\n⚠️  기준선 대비 {args.threshold:.0f}% 초과 회귀:")
+        for line in regressions:
+            print(f"  - {line}")
+    else:
+        print(f"기준선 대비 {args.threshold:.0f}% 초과 회귀 없음")
+
+    if failed or (args.fail_on_regression and regressions):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
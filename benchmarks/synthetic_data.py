@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 데이터 생성 (Synthetic Data)
+============================================
+03 병합 / 04 백필 / 09 정합성 점검이 읽는 CSV와 같은 형식의 합성 데이터를 배율별로 생성
+
+- x1: 현재 규모 (주가 24종목 × 2010~2025 영업일 + FRED 14개 + ECOS 3개 ≈ 12만 행)
+- x10, x100: 종목/지표 수를 배율만큼 늘림 (기간은 동일)
+- archive/{stock_kr,stock_us,economy_fred,economy_ecos}_{기간}_v3.csv
+  → 03_merge_historical_data 입력 (기간 경계 5영업일은 두 파일에 중복 기록)
+- stock_{kr,us}_2010_2025_with_adj.csv, economy_{fred,ecos}_2010_2025.csv
+  → 04 백필 / 09 정합성 점검 입력
+- 종목 단위로 나눠 쓰기 때문에 x100(약 1천만 행, 디스크 약 2GB)도 메모리 사용이 일정
+- 같은 배율 + 같은 생성기 버전이면 기존 파일 재사용 (manifest.json)
+
+사용법:
+    python benchmarks/synthetic_data.py --scale 10
+    from synthetic_data import ensure_dataset
+    manifest = ensure_dataset(10)   # {'dir', 'rows': {...}, ...}
+
+Created: 2026-10-18
+"""
+
+import argparse
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+GENERATOR_VERSION = 1
+
+DATA_ROOT = Path(__file__).resolve().parent / ".data"
+
+START_DATE = "2010-01-01"
+END_DATE = "2025-12-31"
+PERIODS = (("2010_2014", "2010-01-01", "2014-12-31"),
+           ("2015_2019", "2015-01-01", "2019-12-31"),
+           ("2020_2025", "2020-01-01", "2025-12-31"))
+OVERLAP_DAYS = 5  # 기간 경계 중복 행 (병합 시 중복 제거 대상)
+
+# x1 기준 규모
+KR_TICKERS = 10
+US_TICKERS = 14
+FRED_DAILY = 4
+FRED_MONTHLY = 10
+ECOS_MONTHLY = 2
+ECOS_QUARTERLY = 1
+
+TICKERS_PER_CHUNK = 50
+
+
+def _price_frame(tickers: list, names: list, dates: pd.DatetimeIndex, seed: int) -> pd.DataFrame:
+    """종목 × 날짜 일봉 (로그 정규 랜덤워크)"""
+    rng = np.random.default_rng(seed)
+    n_days, n_tickers = len(dates), len(tickers)
+    base = rng.uniform(10, 1000, n_tickers)
+    returns = rng.normal(0, 0.015, (n_tickers, n_days))
+    close = base[:, None] * np.exp(np.cumsum(returns, axis=1))
+    open_ = close * (1 + rng.normal(0, 0.005, close.shape))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, close.shape))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, close.shape))
+    volume = rng.integers(10_000, 10_000_000, close.shape)
+
+    return pd.DataFrame({
+        "date": np.tile(dates.strftime("%Y-%m-%d").to_numpy(), n_tickers),
+        "name": np.repeat(names, n_days),
+        "ticker": np.repeat(tickers, n_days),
+        "open": open_.ravel().round(4),
+        "high": high.ravel().round(4),
+        "low": low.ravel().round(4),
+        "close": close.ravel().round(4),
+        "adj_close": (close * 0.98).ravel().round(4),
+        "volume": volume.ravel(),
+    })
+
+
+def _economy_frame(series: list, dates_by_series: dict, seed: int) -> pd.DataFrame:
+    """지표별 시계열 (일부 값은 결측)"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for series_id, indicator in series:
+        dates = dates_by_series[series_id]
+        values = rng.uniform(50, 500) * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+        values = values.round(3).astype(object)
+        values[rng.random(len(dates)) < 0.01] = ""  # 결측 (FRED '.' 대응)
+        frames.append(pd.DataFrame({
+            "date": dates.strftime("%Y-%m-%d"),
+            "indicator": indicator,
+            "value": values,
+            "series_id": series_id,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _append(df: pd.DataFrame, path: Path, columns: list):
+    header = not path.exists()
+    df.to_csv(path, mode="a", header=header, index=False, columns=columns,
+              encoding="utf-8-sig" if header else "utf-8")
+
+
+def _write_periods(df: pd.DataFrame, archive_dir: Path, prefix: str, columns: list) -> int:
+    """기간별 archive 파일에 나눠 쓰기 (경계 OVERLAP_DAYS 영업일은 다음 기간 파일에도 기록)"""
+    written = 0
+    for i, (period, start, end) in enumerate(PERIODS):
+        lower = pd.Timestamp(start)
+        if i > 0:
+            lower -= pd.offsets.BDay(OVERLAP_DAYS)
+        mask = (df["date"] >= lower.strftime("%Y-%m-%d")) & (df["date"] <= end)
+        part = df[mask]
+        _append(part, archive_dir / f"{prefix}_{period}_v3.csv", columns)
+        written += len(part)
+    return written
+
+
+STOCK_ARCHIVE_COLUMNS = ["date", "name", "ticker", "open", "high", "low", "close", "volume"]
+STOCK_MERGED_COLUMNS = ["date", "name", "ticker", "open", "high", "low", "close", "adj_close", "volume"]
+ECONOMY_COLUMNS = ["date", "indicator", "value", "series_id"]
+
+
+def generate(scale: int, out_dir: Path) -> dict:
+    """배율 scale 데이터셋 생성 (out_dir은 비워진 상태에서 다시 만든다)"""
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    archive_dir = out_dir / "archive"
+    archive_dir.mkdir(parents=True)
+
+    bdays = pd.bdate_range(START_DATE, END_DATE)
+    months = pd.date_range(START_DATE, END_DATE, freq="MS")
+    quarters = pd.date_range(START_DATE, END_DATE, freq="QS")
+    rows = {"archive": 0, "stock_kr": 0, "stock_us": 0, "economy_fred": 0, "economy_ecos": 0}
+
+    markets = (
+        ("stock_kr", KR_TICKERS * scale, lambda i: f"{900000 + i:06d}.KS", lambda i: f"KR종목{i:05d}"),
+        ("stock_us", US_TICKERS * scale, lambda i: f"US{i:05d}", lambda i: f"US Stock {i:05d}"),
+    )
+    for m, (prefix, count, ticker_of, name_of) in enumerate(markets):
+        merged_path = out_dir / f"{prefix}_2010_2025_with_adj.csv"
+        for chunk_start in range(0, count, TICKERS_PER_CHUNK):
+            ids = range(chunk_start, min(count, chunk_start + TICKERS_PER_CHUNK))
+            df = _price_frame([ticker_of(i) for i in ids], [name_of(i) for i in ids],
+                              bdays, seed=m * 1_000_003 + chunk_start)
+            rows["archive"] += _write_periods(df, archive_dir, prefix, STOCK_ARCHIVE_COLUMNS)
+            _append(df, merged_path, STOCK_MERGED_COLUMNS)
+            rows[prefix] += len(df)
+
+    fred_series = [(f"FREDD{i:04d}", f"미국 일간지표 {i:04d}") for i in range(FRED_DAILY * scale)]
+    fred_series += [(f"FREDM{i:04d}", f"미국 월간지표 {i:04d}") for i in range(FRED_MONTHLY * scale)]
+    fred_dates = {sid: (bdays if sid.startswith("FREDD") else months) for sid, _ in fred_series}
+
+    ecos_series = [(f"901Y{i:03d}_0", f"한국 월간지표 {i:04d}") for i in range(ECOS_MONTHLY * scale)]
+    ecos_series += [(f"200Y{i:03d}_", f"한국 분기지표 {i:04d}") for i in range(ECOS_QUARTERLY * scale)]
+    ecos_dates = {sid: (months if sid.startswith("901Y") else quarters) for sid, _ in ecos_series}
+
+    for k, (prefix, series, dates) in enumerate((("economy_fred", fred_series, fred_dates),
+                                                 ("economy_ecos", ecos_series, ecos_dates))):
+        merged_path = out_dir / f"{prefix}_2010_2025.csv"
+        for chunk_start in range(0, len(series), TICKERS_PER_CHUNK):
+            chunk = series[chunk_start:chunk_start + TICKERS_PER_CHUNK]
+            df = _economy_frame(chunk, dates, seed=(k + 2) * 1_000_003 + chunk_start)
+            rows["archive"] += _write_periods(df, archive_dir, prefix, ECONOMY_COLUMNS)
+            _append(df, merged_path, ECONOMY_COLUMNS)
+            rows[prefix] += len(df)
+
+    rows["merged_total"] = rows["stock_kr"] + rows["stock_us"] + rows["economy_fred"] + rows["economy_ecos"]
+    manifest = {
+        "version": GENERATOR_VERSION,
+        "scale": scale,
+        "dir": out_dir.name,  # 데이터 루트 기준 상대 경로 (저장소 이동/다른 체크아웃에서도 유효)
+        "rows": rows,
+        "tickers": {"kr": KR_TICKERS * scale, "us": US_TICKERS * scale},
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return {**manifest, "dir": str(out_dir)}
+
+
+def ensure_dataset(scale: int, root: Path = DATA_ROOT) -> dict:
+    """배율 scale 데이터셋 반환 (없거나 생성기 버전이 다르면 생성)"""
+    out_dir = Path(root) / f"x{scale}"
+    manifest_path = out_dir / "manifest.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("version") == GENERATOR_VERSION:
+            # 저장된 dir은 쓰지 않고 현재 위치 기준으로 다시 계산
+            return {**manifest, "dir": str(out_dir)}
+    print(f"  합성 데이터 생성: x{scale} → {out_dir}")
+    return generate(scale, out_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1], help="배율 (예: 1 10 100)")
+    parser.add_argument("--force", action="store_true", help="기존 데이터가 있어도 다시 생성")
+    args = parser.parse_args()
+
+    for scale in args.scale:
+        if args.force:
+            shutil.rmtree(DATA_ROOT / f"x{scale}", ignore_errors=True)
+        manifest = ensure_dataset(scale)
+        print(f"x{scale}: {manifest['rows']} ({os.path.relpath(manifest['dir'])})")